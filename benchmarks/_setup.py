@@ -0,0 +1,25 @@
+import os
+import time
+
+import django
+
+
+def setup_django(settings_module: str = 'config.settings') -> None:
+    """
+    Configures Django for a standalone benchmark run.
+    Expects the same environment (SECRET, etc.) as manage.py.
+    """
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', settings_module)
+    django.setup()
+
+
+def best_of(fn, repeat: int = 5) -> float:
+    """
+    Returns the fastest wall-clock time of `repeat` calls to `fn`, in seconds.
+    """
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
@@ -0,0 +1,111 @@
+"""
+Measures contact creates per second and latency at several concurrencies, with and without group commit.
+
+Each client thread calls ContactService.create_new_contact with fresh
+names against a throwaway SQLite file (so every commit pays for its
+fsync), first with one transaction per create, then with
+CONTACT_GROUP_COMMIT coalescing concurrent creates. Failed creates
+(e.g. "database is locked" after the busy timeout) are counted separately.
+
+Usage:
+    python -m benchmarks.group_commit [--clients 1 4 16 64] [--seconds 3] [--window 0.002]
+"""
+import argparse
+import itertools
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+from benchmarks._setup import setup_django
+
+
+def run(create, clients: int, seconds: float) -> tuple[float, float, float, int]:
+    """
+    Calls `create(i)` from `clients` threads for `seconds`.
+
+    Returns:
+        tuple: creates/s, p50 and p99 latency in ms, and the number of failed creates.
+    """
+    from django.db import connection
+
+    counter = itertools.count()
+    latencies: list[float] = []
+    failures = [0]
+    stop = time.perf_counter() + seconds
+
+    def loop():
+        mine = []
+        try:
+            while time.perf_counter() < stop:
+                t0 = time.perf_counter()
+                try:
+                    create(next(counter))
+                except Exception:
+                    failures[0] += 1
+                    continue
+                mine.append(time.perf_counter() - t0)
+        finally:
+            connection.close()
+        latencies.extend(mine)
+
+    threads = [threading.Thread(target=loop) for _ in range(clients)]
+    start = time.perf_counter()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    elapsed = time.perf_counter() - start
+    latencies.sort()
+
+    def pct(p):
+        return latencies[min(len(latencies) - 1, int(len(latencies) * p))] * 1e3 if latencies else 0.0
+
+    return len(latencies) / elapsed, pct(0.50), pct(0.99), failures[0]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--clients', type=int, nargs='+', default=[1, 4, 16, 64])
+    parser.add_argument('--seconds', type=float, default=3.0)
+    parser.add_argument('--window', type=float, default=None,
+                        help="GROUP_COMMIT['WINDOW'] in seconds (default: the setting).")
+    args = parser.parse_args()
+
+    setup_django()
+
+    from django.conf import settings
+    from django.core.management import call_command
+    from phonebook.models import Contact
+    from phonebook.services import ContactService
+
+    workdir = tempfile.TemporaryDirectory()
+    settings.DATABASES['default']['NAME'] = Path(workdir.name) / 'bench.sqlite3'
+    settings.CONTACT_SHARDS = 0
+    settings.CONTACT_INDEX_ENABLED = False
+    if args.window is not None:
+        settings.GROUP_COMMIT = {**settings.GROUP_COMMIT, 'WINDOW': args.window}
+    call_command('migrate', verbosity=0)
+
+    service = ContactService()
+    run_id = itertools.count()
+
+    print(f"group commit window: {settings.GROUP_COMMIT['WINDOW'] * 1e3:.1f} ms, "
+          f"max batch: {settings.GROUP_COMMIT['MAX_BATCH']}")
+    for clients in args.clients:
+        for enabled in (False, True):
+            settings.CONTACT_GROUP_COMMIT = enabled
+            prefix = f'Bench {next(run_id)}'
+            rate, p50, p99, failed = run(
+                lambda i: service.create_new_contact(f'{prefix} {i}', f'555-{i:07d}-{prefix[6:]}'),
+                clients, args.seconds)
+            label = 'group commit' if enabled else 'per create'
+            print(f"  {clients:>3} clients  {label:<12} {rate:8.0f} creates/s  "
+                  f"p50 {p50:7.2f} ms  p99 {p99:7.2f} ms  failed {failed}")
+        Contact.objects.all().delete()
+
+    workdir.cleanup()
+
+
+if __name__ == '__main__':
+    main()
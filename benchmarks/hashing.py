@@ -0,0 +1,65 @@
+"""
+Measures signup (hash) and login (verify) throughput through the
+password hashing pool at several PBKDF2 cost levels.
+
+Usage:
+    python -m benchmarks.hashing [--iterations 100000 300000 600000] [--workers 2] [--seconds 3]
+"""
+import argparse
+import threading
+import time
+
+from benchmarks._setup import setup_django
+
+
+def throughput(fn, clients: int, seconds: float) -> float:
+    """
+    Calls `fn` from `clients` threads for `seconds` and returns calls per second.
+    """
+    done = [0] * clients
+    stop = time.perf_counter() + seconds
+
+    def loop(i):
+        while time.perf_counter() < stop:
+            fn()
+            done[i] += 1
+
+    threads = [threading.Thread(target=loop, args=(i,)) for i in range(clients)]
+    start = time.perf_counter()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    return sum(done) / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--iterations', type=int, nargs='+', default=[100_000, 300_000, 600_000])
+    parser.add_argument('--workers', type=int, default=2)
+    parser.add_argument('--clients', type=int, default=8,
+                        help="Concurrent request threads submitting to the pool.")
+    parser.add_argument('--seconds', type=float, default=3.0)
+    args = parser.parse_args()
+
+    setup_django()
+
+    from django.conf import settings
+    from phonebook.services.hashing_service import PasswordHashingPool
+
+    pool = PasswordHashingPool(workers=args.workers, max_pending=args.clients, queue_timeout=60)
+    print(f"hasher: {settings.PASSWORD_HASHER}, pool workers: {args.workers}, clients: {args.clients}")
+
+    for iterations in args.iterations:
+        settings.PASSWORD_HASH_ITERATIONS = iterations
+        encoded = pool.make_password('BenchPassword!1')
+
+        signups = throughput(lambda: pool.make_password('BenchPassword!1'), args.clients, args.seconds)
+        logins = throughput(lambda: pool.check_password('BenchPassword!1', encoded), args.clients, args.seconds)
+        print(f"  {iterations:>9} iterations  {signups:8.1f} signups/s  {logins:8.1f} logins/s")
+
+    pool.shutdown()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,117 @@
+"""
+Measures caller-ID lookups per second and latency percentiles.
+
+Runs against a throwaway in-memory database seeded with --contacts rows:
+hot hits from the per-worker cache, cold hits and misses through the
+indexed query, the full GET /phone-book/lookup/ view, and batch
+resolution (numbers resolved/s) through LookupService.lookup_many.
+
+Usage:
+    python -m benchmarks.lookup [--contacts 100000] [--lookups 20000] [--batch-size 5000]
+"""
+import argparse
+import random
+import time
+
+from benchmarks._setup import setup_django
+
+
+def measure(label: str, fn, numbers: list[str]) -> None:
+    latencies = []
+    start = time.perf_counter()
+    for number in numbers:
+        t0 = time.perf_counter()
+        fn(number)
+        latencies.append(time.perf_counter() - t0)
+    elapsed = time.perf_counter() - start
+    latencies.sort()
+
+    def pct(p):
+        return latencies[min(len(latencies) - 1, int(len(latencies) * p))] * 1e6
+
+    print(f"  {label:<22} {len(numbers) / elapsed:10.0f} lookups/s  "
+          f"p50 {pct(0.50):7.1f} µs  p99 {pct(0.99):7.1f} µs")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--contacts', type=int, default=100_000)
+    parser.add_argument('--lookups', type=int, default=20_000)
+    parser.add_argument('--hot-set', type=int, default=1000,
+                        help="Distinct numbers in the hot (repeat caller) workload.")
+    parser.add_argument('--batch-size', type=int, default=5000,
+                        help="Numbers per lookup_many call in the batch workload.")
+    args = parser.parse_args()
+
+    setup_django()
+
+    from django.conf import settings
+    from django.contrib.auth import get_user_model
+    from django.db import connection
+    from rest_framework.test import APIRequestFactory, force_authenticate
+    from phonebook.api.lookup.views import ContactLookupAPI
+    from phonebook.api.utilities import normalize_phone_number
+    from phonebook.models import Contact, PhoneNumber
+    from phonebook.services import LookupService
+    from phonebook.services.lookup_service import hot_number_cache
+
+    connection.creation.create_test_db(verbosity=0)
+    # single process: the per-worker cache sees every write
+    settings.LOOKUP_CACHE = {**settings.LOOKUP_CACHE, 'ENABLED': True}
+
+    def number(i):
+        return f'({200 + i // 1_000_000}) {i // 10_000 % 100:03d}-{i % 10_000:04d}'
+
+    contacts = Contact.objects.bulk_create(
+        Contact(full_name=f'Contact Person{i:07d}') for i in range(args.contacts))
+    PhoneNumber.objects.bulk_create(
+        PhoneNumber(contact=c, phone_number=number(i), normalized_number=normalize_phone_number(number(i)))
+        for i, c in enumerate(contacts))
+    print(f"{args.contacts} contacts seeded")
+
+    service = LookupService()
+    rng = random.Random(42)
+    hot = [number(rng.randrange(args.contacts)) for _ in range(args.hot_set)]
+    hot_workload = [rng.choice(hot) for _ in range(args.lookups)]
+    cold_hits = [number(rng.randrange(args.contacts)) for _ in range(args.lookups)]
+    misses = [f'(999) {i // 10_000 % 1000:03d}-{i % 10_000:04d}' for i in range(args.lookups)]
+
+    for n in hot:
+        service.lookup(n)
+    measure('service, hot cache', service.lookup, hot_workload)
+
+    def uncached(n):
+        hot_number_cache.clear()
+        return service.lookup(n)
+
+    measure('service, indexed hit', uncached, cold_hits)
+    measure('service, indexed miss', uncached, misses)
+
+    factory = APIRequestFactory()
+    # the per-user budget would reject a single benchmark client
+    view = ContactLookupAPI.as_view(throttle_classes=[])
+    user = get_user_model()(username='bench')
+    user.group_names = ('reader',)  # skip the per-request group query, like stateless JWT auth
+
+    def through_view(n):
+        request = factory.get('/phone-book/lookup/', {'phone_number': n})
+        force_authenticate(request, user=user)
+        response = view(request)
+        assert response.status_code == 200, response.status_code
+        return response
+
+    measure('view, hot cache', through_view, hot_workload)
+
+    hot_number_cache.clear()
+    batch = cold_hits[:args.lookups // 2] + misses[:args.lookups // 2]
+    rng.shuffle(batch)
+    start = time.perf_counter()
+    for i in range(0, len(batch), args.batch_size):
+        service.lookup_many(batch[i:i + args.batch_size])
+    elapsed = time.perf_counter() - start
+    print(f"  {'service, batch':<22} {len(batch) / elapsed:10.0f} numbers/s  "
+          f"({args.batch_size} per call, half misses)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,61 @@
+"""
+Compares per-request overhead of the default and API-only settings profiles.
+
+Each profile runs in its own interpreter so INSTALLED_APPS and MIDDLEWARE
+are loaded exactly as a worker would load them. The request is an
+unauthenticated GET, rejected with 401 before any query, so the timing is
+the middleware chain, URL resolution and DRF dispatch.
+
+Usage:
+    python -m benchmarks.middleware [--requests 5000] [--path /phone-book/list/]
+"""
+import argparse
+import os
+import subprocess
+import sys
+
+from benchmarks._setup import best_of, setup_django
+
+PROFILES = ('config.settings', 'config.settings_api')
+
+
+def run_profile(args) -> None:
+    setup_django(args.profile)
+
+    from django.conf import settings
+    from django.test import Client
+
+    settings.ALLOWED_HOSTS = ['testserver']
+    client = Client()
+    status = client.get(args.path).status_code
+
+    elapsed = best_of(lambda: [client.get(args.path) for _ in range(args.requests)], args.repeat)
+    print(f"{args.profile:<22} {len(settings.MIDDLEWARE):>2} middleware  "
+          f"{len(settings.INSTALLED_APPS):>2} apps  {elapsed / args.requests * 1e6:8.1f} µs/request  "
+          f"(HTTP {status})")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--requests', type=int, default=5000)
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--path', default='/phone-book/list/')
+    parser.add_argument('--profile', choices=PROFILES,
+                        help="Run a single profile in this process.")
+    args = parser.parse_args()
+
+    if args.profile:
+        run_profile(args)
+        return
+
+    for profile in PROFILES:
+        env = {**os.environ, 'DJANGO_SETTINGS_MODULE': profile}
+        subprocess.run(
+            [sys.executable, '-m', 'benchmarks.middleware', '--profile', profile,
+             '--requests', str(args.requests), '--repeat', str(args.repeat), '--path', args.path],
+            env=env, check=True,
+        )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,48 @@
+"""
+Compares API renderers on contact list payloads.
+
+Usage:
+    python -m benchmarks.renderers [--rows 10000 100000] [--repeat 5]
+"""
+import argparse
+
+from benchmarks._setup import best_of, setup_django
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--rows', type=int, nargs='+', default=[10_000, 100_000])
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    setup_django()
+
+    from rest_framework.renderers import JSONRenderer
+    from phonebook.api.contacts.serializers import ContactListOutputSerializer
+    from phonebook.api.formats import FastJSONRenderer, MessagePackRenderer
+    from phonebook.api.formats.renderers import msgpack, orjson
+
+    renderers = [('drf-json', JSONRenderer()), ('fast-json', FastJSONRenderer())]
+    if msgpack is not None:
+        renderers.append(('msgpack', MessagePackRenderer()))
+    print(f"orjson: {'yes' if orjson else 'no'}, msgpack: {'yes' if msgpack else 'no'}")
+
+    for rows in args.rows:
+        contacts = [
+            {'name': f'Contact Number{i}', 'phone_number': f'670-{i // 10000 % 1000:03d}-{i % 10000:04d}'}
+            for i in range(rows)
+        ]
+        data = ContactListOutputSerializer(contacts, many=True).data
+
+        print(f"\n{rows} rows")
+        baseline = None
+        for name, renderer in renderers:
+            elapsed = best_of(lambda: renderer.render(data), args.repeat)
+            size = len(renderer.render(data))
+            baseline = baseline or elapsed
+            print(f"  {name:<10} {elapsed * 1000:8.2f} ms  {size / 1024:9.1f} KiB  "
+                  f"x{baseline / elapsed:.2f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,35 @@
+from django.contrib.auth import get_user_model
+from django.contrib.auth.backends import ModelBackend
+
+from phonebook.services.hashing_service import get_hashing_pool
+
+
+class PooledModelBackend(ModelBackend):
+    """
+    ModelBackend that verifies passwords on the hashing pool instead
+    of the request thread. Database access stays on the request thread.
+    """
+
+    def authenticate(self, request, username=None, password=None, **kwargs):
+        UserModel = get_user_model()
+        if username is None:
+            username = kwargs.get(UserModel.USERNAME_FIELD)
+        if username is None or password is None:
+            return None
+
+        pool = get_hashing_pool()
+        try:
+            user = UserModel._default_manager.get_by_natural_key(username)
+        except UserModel.DoesNotExist:
+            # hash anyway so unknown usernames take as long as wrong passwords
+            pool.make_password(password)
+            return None
+
+        ok, needs_update = pool.check_password(password, user.password)
+        if not ok or not self.user_can_authenticate(user):
+            return None
+
+        if needs_update:
+            user.password = pool.make_password(password)
+            user.save(update_fields=['password'])
+        return user
@@ -0,0 +1,14 @@
+from django.conf import settings
+from django.contrib.auth.hashers import PBKDF2PasswordHasher
+
+
+class ConfigurablePBKDF2PasswordHasher(PBKDF2PasswordHasher):
+    """
+    PBKDF2-SHA256 hasher whose iteration count comes from the
+    PASSWORD_HASH_ITERATIONS setting. Existing hashes with a different
+    count are re-hashed on the next successful login.
+    """
+
+    @property
+    def iterations(self) -> int:  # type: ignore[override]
+        return getattr(settings, 'PASSWORD_HASH_ITERATIONS', PBKDF2PasswordHasher.iterations)
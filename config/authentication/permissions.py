@@ -2,7 +2,13 @@ from rest_framework import permissions
 
 
 def _in_group(user, name: str):
-    return user.is_authenticated and user.groups.filter(name=name).exists()
+    if not user.is_authenticated:
+        return False
+    # stateless users carry their group names from the token claims
+    group_names = getattr(user, 'group_names', None)
+    if group_names is not None:
+        return name in group_names
+    return user.groups.filter(name=name).exists()
 
 
 class IsWriter(permissions.BasePermission):
@@ -0,0 +1,25 @@
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import InvalidToken
+from rest_framework_simplejwt.settings import api_settings
+
+from phonebook.services import TokenRevocationService
+
+
+class RevocationCheckMixin:
+    """
+    Rejects tokens whose `jti` is on the revocation denylist.
+    """
+
+    def get_validated_token(self, raw_token):
+        validated_token = super().get_validated_token(raw_token)  # type: ignore[misc]
+        jti = validated_token.get(api_settings.JTI_CLAIM)
+        if jti and TokenRevocationService().is_revoked(jti):
+            raise InvalidToken(_("Token has been revoked"))
+        return validated_token
+
+
+class RevocableJWTAuthentication(RevocationCheckMixin, JWTAuthentication):
+    """
+    simplejwt's database-backed authentication plus the revocation check.
+    """
@@ -0,0 +1,54 @@
+from typing import Any
+from django.contrib.auth import get_user_model
+from rest_framework.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.serializers import (
+    TokenObtainPairSerializer,
+    TokenRefreshSerializer,
+)
+from rest_framework_simplejwt.exceptions import InvalidToken
+from rest_framework_simplejwt.settings import api_settings
+
+from phonebook.services import TokenRevocationService
+
+from .tokens import PhonebookRefreshToken, user_claims
+
+
+class PhonebookTokenObtainPairSerializer(TokenObtainPairSerializer):
+    token_class = PhonebookRefreshToken
+
+
+class PhonebookTokenRefreshSerializer(TokenRefreshSerializer):
+    """
+    Refresh serializer that re-reads the user's claims, so group changes
+    reach new access tokens at the next refresh.
+    """
+
+    token_class = PhonebookRefreshToken
+
+    def validate(self, attrs: dict[str, Any]) -> dict[str, str]:
+        refresh = self.token_class(attrs['refresh'])
+        jti = refresh.payload.get(api_settings.JTI_CLAIM)
+        if jti and TokenRevocationService().is_revoked(jti):
+            raise InvalidToken("Token has been revoked")
+
+        User = get_user_model()
+        user_id = refresh.payload.get(api_settings.USER_ID_CLAIM, None)
+        user = User.objects.filter(**{api_settings.USER_ID_FIELD: user_id}).first()
+        if user is None or not api_settings.USER_AUTHENTICATION_RULE(user):
+            raise AuthenticationFailed(
+                self.error_messages['no_active_account'],
+                'no_active_account',
+            )
+
+        for claim, value in user_claims(user).items():
+            refresh[claim] = value
+
+        data = {'access': str(refresh.access_token)}
+
+        if api_settings.ROTATE_REFRESH_TOKENS:
+            refresh.set_jti()
+            refresh.set_exp()
+            refresh.set_iat()
+            data['refresh'] = str(refresh)
+
+        return data
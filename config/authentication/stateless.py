@@ -0,0 +1,95 @@
+import threading
+import time
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.utils.functional import cached_property
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+from rest_framework_simplejwt.models import TokenUser
+from rest_framework_simplejwt.settings import api_settings
+
+from .revocation import RevocationCheckMixin
+from .tokens import GROUPS_CLAIM, user_claims
+
+
+class ClaimsUser(TokenUser):
+    """
+    Lightweight user rebuilt from token claims (id, username,
+    staff/superuser flags and group names) without touching the database.
+    """
+
+    @cached_property
+    def group_names(self) -> frozenset[str]:
+        return frozenset(self.token.get(GROUPS_CLAIM, ()))
+
+
+class UserClaimsCache:
+    """
+    Short-TTL, in-process cache of user claims keyed by user id.
+    """
+
+    def __init__(self, max_entries: int = 10_000):
+        self.max_entries = max_entries
+        self._entries: dict = {}
+        self._lock = threading.Lock()
+
+    def get(self, user_id):
+        entry = self._entries.get(user_id)
+        if entry is None or entry[0] < time.monotonic():
+            return None
+        return entry[1]
+
+    def set(self, user_id, claims: dict, ttl: float) -> None:
+        with self._lock:
+            if len(self._entries) >= self.max_entries:
+                self._entries.clear()
+            self._entries[user_id] = (time.monotonic() + ttl, claims)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+user_claims_cache = UserClaimsCache()
+
+
+class StatelessJWTAuthentication(RevocationCheckMixin, JWTAuthentication):
+    """
+    JWT authentication that builds the user from signed token claims.
+
+    Tokens issued by this project carry the claims, so no query is made.
+    Older tokens without them fall back to one lookup, cached in-process
+    for JWT_USER_CACHE_TTL seconds (0 disables the cache).
+
+    Trade-off: deactivation and group changes only take effect when the
+    access token is refreshed (or the cache entry expires).
+    """
+
+    def get_user(self, validated_token):
+        try:
+            user_id = validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError:
+            raise InvalidToken(_("Token contained no recognizable user identification"))
+
+        if GROUPS_CLAIM in validated_token:
+            return ClaimsUser(validated_token)
+        return ClaimsUser(self._load_claims(user_id))
+
+    def _load_claims(self, user_id) -> dict:
+        ttl = getattr(settings, 'JWT_USER_CACHE_TTL', 0)
+        claims = user_claims_cache.get(user_id) if ttl else None
+        if claims is not None:
+            return claims
+
+        User = get_user_model()
+        user = User.objects.filter(**{api_settings.USER_ID_FIELD: user_id}).first()
+        if user is None:
+            raise AuthenticationFailed(_("User not found"), code="user_not_found")
+        if not api_settings.USER_AUTHENTICATION_RULE(user):
+            raise AuthenticationFailed(_("User is inactive"), code="user_inactive")
+
+        claims = {api_settings.USER_ID_CLAIM: user_id, **user_claims(user)}
+        if ttl:
+            user_claims_cache.set(user_id, claims, ttl)
+        return claims
@@ -0,0 +1,36 @@
+from rest_framework_simplejwt.tokens import RefreshToken
+
+GROUPS_CLAIM = 'groups'
+
+
+def user_claims(user, groups: list[str] | None = None) -> dict:
+    """
+    Builds the identity claims carried by phone book tokens, so that
+    stateless authentication can rebuild the user without a query.
+
+    Args:
+        user: The Django auth user.
+        groups (list[str], optional): The user's group names, if already known.
+    """
+    if groups is None:
+        groups = list(user.groups.values_list('name', flat=True))
+    return {
+        'username': user.get_username(),
+        'is_staff': user.is_staff,
+        'is_superuser': user.is_superuser,
+        GROUPS_CLAIM: sorted(groups),
+    }
+
+
+class PhonebookRefreshToken(RefreshToken):
+    """
+    Refresh token stamped with the user's identity claims.
+    Access tokens derived from it inherit the claims.
+    """
+
+    @classmethod
+    def for_user(cls, user, groups: list[str] | None = None):
+        token = super().for_user(user)
+        for claim, value in user_claims(user, groups).items():
+            token[claim] = value
+        return token
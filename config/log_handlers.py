@@ -0,0 +1,45 @@
+"""
+Logging handlers and formatter factories referenced by LOGGING.
+
+Nothing here touches the filesystem or builds renderers when settings are
+imported: dictConfig calls the factories during django.setup(), and the
+file handler only creates its directory and opens the file on first write.
+"""
+from logging.handlers import RotatingFileHandler
+from pathlib import Path
+
+import structlog
+
+FOREIGN_PRE_CHAIN = [
+    structlog.processors.TimeStamper(fmt="iso", utc=True),
+    structlog.stdlib.add_log_level,
+    structlog.stdlib.add_logger_name,
+]
+
+
+def console_formatter() -> structlog.stdlib.ProcessorFormatter:
+    return structlog.stdlib.ProcessorFormatter(
+        processor=structlog.dev.ConsoleRenderer(colors=True),
+        foreign_pre_chain=FOREIGN_PRE_CHAIN,
+    )
+
+
+def json_formatter() -> structlog.stdlib.ProcessorFormatter:
+    return structlog.stdlib.ProcessorFormatter(
+        processor=structlog.processors.JSONRenderer(),
+        foreign_pre_chain=FOREIGN_PRE_CHAIN,
+    )
+
+
+class LazyRotatingFileHandler(RotatingFileHandler):
+    """
+    RotatingFileHandler that defers opening the file (and creating its
+    directory) until the first record is emitted.
+    """
+
+    def __init__(self, filename, mode='a', maxBytes=0, backupCount=0, encoding=None, delay=True, errors=None):
+        super().__init__(filename, mode, maxBytes, backupCount, encoding, delay, errors)
+
+    def _open(self):
+        Path(self.baseFilename).parent.mkdir(parents=True, exist_ok=True)
+        return super()._open()
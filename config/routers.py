@@ -0,0 +1,33 @@
+from phonebook.services.sharding import SHARDED_MODELS, is_shard_alias
+
+
+class ContactShardRouter:
+    """
+    Keeps contact shards (CONTACT_SHARDS) limited to Contact/PhoneNumber
+    and the PhoneNumberClaims that keep numbers unique across them.
+
+    ContactService picks the shard explicitly with .using(); the router
+    keeps related lookups on the instance's shard and stops every other
+    app, data migration and post-migrate hook from touching shard databases.
+    """
+
+    def _is_sharded(self, model) -> bool:
+        return model._meta.app_label == 'phonebook' and model._meta.model_name in SHARDED_MODELS
+
+    def db_for_read(self, model, **hints):
+        instance = hints.get('instance')
+        if instance is not None and self._is_sharded(model) and instance._state.db:
+            return instance._state.db
+        return None
+
+    db_for_write = db_for_read
+
+    def allow_relation(self, obj1, obj2, **hints):
+        if self._is_sharded(type(obj1)) and self._is_sharded(type(obj2)):
+            return obj1._state.db == obj2._state.db
+        return None
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        if is_shard_alias(db):
+            return app_label == 'phonebook' and model_name in SHARDED_MODELS
+        return None
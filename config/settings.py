@@ -12,6 +12,8 @@ https://docs.djangoproject.com/en/4.2/ref/settings/
 
 import environ
 import structlog
+from django.core.exceptions import ImproperlyConfigured
+from importlib.util import find_spec
 from pathlib import Path
 from datetime import timedelta
 
@@ -22,6 +24,28 @@ BASE_DIR = Path(__file__).resolve().parent.parent
 env = environ.Env(
     DEBUG=(bool, False),
     LOG_LEVEL=(str, 'INFO'),
+    THROTTLE_STORE=(str, 'local'),
+    CONTACT_LIST_CACHE_TTL=(int, 0),
+    CONTACT_LIST_FAST_PATH=(bool, True),
+    LOOKUP_CACHE_ENABLED=(bool, False),
+    CONTACT_INDEX_ENABLED=(bool, False),
+    CONTACT_SNAPSHOT_PATH=(str, ''),
+    CONTACT_SHARDS=(int, 0),
+    CONTACT_SOFT_DELETE=(bool, False),
+    CONTACT_TOMBSTONE_RETENTION=(int, 86400),
+    CONTACT_GROUP_COMMIT=(bool, False),
+    EXPORT_DIR=(str, ''),
+    EXPORT_ARTIFACT_TTL=(int, 86400),
+    PASSWORD_HASHER=(str, 'pbkdf2_sha256'),
+    PASSWORD_HASH_ITERATIONS=(int, 600_000),
+    PASSWORD_HASHING_WORKERS=(int, 2),
+    JWT_AUTH_MODE=(str, 'database'),
+    JWT_USER_CACHE_TTL=(int, 30),
+    API_ONLY_MINIMAL_APPS=(bool, True),
+    ADMIN_ENABLED=(bool, True),
+    DB_CONN_MAX_AGE=(int, 0),
+    WARMUP_ON_BOOT=(str, 'off'),
+    WARMUP_PREFILL_CACHES=(bool, False),
 )
 environ.Env.read_env(str(BASE_DIR / '.env'))
 
@@ -54,6 +78,7 @@ INSTALLED_APPS = [
 MIDDLEWARE = [
     'django_structlog.middlewares.RequestMiddleware',
     'django.middleware.security.SecurityMiddleware',
+    'phonebook.api.middleware.CompressionMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
@@ -63,20 +88,83 @@ MIDDLEWARE = [
 ]
 
 REST_FRAMEWORK = {
+    'DEFAULT_RENDERER_CLASSES': [
+        'phonebook.api.formats.FastJSONRenderer',
+        'rest_framework.renderers.BrowsableAPIRenderer',
+    ],
+    'DEFAULT_PARSER_CLASSES': [
+        'phonebook.api.formats.FastJSONParser',
+        'rest_framework.parsers.FormParser',
+        'rest_framework.parsers.MultiPartParser',
+    ],
     'DEFAULT_AUTHENTICATION_CLASSES': [
-        'rest_framework_simplejwt.authentication.JWTAuthentication',
+        'config.authentication.revocation.RevocableJWTAuthentication',
     ],
     'DEFAULT_PERMISSION_CLASSES': [
         'rest_framework.permissions.IsAuthenticated'
+    ],
+    'EXCEPTION_HANDLER': 'phonebook.api.utilities.exception_handler.exception_handler',
+    # Token buckets per view `throttle_scope`; rates are '<scope>_user' / '<scope>_ip'
+    'DEFAULT_THROTTLE_CLASSES': [
+        'config.throttling.UserTokenBucketThrottle',
+        'config.throttling.IPTokenBucketThrottle',
+    ],
+    'DEFAULT_THROTTLE_RATES': {
+        'contacts_list_user': '120/min',
+        'contacts_list_ip': '600/min',
+        'contacts_write_user': '60/min',
+        'contacts_write_ip': '300/min',
+        'contacts_lookup_user': '1000/s',
+        'contacts_lookup_ip': '5000/s',
+        'contacts_lookup_batch_user': '60/min',
+        'contacts_lookup_batch_ip': '300/min',
+        'signup_ip': '10/min',
+        'jobs_user': '600/min',
+        'jobs_ip': '3000/min',
+        'exports_user': '60/min',
+        'exports_ip': '300/min',
+        # each report scans the whole book
+        'duplicates_user': '6/min',
+        'duplicates_ip': '30/min',
+    },
+}
+
+# 'stateless' rebuilds request.user from token claims instead of a per-request query
+JWT_AUTH_MODE = env('JWT_AUTH_MODE')
+if JWT_AUTH_MODE == 'stateless':
+    REST_FRAMEWORK['DEFAULT_AUTHENTICATION_CLASSES'] = [
+        'config.authentication.stateless.StatelessJWTAuthentication',
     ]
+# Seconds a user looked up for a token without claims stays cached; 0 disables
+JWT_USER_CACHE_TTL = env('JWT_USER_CACHE_TTL')
+
+# Revoked token ids are checked against a per-worker Bloom filter first
+TOKEN_REVOCATION = {
+    'CAPACITY': 100_000,
+    'ERROR_RATE': 0.001,
+    'REFRESH_INTERVAL': 1.0,
+    'REBUILD_INTERVAL': 3600.0,
 }
 
+# MessagePack is offered only when the optional `msgpack` package is installed
+if find_spec('msgpack') is not None:
+    REST_FRAMEWORK['DEFAULT_RENDERER_CLASSES'].append(
+        'phonebook.api.formats.MessagePackRenderer')
+    REST_FRAMEWORK['DEFAULT_PARSER_CLASSES'].append(
+        'phonebook.api.formats.MessagePackParser')
+
+# 'local' keeps buckets per worker process, 'cache' shares them through CACHES
+THROTTLE_STORE = env('THROTTLE_STORE')
+THROTTLE_CACHE_ALIAS = 'default'
+
 # Simple JWT Configuration
 SIMPLE_JWT = {
     'ACCESS_TOKEN_LIFETIME': timedelta(minutes=15),
     'REFRESH_TOKEN_LIFETIME': timedelta(days=1),
     'SIGNING_KEY': SECRET_KEY,
     'ALGORITHM': 'HS256',
+    'TOKEN_OBTAIN_SERIALIZER': 'config.authentication.serializers.PhonebookTokenObtainPairSerializer',
+    'TOKEN_REFRESH_SERIALIZER': 'config.authentication.serializers.PhonebookTokenRefreshSerializer',
 }
 
 ROOT_URLCONF = 'config.urls'
@@ -97,8 +185,24 @@ TEMPLATES = [
     },
 ]
 
+# The admin (and the messages framework only it uses) is optional; leaving it out trims worker boot
+ADMIN_ENABLED = env('ADMIN_ENABLED')
+if not ADMIN_ENABLED:
+    INSTALLED_APPS = [
+        app for app in INSTALLED_APPS
+        if app not in ('django.contrib.admin', 'django.contrib.messages')
+    ]
+    MIDDLEWARE.remove('django.contrib.messages.middleware.MessageMiddleware')
+    TEMPLATES[0]['OPTIONS']['context_processors'].remove(
+        'django.contrib.messages.context_processors.messages')
+
 WSGI_APPLICATION = 'config.wsgi.application'
 
+# Worker warm-up run by config.wsgi / config.asgi: 'off', 'blocking' or 'background'.
+# /phone-book/health/ready/ answers 503 until it finishes.
+WARMUP_ON_BOOT = env('WARMUP_ON_BOOT')
+WARMUP_PREFILL_CACHES = env('WARMUP_PREFILL_CACHES')
+
 
 # Database
 # https://docs.djangoproject.com/en/4.2/ref/settings/#databases
@@ -107,9 +211,97 @@ DATABASES = {
     'default': {
         'ENGINE': 'django.db.backends.sqlite3',
         'NAME': BASE_DIR / 'db.sqlite3',
+        # keep connections between requests so the one opened by warm-up is reused
+        'CONN_MAX_AGE': env('DB_CONN_MAX_AGE'),
+        'CONN_HEALTH_CHECKS': True,
     }
 }
 
+# Contacts hash-partitioned by name across N database files; 0 keeps them in 'default'.
+# Each shard is migrated separately: `migrate --database contacts_<i>`.
+CONTACT_SHARDS = env('CONTACT_SHARDS')
+for _shard in range(CONTACT_SHARDS):
+    DATABASES[f'contacts_{_shard}'] = {
+        **DATABASES['default'],
+        'NAME': BASE_DIR / f'contacts_{_shard}.sqlite3',
+    }
+
+DATABASE_ROUTERS = ['config.routers.ContactShardRouter']
+
+
+# Cache
+# https://docs.djangoproject.com/en/4.2/topics/cache/
+
+CACHES = {
+    'default': env.cache_url('CACHE_URL', default='locmemcache://'),
+}
+
+# Rendered contact list payloads are cached per write generation; 0 (the default) disables.
+# Set it only with a shared CACHE_URL: per-process memory misses other workers' writes
+CONTACT_LIST_CACHE_TTL = env('CONTACT_LIST_CACHE_TTL')
+CONTACT_CACHE_ALIAS = 'default'
+
+# Render list rows straight from values_list, skipping ContactListOutputSerializer
+CONTACT_LIST_FAST_PATH = env('CONTACT_LIST_FAST_PATH')
+
+# Per-worker in-memory index for name/number lookups (duplicate checks, deletes)
+CONTACT_INDEX_ENABLED = env('CONTACT_INDEX_ENABLED')
+if CONTACT_INDEX_ENABLED and CONTACT_SHARDS:
+    raise ImproperlyConfigured("CONTACT_INDEX_ENABLED does not support CONTACT_SHARDS.")
+
+# Deletes set a deleted_at tombstone (one UPDATE) instead of removing the rows;
+# purge_contact_tombstones hard-deletes tombstones older than the retention (seconds)
+CONTACT_SOFT_DELETE = env('CONTACT_SOFT_DELETE')
+CONTACT_TOMBSTONE_RETENTION = env('CONTACT_TOMBSTONE_RETENTION')
+
+# Concurrent contact creates in a worker share one transaction (one fsync) per
+# batch: a leader waits up to WINDOW seconds or for MAX_BATCH writes, then commits
+CONTACT_GROUP_COMMIT = env('CONTACT_GROUP_COMMIT')
+GROUP_COMMIT = {
+    'WINDOW': 0.002,
+    'MAX_BATCH': 64,
+}
+
+# Background jobs run by `manage.py run_worker` (see phonebook.services.job_service)
+JOB_QUEUE = {
+    'LEASE_SECONDS': 300,
+    'MAX_ATTEMPTS': 5,
+    'BACKOFF_BASE': 5.0,
+    'BACKOFF_MAX': 3600.0,
+    'POLL_INTERVAL': 1.0,
+    'PROGRESS_INTERVAL': 1.0,
+}
+
+# Export artifacts written by `export_contacts` jobs (POST /phone-book/exports/);
+# artifacts older than EXPORT_ARTIFACT_TTL seconds are removed by the next export
+EXPORT_DIR = env('EXPORT_DIR') or str(BASE_DIR / 'exports')
+EXPORT_ARTIFACT_TTL = env('EXPORT_ARTIFACT_TTL')
+
+# Per-worker hot-number cache in front of GET /phone-book/lookup/; off by default.
+# Enable it only with a shared CACHE_URL: per-process memory misses other workers' writes
+LOOKUP_CACHE = {
+    'ENABLED': env('LOOKUP_CACHE_ENABLED'),
+    'SIZE': 100_000,
+    'TTL': 60.0,
+    'NEGATIVE_TTL': 5.0,
+    'GENERATION_CHECK_INTERVAL': 1.0,
+}
+
+# Memory-mapped contact snapshot shared by every worker (see write_contact_snapshot); '' disables
+CONTACT_SNAPSHOT_PATH = env('CONTACT_SNAPSHOT_PATH')
+
+# Negotiated response compression; ENDPOINTS overrides are keyed by URL name
+RESPONSE_COMPRESSION = {
+    'MIN_SIZE': 1024,
+    'LEVELS': {'gzip': 6, 'br': 5, 'zstd': 3},
+    'ENDPOINTS': {
+        'contact-list': {
+            'MIN_SIZE': 512,
+            'LEVELS': {'gzip': 9, 'br': 9, 'zstd': 10},
+        },
+    },
+}
+
 
 # Password validation
 # https://docs.djangoproject.com/en/4.2/ref/settings/#auth-password-validators
@@ -130,6 +322,32 @@ AUTH_PASSWORD_VALIDATORS = [
 ]
 
 
+# Password hashing cost profile, set per environment.
+# The chosen hasher is preferred for new hashes; the rest still verify old ones.
+_PASSWORD_HASHERS = {
+    'pbkdf2_sha256': 'config.authentication.hashers.ConfigurablePBKDF2PasswordHasher',
+    'argon2': 'django.contrib.auth.hashers.Argon2PasswordHasher',
+    'bcrypt_sha256': 'django.contrib.auth.hashers.BCryptSHA256PasswordHasher',
+    'scrypt': 'django.contrib.auth.hashers.ScryptPasswordHasher',
+}
+PASSWORD_HASHER = env('PASSWORD_HASHER')
+PASSWORD_HASH_ITERATIONS = env('PASSWORD_HASH_ITERATIONS')  # pbkdf2_sha256 only
+PASSWORD_HASHERS = [_PASSWORD_HASHERS[PASSWORD_HASHER]] + [
+    path for name, path in _PASSWORD_HASHERS.items() if name != PASSWORD_HASHER
+] + ['django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher']
+
+# Hashing runs on a bounded thread pool; WORKERS=0 hashes on the request thread
+PASSWORD_HASHING_POOL = {
+    'WORKERS': env('PASSWORD_HASHING_WORKERS'),
+    'MAX_PENDING': 32,
+    'QUEUE_TIMEOUT': 2.0,
+}
+
+AUTHENTICATION_BACKENDS = [
+    'config.authentication.backends.PooledModelBackend',
+]
+
+
 # Internationalization
 # https://docs.djangoproject.com/en/4.2/topics/i18n/
 
@@ -152,9 +370,8 @@ STATIC_URL = 'static/'
 
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
-# Logging directory
+# Logging directory, created on the first write to the JSON log
 LOG_DIR = BASE_DIR / 'phonebook' / 'logging'
-LOG_DIR.mkdir(parents=True, exist_ok=True)
 
 # Logging configuration
 LOGGING = {
@@ -162,22 +379,10 @@ LOGGING = {
     "disable_existing_loggers": False,
     "formatters": {
         "console_formatter": {
-            "()": structlog.stdlib.ProcessorFormatter,
-            "processor": structlog.dev.ConsoleRenderer(colors=True),
-            "foreign_pre_chain": [
-                structlog.processors.TimeStamper(fmt="iso", utc=True),
-                structlog.stdlib.add_log_level,
-                structlog.stdlib.add_logger_name,
-            ],
+            "()": 'config.log_handlers.console_formatter',
         },
         'json_log': {
-            '()': structlog.stdlib.ProcessorFormatter,
-            'processor': structlog.processors.JSONRenderer(),
-            'foreign_pre_chain': [
-                structlog.processors.TimeStamper(fmt="iso", utc=True),
-                structlog.stdlib.add_log_level,
-                structlog.stdlib.add_logger_name,
-            ],
+            '()': 'config.log_handlers.json_formatter',
         }
     },
     "handlers": {
@@ -186,7 +391,7 @@ LOGGING = {
             "formatter": "console_formatter"
         },
         "json_log_file": {
-            "class": "logging.handlers.RotatingFileHandler",
+            "class": "config.log_handlers.LazyRotatingFileHandler",
             "formatter": "json_log",
             "filename": LOG_DIR / "log.json",
             "maxBytes": 20 * 1024 * 1024,  # 20 MB
@@ -0,0 +1,53 @@
+"""
+API-only deployment profile.
+
+Serves /phone-book/ through a trimmed middleware chain: the JWT endpoints
+never touch sessions, messages, CSRF or templates. Select it with
+DJANGO_SETTINGS_MODULE=config.settings_api.
+API_ONLY_MINIMAL_APPS=False keeps admin/sessions/messages installed
+(e.g. to run their migrations from this profile) while still skipping
+their middleware.
+"""
+
+from .settings import *  # noqa: F401,F403
+from .settings import INSTALLED_APPS, REST_FRAMEWORK, TEMPLATES, env
+
+MIDDLEWARE = [
+    'django_structlog.middlewares.RequestMiddleware',
+    'django.middleware.security.SecurityMiddleware',
+    'phonebook.api.middleware.CompressionMiddleware',
+    'django.middleware.common.CommonMiddleware',
+]
+
+ROOT_URLCONF = 'config.urls_api'
+
+# The browsable API needs sessions/templates/static files; JSON (and MessagePack) only here
+REST_FRAMEWORK = {
+    **REST_FRAMEWORK,
+    'DEFAULT_RENDERER_CLASSES': [
+        renderer for renderer in REST_FRAMEWORK['DEFAULT_RENDERER_CLASSES']
+        if renderer != 'rest_framework.renderers.BrowsableAPIRenderer'
+    ],
+}
+
+API_ONLY_MINIMAL_APPS = env('API_ONLY_MINIMAL_APPS')
+if API_ONLY_MINIMAL_APPS:
+    INSTALLED_APPS = [
+        app for app in INSTALLED_APPS
+        if app not in (
+            'django.contrib.admin',
+            'django.contrib.sessions',
+            'django.contrib.messages',
+            'django.contrib.staticfiles',
+        )
+    ]
+    TEMPLATES = [{
+        **TEMPLATES[0],
+        'OPTIONS': {
+            'context_processors': [
+                'django.template.context_processors.debug',
+                'django.template.context_processors.request',
+                'django.contrib.auth.context_processors.auth',
+            ],
+        },
+    }]
@@ -0,0 +1,4 @@
+from .throttles import (
+    UserTokenBucketThrottle,
+    IPTokenBucketThrottle,
+)
@@ -0,0 +1,116 @@
+import math
+import secrets
+import threading
+import time
+from collections import OrderedDict
+from django.conf import settings
+from django.core.cache import caches
+
+# A bucket is stored as (tokens_left, last_refill_timestamp)
+BucketState = tuple[float, float]
+
+# CacheBucketStore keys: KEY_PREFIX, the namespace version, then the bucket key
+KEY_PREFIX = 'throttle:'
+VERSION_KEY = 'throttle:version'
+# seconds a process reuses the namespace version it read; a clear() elsewhere shows up within this
+VERSION_REFRESH = 5.0
+
+# cache alias -> (namespace version, monotonic time to read it again)
+_versions: dict[str, tuple[str, float]] = {}
+
+
+def take_token(state: BucketState | None, capacity: float, refill_rate: float, now: float) -> tuple[BucketState, float]:
+    """
+    Refills a bucket for the elapsed time and tries to take one token from it.
+
+    Returns:
+        tuple: The new bucket state and the number of seconds to wait (0.0 if allowed).
+    """
+    if state is None:
+        tokens = capacity
+    else:
+        tokens, last = state
+        tokens = min(capacity, tokens + max(0.0, now - last) * refill_rate)
+
+    if tokens >= 1:
+        return (tokens - 1, now), 0.0
+    return (tokens, now), (1 - tokens) / refill_rate
+
+
+class LocalBucketStore:
+    """
+    In-process token bucket store. Limits only hold per worker process.
+    The least recently used buckets are evicted past `max_keys`.
+    """
+
+    def __init__(self, max_keys: int = 100_000):
+        self.max_keys = max_keys
+        self._buckets: OrderedDict[str, BucketState] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def consume(self, key: str, capacity: float, refill_rate: float, now: float) -> float:
+        with self._lock:
+            state, wait = take_token(
+                self._buckets.pop(key, None), capacity, refill_rate, now)
+            self._buckets[key] = state
+            if len(self._buckets) > self.max_keys:
+                self._buckets.popitem(last=False)
+        return wait
+
+    def clear(self) -> None:
+        with self._lock:
+            self._buckets.clear()
+
+
+class CacheBucketStore:
+    """
+    Token bucket store backed by a Django cache so limits hold across workers.
+    The read-modify-write is not atomic, so concurrent requests may
+    occasionally be admitted slightly over budget.
+
+    Buckets live under a versioned 'throttle:<version>:' namespace, since
+    the cache is shared with other data (e.g. the contact list cache):
+    clear() moves to a new version instead of flushing the cache, and the
+    old buckets expire on their own. Each process re-reads the version at
+    most every VERSION_REFRESH seconds, so a consume costs one get and one
+    set.
+    """
+
+    timer = time.monotonic
+
+    def __init__(self, alias: str = 'default'):
+        self.alias = alias
+
+    def _key(self, cache, key: str) -> str:
+        now = self.timer()
+        version, refresh_at = _versions.get(self.alias, (None, 0.0))
+        if now >= refresh_at:
+            version = cache.get_or_set(VERSION_KEY, '0', timeout=None)
+            _versions[self.alias] = (version, now + VERSION_REFRESH)
+        return f'{KEY_PREFIX}{version}:{key}'
+
+    def consume(self, key: str, capacity: float, refill_rate: float, now: float) -> float:
+        cache = caches[self.alias]
+        key = self._key(cache, key)
+        state, wait = take_token(cache.get(key), capacity, refill_rate, now)
+        # an untouched bucket is full again after capacity / refill_rate seconds
+        cache.set(key, state, timeout=math.ceil(capacity / refill_rate) + 1)
+        return wait
+
+    def clear(self) -> None:
+        # a fresh random version, so a cache that lost the key cannot bring back an old one
+        version = secrets.token_hex(4)
+        caches[self.alias].set(VERSION_KEY, version, timeout=None)
+        _versions[self.alias] = (version, self.timer() + VERSION_REFRESH)
+
+
+_local_store = LocalBucketStore()
+
+
+def get_bucket_store() -> LocalBucketStore | CacheBucketStore:
+    """
+    Returns the store selected by the THROTTLE_STORE setting ('local' or 'cache').
+    """
+    if getattr(settings, 'THROTTLE_STORE', 'local') == 'cache':
+        return CacheBucketStore(getattr(settings, 'THROTTLE_CACHE_ALIAS', 'default'))
+    return _local_store
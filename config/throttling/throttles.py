@@ -0,0 +1,85 @@
+import time
+from functools import lru_cache
+from rest_framework.settings import api_settings
+from rest_framework.throttling import BaseThrottle
+
+from .stores import get_bucket_store
+
+PERIODS = {'s': 1, 'm': 60, 'h': 3600, 'd': 86400}
+
+
+@lru_cache(maxsize=64)
+def parse_rate(rate: str) -> tuple[float, float]:
+    """
+    Parses a DRF-style rate such as '120/min' into a bucket capacity
+    and a refill rate in tokens per second.
+    """
+    num, period = rate.split('/')
+    capacity = float(num)
+    return capacity, capacity / PERIODS[period[0]]
+
+
+class TokenBucketThrottle(BaseThrottle):
+    """
+    Token bucket throttle keyed by the view's `throttle_scope`.
+
+    The budget is looked up in DEFAULT_THROTTLE_RATES under
+    '<throttle_scope>_<kind>'; views without a scope, or scopes without
+    a configured rate, are not throttled.
+    """
+
+    kind = ''
+    timer = time.time
+
+    def __init__(self):
+        self._wait = 0.0
+
+    def get_ident_key(self, request) -> str | None:
+        raise NotImplementedError('.get_ident_key() must be overridden')
+
+    def allow_request(self, request, view) -> bool:
+        scope = getattr(view, 'throttle_scope', None)
+        if not scope:
+            return True
+
+        rate_key = f'{scope}_{self.kind}'
+        rate = api_settings.DEFAULT_THROTTLE_RATES.get(rate_key)
+        if rate is None:
+            return True
+
+        ident = self.get_ident_key(request)
+        if ident is None:
+            return True
+
+        capacity, refill_rate = parse_rate(rate)
+        self._wait = get_bucket_store().consume(
+            f'{rate_key}:{ident}', capacity, refill_rate, self.timer())
+        return self._wait == 0.0
+
+    def wait(self) -> float | None:
+        return self._wait or None
+
+
+class UserTokenBucketThrottle(TokenBucketThrottle):
+    """
+    Per-user budget; anonymous requests are left to the IP throttle.
+    """
+
+    kind = 'user'
+
+    def get_ident_key(self, request) -> str | None:
+        user = getattr(request, 'user', None)
+        if user is None or not user.is_authenticated:
+            return None
+        return str(user.pk)
+
+
+class IPTokenBucketThrottle(TokenBucketThrottle):
+    """
+    Per-client-IP budget, applied to every request.
+    """
+
+    kind = 'ip'
+
+    def get_ident_key(self, request) -> str | None:
+        return self.get_ident(request)
@@ -14,20 +14,15 @@ Including another URLconf
     1. Import the include() function: from django.urls import include, path
     2. Add a URL to urlpatterns:  path('blog/', include('blog.urls'))
 """
-from django.contrib import admin
-from django.urls import path, include
-from rest_framework_simplejwt.views import (
-    TokenObtainPairView,
-    TokenRefreshView,
-)
+from django.apps import apps
+from django.urls import path
 
-# NOTE: Adding the auth urls here for simplicity, in a real world app they should be in a separate app
-urlpatterns = [
-    path('admin/', admin.site.urls),
-    path('phone-book/', include('phonebook.api.contacts.urls')),
-    path('phone-book/auth/token/', TokenObtainPairView.as_view(),
-         name='token_obtain_pair'),
-    path('phone-book/auth/token/refresh/',
-         TokenRefreshView.as_view(), name='token_refresh'),
-    path('phone-book/signup/', include('phonebook.api.signup.urls')),
-]
+from config.urls_api import urlpatterns as api_urlpatterns
+
+urlpatterns = [*api_urlpatterns]
+
+# The admin is optional (ADMIN_ENABLED); only import it when it is installed
+if apps.is_installed('django.contrib.admin'):
+    from django.contrib import admin
+
+    urlpatterns.insert(0, path('admin/', admin.site.urls))
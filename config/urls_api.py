@@ -0,0 +1,26 @@
+"""
+API-only URL configuration: every /phone-book/ route and nothing else.
+
+Served on its own by config.settings_api; config.urls mounts it next to the admin site.
+"""
+from django.urls import path, include
+from rest_framework_simplejwt.views import (
+    TokenObtainPairView,
+    TokenRefreshView,
+)
+
+# NOTE: Adding the auth urls here for simplicity, in a real world app they should be in a separate app
+urlpatterns = [
+    path('phone-book/', include('phonebook.api.contacts.urls')),
+    path('phone-book/lookup/', include('phonebook.api.lookup.urls')),
+    path('phone-book/auth/token/', TokenObtainPairView.as_view(),
+         name='token_obtain_pair'),
+    path('phone-book/auth/token/refresh/',
+         TokenRefreshView.as_view(), name='token_refresh'),
+    path('phone-book/auth/', include('phonebook.api.auth.urls')),
+    path('phone-book/signup/', include('phonebook.api.signup.urls')),
+    path('phone-book/health/', include('phonebook.api.health.urls')),
+    path('phone-book/jobs/', include('phonebook.api.jobs.urls')),
+    path('phone-book/exports/', include('phonebook.api.exports.urls')),
+    path('phone-book/duplicates/', include('phonebook.api.duplicates.urls')),
+]
@@ -0,0 +1,9 @@
+from rest_framework import serializers
+
+
+class TokenRevokeInputSerializer(serializers.Serializer):
+    """
+    Serializer class for token revocation input data validation.
+    """
+
+    refresh = serializers.CharField(required=False)
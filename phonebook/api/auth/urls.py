@@ -0,0 +1,9 @@
+from django.urls import path
+
+from .views import (
+    TokenRevokeAPIView,
+)
+
+urlpatterns = [
+    path('token/revoke/', TokenRevokeAPIView.as_view(), name='token_revoke'),
+]
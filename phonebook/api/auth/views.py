@@ -0,0 +1,49 @@
+from rest_framework import serializers, status, permissions
+from rest_framework.views import APIView
+from rest_framework.response import Response
+from rest_framework.request import Request
+from rest_framework_simplejwt.exceptions import TokenError
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.tokens import RefreshToken
+from rest_framework_simplejwt.utils import datetime_from_epoch
+from typing import Any, cast
+
+from phonebook.services import TokenRevocationService
+from .serializers import TokenRevokeInputSerializer
+
+
+class TokenRevokeAPIView(APIView):
+    """
+    API view to revoke the caller's access token (and optionally
+    their refresh token) before it expires.
+    """
+
+    permission_classes = [permissions.IsAuthenticated]
+
+    def post(self, request: Request) -> Response:
+        serializer = TokenRevokeInputSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        data = cast(dict[str, Any], serializer.validated_data)
+
+        access = request.auth
+        if access is None:
+            raise serializers.ValidationError("No bearer token to revoke.")
+
+        refresh = None
+        if data.get('refresh'):
+            try:
+                refresh = RefreshToken(data['refresh'])
+            except TokenError:
+                raise serializers.ValidationError({'refresh': ["Invalid refresh token."]})
+            if str(refresh.get(api_settings.USER_ID_CLAIM)) != str(request.user.pk):
+                raise serializers.ValidationError({'refresh': ["Invalid refresh token."]})
+
+        service = TokenRevocationService()
+        for token in (access, refresh):
+            if token is not None:
+                service.revoke(
+                    token[api_settings.JTI_CLAIM],
+                    datetime_from_epoch(token['exp']),
+                )
+
+        return Response(status=status.HTTP_200_OK, data={'message': 'Token revoked.'})
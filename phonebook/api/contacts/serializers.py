@@ -1,12 +1,58 @@
 from rest_framework import serializers
 
-from phonebook.services import ContactService
+from phonebook.services import CONTACT_FIELDS, CONTACT_ORDERINGS, DEFAULT_CONTACT_FIELDS, ContactService
 from phonebook.api.utilities import valid_phone_number, valid_name
 
+TIMESTAMP_FIELDS = ('created_at', 'updated_at')
+
+DUPLICATE_NAME_MESSAGE = "A contact with this name already exists."
+DUPLICATE_NUMBER_MESSAGE = "This phone number is already associated with another contact."
+
+
+def parse_fields(value: str | None) -> tuple[str, ...]:
+    """
+    Parses a `?fields=name,created_at` parameter into CONTACT_FIELDS keys,
+    deduplicated and in canonical order. Missing or blank means the defaults.
+    """
+    if not value or not value.strip():
+        return DEFAULT_CONTACT_FIELDS
+    requested = {field.strip() for field in value.split(',') if field.strip()}
+    unknown = requested - CONTACT_FIELDS.keys()
+    if unknown:
+        raise serializers.ValidationError({'fields': [
+            f"Unknown field(s): {', '.join(sorted(unknown))}. "
+            f"Choose from: {', '.join(CONTACT_FIELDS)}."
+        ]})
+    return tuple(field for field in CONTACT_FIELDS if field in requested)
+
+
+class ContactListInputSerializer(serializers.Serializer):
+    name_prefix = serializers.CharField(required=False, max_length=255)
+    # international digits, e.g. a country code ('44') or '1703'
+    number_prefix = serializers.RegexField(r'^\+?\d{1,15}$', required=False)
+    created_after = serializers.DateTimeField(required=False)
+    created_before = serializers.DateTimeField(required=False)
+    updated_after = serializers.DateTimeField(required=False)
+    updated_before = serializers.DateTimeField(required=False)
+    ordering = serializers.ChoiceField(
+        required=False,
+        choices=[sign + name for name in CONTACT_ORDERINGS for sign in ('', '-')],
+    )
+
+    def validate_number_prefix(self, value: str) -> str:
+        return value.lstrip('+')
+
 
 class ContactListOutputSerializer(serializers.Serializer):
     name = serializers.CharField(read_only=True)
     phone_number = serializers.CharField(read_only=True, allow_null=True)
+    created_at = serializers.DateTimeField(read_only=True)
+    updated_at = serializers.DateTimeField(read_only=True)
+
+    def __init__(self, *args, fields: tuple[str, ...] = DEFAULT_CONTACT_FIELDS, **kwargs):
+        super().__init__(*args, **kwargs)
+        for name in set(self.fields) - set(fields):
+            self.fields.pop(name)
 
 
 class CreateContactInputSerializer(serializers.Serializer):
@@ -20,8 +66,7 @@ class CreateContactInputSerializer(serializers.Serializer):
             raise serializers.ValidationError(result)
 
         if ContactService()._check_name_exists(result):
-            raise serializers.ValidationError(
-                "A contact with this name already exists.")
+            raise serializers.ValidationError(DUPLICATE_NAME_MESSAGE)
         return result
 
     def validate_phone_number(self, value: str) -> str:
@@ -31,11 +76,25 @@ class CreateContactInputSerializer(serializers.Serializer):
             raise serializers.ValidationError(result_string)
 
         if ContactService()._check_phone_number_exists(result_string):
-            raise serializers.ValidationError(
-                "This phone number is already associated with another contact.")
+            raise serializers.ValidationError(DUPLICATE_NUMBER_MESSAGE)
 
         return result_string
 
+    @staticmethod
+    def duplicate_errors(name: str, phone_number: str) -> dict[str, list[str]]:
+        """
+        The validation errors for a create that passed validation but lost
+        the unique constraint to a concurrent create of the same contact.
+        """
+        service = ContactService()
+        errors = {}
+        if service._check_name_exists(name):
+            errors['name'] = [DUPLICATE_NAME_MESSAGE]
+        if service._check_phone_number_exists(phone_number):
+            errors['phone_number'] = [DUPLICATE_NUMBER_MESSAGE]
+        # e.g. the winner was deleted since; the name is the likelier clash
+        return errors or {'name': [DUPLICATE_NAME_MESSAGE]}
+
 
 class DeleteContactInputSerializer(serializers.Serializer):
     name = serializers.CharField(
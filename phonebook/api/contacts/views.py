@@ -1,15 +1,23 @@
+from django.conf import settings
+from django.db import IntegrityError
+from django.http.response import HttpResponseBase
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework.request import Request
-from rest_framework import status, permissions
+from rest_framework import serializers, status, permissions
 from typing import cast
+from urllib.parse import urlencode
 
 from .serializers import (
+    TIMESTAMP_FIELDS,
+    ContactListInputSerializer,
     ContactListOutputSerializer,
     CreateContactInputSerializer,
     DeleteContactInputSerializer,
+    parse_fields,
 )
-from phonebook.services import ContactService
+from phonebook.services import DEFAULT_CONTACT_FIELDS, ContactService, ContactListCache
+from phonebook.api.utilities.compression import IDENTITY, precompressed_response
 from config.authentication import (
     IsWriter,
     IsReaderOrWriter
@@ -19,15 +27,64 @@ from config.authentication import (
 class ContactListAPI(APIView):
     """
     API view to list all contacts.
+
+    `?fields=name,created_at` picks the returned fields (and the selected
+    columns); the default is name and phone_number. Filters and `ordering`
+    are validated by ContactListInputSerializer.
     """
 
     permission_classes = [permissions.IsAuthenticated, IsReaderOrWriter]
+    throttle_scope = 'contacts_list'
 
-    def get(self, request: Request) -> Response:
+    def get(self, request: Request) -> HttpResponseBase:
+        fields = parse_fields(request.query_params.get('fields'))
+        serializer = ContactListInputSerializer(data=request.query_params)
+        serializer.is_valid(raise_exception=True)
+        query = dict(cast(dict, serializer.validated_data))
+        ordering = query.pop('ordering', None)
+
+        list_cache = ContactListCache()
+        renderer = request.accepted_renderer
+        if not list_cache.enabled or renderer.format == 'api':
+            return Response(self._list_data(fields, query, ordering), status=status.HTTP_200_OK)
+
+        # cache the rendered bytes (and compressed variants) per media type and query
+        media_type = request.accepted_media_type
+        variant = media_type
+        if fields != DEFAULT_CONTACT_FIELDS or query or ordering:
+            params = sorted((key, str(value)) for key, value in query.items())
+            variant = f'{media_type}:{",".join(fields)}:{ordering or ""}:{urlencode(params)}'
+        payload = list_cache.get(variant)
+        is_new = payload is None
+        if payload is None:
+            payload = {IDENTITY: renderer.render(
+                self._list_data(fields, query, ordering), media_type, self.get_renderer_context())}
+
+        content_type = media_type
+        if renderer.charset:
+            content_type = f'{media_type}; charset={renderer.charset}'
+
+        response, added = precompressed_response(
+            request, payload, content_type, endpoint='contact-list')
+        if is_new or added:
+            list_cache.set(variant, payload)
+        return response
+
+    def _list_data(self, fields: tuple[str, ...], filters: dict, ordering: str | None):
         service = ContactService()
-        contacts = service.retrieve_all_contacts()
-        serializer = ContactListOutputSerializer(contacts, many=True)
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        contacts = service.retrieve_all_contacts(fields, filters, ordering)
+        if settings.CONTACT_LIST_FAST_PATH:
+            # rows are already shaped like ContactListOutputSerializer output,
+            # except timestamps, which get the serializer's formatting
+            timestamps = [field for field in fields if field in TIMESTAMP_FIELDS]
+            if timestamps:
+                to_representation = serializers.DateTimeField().to_representation
+                for contact in contacts:
+                    for field in timestamps:
+                        contact[field] = to_representation(contact[field])
+            return contacts
+        serializer = ContactListOutputSerializer(contacts, many=True, fields=fields)
+        return serializer.data
 
 
 class ContactCreateAPI(APIView):
@@ -36,6 +93,7 @@ class ContactCreateAPI(APIView):
     """
 
     permission_classes = [permissions.IsAuthenticated, IsWriter]
+    throttle_scope = 'contacts_write'
 
     def post(self, request: Request):
         serializer = CreateContactInputSerializer(data=request.data)
@@ -46,7 +104,11 @@ class ContactCreateAPI(APIView):
         name = validated_data['name']
         phone_number = validated_data['phone_number']
 
-        new_contact = service.create_new_contact(name, phone_number)
+        try:
+            new_contact = service.create_new_contact(name, phone_number)
+        except IntegrityError:
+            # a concurrent create took the name or number after validation
+            raise serializers.ValidationError(CreateContactInputSerializer.duplicate_errors(name, phone_number))
 
         serializer = ContactListOutputSerializer(new_contact)
         return Response(serializer.data, status=status.HTTP_201_CREATED)
@@ -58,6 +120,7 @@ class ContactDeleteAPI(APIView):
     """
 
     permission_classes = [permissions.IsAuthenticated, IsWriter]
+    throttle_scope = 'contacts_write'
 
     def delete(self, request: Request) -> Response:
         name = request.query_params.get('name', None)
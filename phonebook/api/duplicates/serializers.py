@@ -0,0 +1,22 @@
+from rest_framework import serializers
+
+MAX_REPORT_GROUPS = 1000
+
+
+class DuplicateReportInputSerializer(serializers.Serializer):
+    limit = serializers.IntegerField(required=False, default=100, min_value=1, max_value=MAX_REPORT_GROUPS)
+
+
+class DuplicateContactSerializer(serializers.Serializer):
+    database = serializers.CharField(read_only=True)
+    id = serializers.IntegerField(read_only=True)
+    name = serializers.CharField(read_only=True)
+    phone_number = serializers.CharField(read_only=True, allow_null=True)
+    created_at = serializers.DateTimeField(read_only=True)
+
+
+class DuplicateGroupSerializer(serializers.Serializer):
+    keep = DuplicateContactSerializer(read_only=True)
+    duplicates = DuplicateContactSerializer(many=True, read_only=True)
+    reasons = serializers.ListField(child=serializers.CharField(), read_only=True)
+    conflict = serializers.BooleanField(read_only=True)
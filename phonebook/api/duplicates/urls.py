@@ -0,0 +1,9 @@
+from django.urls import path
+
+from .views import (
+    DuplicateReportAPI,
+)
+
+urlpatterns = [
+    path('', DuplicateReportAPI.as_view(), name='duplicate-report'),
+]
@@ -0,0 +1,37 @@
+from rest_framework import permissions
+from rest_framework.views import APIView
+from rest_framework.response import Response
+from rest_framework.request import Request
+from typing import cast
+
+from .serializers import (
+    DuplicateGroupSerializer,
+    DuplicateReportInputSerializer,
+)
+from config.authentication import IsWriter
+from phonebook.services import DuplicateService
+
+
+class DuplicateReportAPI(APIView):
+    """
+    API view reporting groups of duplicate contacts (the first `limit`,
+    oldest first) with totals. Merging is left to `manage.py find_duplicates
+    --merge` or a `merge_duplicate_contacts` job.
+    """
+
+    permission_classes = [permissions.IsAuthenticated, IsWriter]
+    throttle_scope = 'duplicates'
+
+    def get(self, request: Request) -> Response:
+        serializer = DuplicateReportInputSerializer(data=request.query_params)
+        serializer.is_valid(raise_exception=True)
+        limit = cast(dict, serializer.validated_data)['limit']
+
+        groups = DuplicateService().find()
+
+        return Response({
+            'groups': DuplicateGroupSerializer(groups[:limit], many=True).data,
+            'total_groups': len(groups),
+            'total_duplicates': sum(len(group['duplicates']) for group in groups),
+            'conflicts': sum(group['conflict'] for group in groups),
+        })
@@ -0,0 +1,7 @@
+from rest_framework import serializers
+
+from phonebook.services.export_service import EXPORT_FORMATS
+
+
+class ExportCreateInputSerializer(serializers.Serializer):
+    format = serializers.ChoiceField(choices=EXPORT_FORMATS, default='csv')
@@ -0,0 +1,11 @@
+from django.urls import path
+
+from .views import (
+    ExportCreateAPI,
+    ExportDetailAPI,
+)
+
+urlpatterns = [
+    path('', ExportCreateAPI.as_view(), name='export-create'),
+    path('<int:pk>/', ExportDetailAPI.as_view(), name='export-detail'),
+]
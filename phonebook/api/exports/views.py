@@ -0,0 +1,79 @@
+from pathlib import Path
+from django.http import Http404
+from django.http.response import HttpResponseBase
+from django.urls import reverse
+from rest_framework import status, permissions
+from rest_framework.views import APIView
+from rest_framework.response import Response
+from rest_framework.request import Request
+from typing import cast
+
+from .serializers import ExportCreateInputSerializer
+from config.authentication import IsReaderOrWriter
+from phonebook.api.jobs.serializers import JobOutputSerializer
+from phonebook.api.utilities.ranges import ranged_file_response
+from phonebook.models import Job
+from phonebook.services import ExportService
+from phonebook.services.export_service import EXPORT_JOB_KIND
+
+CONTENT_TYPE = 'application/gzip'
+# seconds clients are asked to wait before polling a pending export again
+RETRY_AFTER = 2
+
+
+class ExportCreateAPI(APIView):
+    """
+    API view queueing a full-book export for a background worker.
+
+    Responds 202 with the job, or 200 with the previous export's job when
+    nothing changed since; either way `Location` is the download URL.
+    """
+
+    permission_classes = [permissions.IsAuthenticated, IsReaderOrWriter]
+    throttle_scope = 'exports'
+
+    def post(self, request: Request) -> Response:
+        serializer = ExportCreateInputSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        fmt = cast(dict, serializer.validated_data)['format']
+
+        job, _ = ExportService().request_export(fmt, created_by_id=request.user.pk)
+
+        ready = job.status == Job.Status.SUCCEEDED
+        response = Response(JobOutputSerializer(job).data,
+                            status=status.HTTP_200_OK if ready else status.HTTP_202_ACCEPTED)
+        response['Location'] = reverse('export-detail', args=[job.pk])
+        return response
+
+
+class ExportDetailAPI(APIView):
+    """
+    API view for an export: the job status (202) while it is pending, then
+    the gzip-compressed artifact, with range requests for resumed downloads.
+    Failed exports answer 409 with the job; expired artifacts 410.
+    """
+
+    permission_classes = [permissions.IsAuthenticated, IsReaderOrWriter]
+    throttle_scope = 'exports'
+
+    def get(self, request: Request, pk: int) -> HttpResponseBase:
+        job = Job.objects.filter(pk=pk, kind=EXPORT_JOB_KIND).first()
+        if job is None:
+            raise Http404("No export matches the given query.")
+
+        if job.status == Job.Status.FAILED:
+            return Response(JobOutputSerializer(job).data, status=status.HTTP_409_CONFLICT)
+        if job.status != Job.Status.SUCCEEDED:
+            return Response(JobOutputSerializer(job).data, status=status.HTTP_202_ACCEPTED,
+                            headers={'Retry-After': str(RETRY_AFTER)})
+
+        path = Path(job.result['path'])
+        if not path.exists():
+            return Response({'detail': 'This export has expired; request a new one.'},
+                            status=status.HTTP_410_GONE)
+        fmt = job.result['format']
+        return ranged_file_response(
+            request, path, CONTENT_TYPE,
+            filename=f'contacts.{fmt}.gz',
+            etag=f'"{job.result["fingerprint"]}-{fmt}"',
+        )
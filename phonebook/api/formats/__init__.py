@@ -0,0 +1,9 @@
+from .renderers import (
+    FastJSONRenderer,
+    MessagePackRenderer,
+)
+
+from .parsers import (
+    FastJSONParser,
+    MessagePackParser,
+)
@@ -0,0 +1,58 @@
+from rest_framework import renderers
+from rest_framework.utils import encoders
+
+try:  # optional, speeds up JSON encoding when installed
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+try:  # optional, required for the MessagePack format
+    import msgpack
+except ImportError:  # pragma: no cover
+    msgpack = None
+
+_default = encoders.JSONEncoder().default
+
+
+class FastJSONRenderer(renderers.JSONRenderer):
+    """
+    JSON renderer that encodes with orjson when it is installed.
+
+    Output matches DRF's compact JSONRenderer byte for byte: UTF-8,
+    no whitespace, U+2028/U+2029 escaped, and anything orjson cannot encode
+    natively (dates, decimals, lazy strings...) goes through DRF's encoder.
+    Indented output and a missing orjson fall back to the stdlib path.
+    """
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None or orjson is None:
+            return super().render(data, accepted_media_type, renderer_context)
+
+        renderer_context = renderer_context or {}
+        if self.get_indent(accepted_media_type, renderer_context):
+            return super().render(data, accepted_media_type, renderer_context)
+
+        ret = orjson.dumps(
+            data,
+            default=_default,
+            option=orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS,
+        )
+        if b'\xe2\x80\xa8' in ret or b'\xe2\x80\xa9' in ret:
+            ret = ret.replace(b'\xe2\x80\xa8', b'\\u2028').replace(b'\xe2\x80\xa9', b'\\u2029')
+        return ret
+
+
+class MessagePackRenderer(renderers.BaseRenderer):
+    """
+    Renders responses as MessagePack, selected with `Accept: application/msgpack`.
+    """
+
+    media_type = 'application/msgpack'
+    format = 'msgpack'
+    charset = None
+    render_style = 'binary'
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        return msgpack.packb(data, use_bin_type=True, default=_default)
@@ -0,0 +1,11 @@
+from django.urls import path
+
+from .views import (
+    LivenessAPIView,
+    ReadinessAPIView,
+)
+
+urlpatterns = [
+    path('live/', LivenessAPIView.as_view(), name='health-live'),
+    path('ready/', ReadinessAPIView.as_view(), name='health-ready'),
+]
@@ -0,0 +1,36 @@
+from rest_framework import status, permissions
+from rest_framework.views import APIView
+from rest_framework.response import Response
+from rest_framework.request import Request
+
+from phonebook.services.warmup_service import is_ready
+
+
+class HealthAPIView(APIView):
+    """
+    Base for load balancer probes: no authentication, throttling or database work.
+    """
+
+    authentication_classes = []
+    permission_classes = [permissions.AllowAny]
+    throttle_classes = []
+
+
+class LivenessAPIView(HealthAPIView):
+    """
+    API view answering whether the worker process is up.
+    """
+
+    def get(self, request: Request) -> Response:
+        return Response({'status': 'ok'}, status=status.HTTP_200_OK)
+
+
+class ReadinessAPIView(HealthAPIView):
+    """
+    API view answering whether the worker has finished warming up.
+    """
+
+    def get(self, request: Request) -> Response:
+        if not is_ready():
+            return Response({'status': 'warming_up'}, status=status.HTTP_503_SERVICE_UNAVAILABLE)
+        return Response({'status': 'ready'}, status=status.HTTP_200_OK)
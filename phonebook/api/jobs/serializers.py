@@ -0,0 +1,30 @@
+from rest_framework import serializers
+
+from phonebook.services.job_service import job_kinds
+
+
+class JobCreateInputSerializer(serializers.Serializer):
+    kind = serializers.CharField(max_length=100)
+    payload = serializers.DictField(required=False, default=dict)
+    delay = serializers.FloatField(required=False, default=0, min_value=0)
+
+    def validate_kind(self, value: str) -> str:
+        if value not in job_kinds():
+            raise serializers.ValidationError(
+                f"Unknown job kind. Choose from: {', '.join(job_kinds())}.")
+        return value
+
+
+class JobOutputSerializer(serializers.Serializer):
+    id = serializers.IntegerField(read_only=True)
+    kind = serializers.CharField(read_only=True)
+    status = serializers.CharField(read_only=True)
+    progress = serializers.FloatField(read_only=True)
+    attempts = serializers.IntegerField(read_only=True)
+    max_attempts = serializers.IntegerField(read_only=True)
+    result = serializers.JSONField(read_only=True)
+    error = serializers.CharField(read_only=True)
+    run_at = serializers.DateTimeField(read_only=True)
+    created_at = serializers.DateTimeField(read_only=True)
+    started_at = serializers.DateTimeField(read_only=True)
+    finished_at = serializers.DateTimeField(read_only=True)
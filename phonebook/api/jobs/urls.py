@@ -0,0 +1,11 @@
+from django.urls import path
+
+from .views import (
+    JobCreateAPI,
+    JobDetailAPI,
+)
+
+urlpatterns = [
+    path('', JobCreateAPI.as_view(), name='job-create'),
+    path('<int:pk>/', JobDetailAPI.as_view(), name='job-detail'),
+]
@@ -0,0 +1,51 @@
+from django.http import Http404
+from rest_framework import status, permissions
+from rest_framework.views import APIView
+from rest_framework.response import Response
+from rest_framework.request import Request
+from typing import cast
+
+from .serializers import (
+    JobCreateInputSerializer,
+    JobOutputSerializer,
+)
+from phonebook.models import Job
+from phonebook.services import JobService
+
+
+class JobCreateAPI(APIView):
+    """
+    API view for admins to queue a background job of a registered kind.
+    """
+
+    permission_classes = [permissions.IsAdminUser]
+
+    def post(self, request: Request) -> Response:
+        serializer = JobCreateInputSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        data = cast(dict, serializer.validated_data)
+
+        job = JobService().enqueue(
+            data['kind'], data['payload'], delay=data['delay'], created_by_id=request.user.pk)
+
+        return Response(JobOutputSerializer(job).data, status=status.HTTP_202_ACCEPTED)
+
+
+class JobDetailAPI(APIView):
+    """
+    API view reporting a job's status, progress and result.
+    Users see the jobs they queued; staff see every job.
+    """
+
+    permission_classes = [permissions.IsAuthenticated]
+    throttle_scope = 'jobs'
+
+    def get(self, request: Request, pk: int) -> Response:
+        jobs = Job.objects.all()
+        if not request.user.is_staff:
+            jobs = jobs.filter(created_by_id=request.user.pk)
+        job = jobs.filter(pk=pk).first()
+        if job is None:
+            raise Http404("No Job matches the given query.")
+
+        return Response(JobOutputSerializer(job).data, status=status.HTTP_200_OK)
@@ -0,0 +1,35 @@
+from rest_framework import serializers
+
+from phonebook.api.utilities import valid_phone_number
+
+
+class LookupInputSerializer(serializers.Serializer):
+    phone_number = serializers.CharField(required=True, max_length=50)
+
+    def validate_phone_number(self, value: str) -> str:
+        result, is_valid = valid_phone_number(value)
+        if not is_valid:
+            raise serializers.ValidationError(result)
+        return result
+
+
+class LookupOutputSerializer(serializers.Serializer):
+    phone_number = serializers.CharField(read_only=True)
+    name = serializers.CharField(read_only=True)
+
+
+# upper bound for one JSON batch; larger inputs go to the streaming endpoint
+MAX_BATCH_NUMBERS = 10_000
+
+
+class BatchLookupInputSerializer(serializers.Serializer):
+    phone_numbers = serializers.ListField(
+        child=serializers.CharField(max_length=50),
+        allow_empty=False,
+        max_length=MAX_BATCH_NUMBERS,
+    )
+
+
+class BatchLookupOutputSerializer(serializers.Serializer):
+    results = serializers.DictField(child=serializers.CharField(allow_null=True), read_only=True)
+    invalid = serializers.ListField(child=serializers.CharField(), read_only=True)
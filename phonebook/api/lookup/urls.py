@@ -0,0 +1,13 @@
+from django.urls import path
+
+from .views import (
+    ContactBatchLookupAPI,
+    ContactBatchLookupStreamAPI,
+    ContactLookupAPI,
+)
+
+urlpatterns = [
+    path('', ContactLookupAPI.as_view(), name='contact-lookup'),
+    path('batch/', ContactBatchLookupAPI.as_view(), name='contact-lookup-batch'),
+    path('batch/stream/', ContactBatchLookupStreamAPI.as_view(), name='contact-lookup-batch-stream'),
+]
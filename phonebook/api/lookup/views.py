@@ -0,0 +1,89 @@
+import json
+from django.http import StreamingHttpResponse
+from rest_framework import status, permissions
+from rest_framework.views import APIView
+from rest_framework.response import Response
+from rest_framework.request import Request
+from typing import cast
+
+from .serializers import (
+    BatchLookupInputSerializer,
+    BatchLookupOutputSerializer,
+    LookupInputSerializer,
+    LookupOutputSerializer,
+)
+from phonebook.api.utilities import valid_phone_number
+from phonebook.services import LookupService
+from config.authentication import IsReaderOrWriter
+
+
+class ContactLookupAPI(APIView):
+    """
+    API view resolving a phone number (any accepted format) to its contact name.
+    """
+
+    permission_classes = [permissions.IsAuthenticated, IsReaderOrWriter]
+    throttle_scope = 'contacts_lookup'
+
+    def get(self, request: Request) -> Response:
+        serializer = LookupInputSerializer(data={
+            'phone_number': request.query_params.get('phone_number'),
+        })
+        serializer.is_valid(raise_exception=True)
+        phone_number = cast(dict, serializer.validated_data)['phone_number']
+
+        name = LookupService().lookup(phone_number)
+        if name is None:
+            return Response({'detail': 'No contact has this phone number.'}, status=status.HTTP_404_NOT_FOUND)
+
+        output = LookupOutputSerializer({'phone_number': phone_number, 'name': name})
+        return Response(output.data, status=status.HTTP_200_OK)
+
+
+class ContactBatchLookupAPI(APIView):
+    """
+    API view resolving up to MAX_BATCH_NUMBERS phone numbers in one request.
+
+    Invalid numbers do not fail the batch; they are listed under `invalid`.
+    """
+
+    permission_classes = [permissions.IsAuthenticated, IsReaderOrWriter]
+    throttle_scope = 'contacts_lookup_batch'
+
+    def post(self, request: Request) -> Response:
+        serializer = BatchLookupInputSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        phone_numbers = cast(dict, serializer.validated_data)['phone_numbers']
+
+        cleaned: dict[str, str] = {}
+        invalid: list[str] = []
+        for number in phone_numbers:
+            result, is_valid = valid_phone_number(number)
+            if is_valid:
+                cleaned[number] = result
+            else:
+                invalid.append(number)
+
+        names = LookupService().lookup_many(cleaned.values())
+        output = BatchLookupOutputSerializer({
+            'results': {number: names[value] for number, value in cleaned.items()},
+            'invalid': invalid,
+        })
+        return Response(output.data, status=status.HTTP_200_OK)
+
+
+class ContactBatchLookupStreamAPI(APIView):
+    """
+    API view for inputs too large for one JSON body: the request body holds
+    one phone number per line and the response streams one NDJSON object per
+    input line, resolved a chunk at a time.
+    """
+
+    permission_classes = [permissions.IsAuthenticated, IsReaderOrWriter]
+    throttle_scope = 'contacts_lookup_batch'
+
+    def post(self, request: Request) -> StreamingHttpResponse:
+        lines = (line.decode('utf-8', 'replace') for line in request.stream or ())
+        dumps = json.JSONEncoder(ensure_ascii=False, separators=(',', ':')).encode
+        rows = (dumps(row) + '\n' for row in LookupService().iter_lookup(lines))
+        return StreamingHttpResponse(rows, content_type='application/x-ndjson')
@@ -0,0 +1,3 @@
+from .compression import (
+    CompressionMiddleware,
+)
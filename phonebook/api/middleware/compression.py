@@ -0,0 +1,43 @@
+from django.utils.cache import patch_vary_headers
+
+from phonebook.api.utilities.compression import (
+    compress,
+    get_compression_config,
+    negotiate_encoding,
+)
+
+
+class CompressionMiddleware:
+    """
+    Negotiated gzip/brotli/zstd compression for API responses.
+
+    Settings come from RESPONSE_COMPRESSION, with per-endpoint overrides
+    keyed by URL name. Streaming responses and responses that already
+    carry a Content-Encoding (e.g. precompressed cached payloads) are
+    passed through untouched.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        response = self.get_response(request)
+
+        if response.streaming or response.has_header('Content-Encoding'):
+            return response
+
+        match = getattr(request, 'resolver_match', None)
+        config = get_compression_config(match.url_name if match else None)
+        if not config['ENABLED'] or len(response.content) < config['MIN_SIZE']:
+            return response
+
+        patch_vary_headers(response, ('Accept-Encoding',))
+        encoding = negotiate_encoding(request.META.get('HTTP_ACCEPT_ENCODING', ''))
+        if encoding is None:
+            return response
+
+        response.content = compress(
+            response.content, encoding, config['LEVELS'][encoding])
+        response['Content-Length'] = str(len(response.content))
+        response['Content-Encoding'] = encoding
+        return response
@@ -6,6 +6,7 @@ from django.core.exceptions import ValidationError as DjangoValidationError
 from typing import Any, cast
 
 from phonebook.api.utilities import valid_name
+from phonebook.services.signup_service import DEFAULT_GROUPS
 from phonebook.api.utilities.valid_patterns import ATTACKER_REGEX
 
 
@@ -39,11 +40,7 @@ class SignUpSerializerInput(serializers.Serializer):
         except DjangoValidationError:
             raise serializers.ValidationError("Invalid username.")
 
-        # Check for uniqueness
-        User = get_user_model()
-        if User.objects.filter(username=username).exists():
-            raise serializers.ValidationError("Username is already taken.")
-
+        # uniqueness is enforced by the INSERT in SignUpService.create_user
         return username
 
     def validate(self, attrs: dict[str, Any]) -> dict[str, Any]:
@@ -94,6 +91,37 @@ class SignUpSerializerInput(serializers.Serializer):
         return attrs
 
 
+MAX_BULK_USERS = 10_000
+
+
+class ProvisionUserInputSerializer(SignUpSerializerInput):
+    """
+    Serializer class for one user entry of a bulk provisioning request.
+    """
+
+    groups = serializers.ListField(
+        child=serializers.ChoiceField(choices=DEFAULT_GROUPS),
+        required=False, allow_empty=False)
+
+
+class BulkProvisionInputSerializer(serializers.Serializer):
+    """
+    Serializer class for bulk provisioning input data validation.
+    """
+
+    users = ProvisionUserInputSerializer(
+        many=True, allow_empty=False, max_length=MAX_BULK_USERS)
+
+
+class BulkProvisionOutputSerializer(serializers.Serializer):
+    """
+    Serializer class for bulk provisioning output data representation.
+    """
+
+    created = serializers.IntegerField()
+    usernames = serializers.ListField(child=serializers.CharField())
+
+
 class SignUpSerializerOutput(serializers.Serializer):
     """
     Serializer class for user sign-up output data representation.
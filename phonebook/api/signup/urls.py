@@ -1,10 +1,12 @@
 from django.urls import path
 
 from .views import (
-    SignUpAPIView
+    BulkProvisionAPIView,
+    SignUpAPIView,
 )
 
 
 urlpatterns = [
     path('', SignUpAPIView.as_view(), name='user-signup'),
+    path('bulk/', BulkProvisionAPIView.as_view(), name='user-bulk-provision'),
 ]
@@ -1,12 +1,19 @@
-from rest_framework import status, permissions
+from rest_framework import serializers, status, permissions
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework.request import Request
-from rest_framework_simplejwt.tokens import RefreshToken
 from typing import Any, cast
 
-from phonebook.services import SignUpService
+from config.authentication.tokens import PhonebookRefreshToken
+from phonebook.services import (
+    ProvisioningError,
+    ProvisioningService,
+    SignUpService,
+    UsernameTakenError,
+)
 from .serializers import (
+    BulkProvisionInputSerializer,
+    BulkProvisionOutputSerializer,
     SignUpSerializerInput,
     SignUpSerializerOutput,
 )
@@ -18,6 +25,7 @@ class SignUpAPIView(APIView):
     """
 
     permission_classes = [permissions.AllowAny]
+    throttle_scope = 'signup'
 
     def post(self, request: Request) -> Response:
         serializer = SignUpSerializerInput(data=request.data)
@@ -25,15 +33,19 @@ class SignUpAPIView(APIView):
         data = cast(dict[str, Any], serializer.validated_data)
 
         sign_up_service = SignUpService()
-        new_user = sign_up_service.create_user(
-            username=data['username'],
-            password=data['password'],
-            first_name=data.get('first_name', ""),
-            last_name=data.get('last_name', "")
-        )
+        try:
+            new_user = sign_up_service.create_user(
+                username=data['username'],
+                password=data['password'],
+                first_name=data.get('first_name', ""),
+                last_name=data.get('last_name', "")
+            )
+        except UsernameTakenError:
+            raise serializers.ValidationError(
+                {'username': ["Username is already taken."]})
 
         # Issue JWT access token
-        refresh = RefreshToken.for_user(new_user)
+        refresh = PhonebookRefreshToken.for_user(new_user, groups=['reader'])
         access_token = str(refresh.access_token)
 
         serializer = SignUpSerializerOutput(data={
@@ -42,3 +54,29 @@ class SignUpAPIView(APIView):
         })
         serializer.is_valid(raise_exception=True)
         return Response(serializer.data, status=status.HTTP_201_CREATED)
+
+
+class BulkProvisionAPIView(APIView):
+    """
+    API view for admins to create many users in one request.
+    """
+
+    permission_classes = [permissions.IsAdminUser]
+
+    def post(self, request: Request) -> Response:
+        serializer = BulkProvisionInputSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        entries = cast(dict[str, Any], serializer.validated_data)['users']
+
+        service = ProvisioningService()
+        try:
+            users = service.provision_users(entries)
+        except ProvisioningError as e:
+            raise serializers.ValidationError(
+                {'users': [e.errors.get(i, {}) for i in range(len(entries))]})
+
+        serializer = BulkProvisionOutputSerializer({
+            'created': len(users),
+            'usernames': [u.username for u in users],
+        })
+        return Response(serializer.data, status=status.HTTP_201_CREATED)
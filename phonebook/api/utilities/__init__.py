@@ -1,4 +1,5 @@
 from .util_funcs import (
+    normalize_phone_number,
     valid_phone_number,
     valid_name,
 )
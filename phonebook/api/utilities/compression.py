@@ -0,0 +1,130 @@
+import gzip
+from django.conf import settings
+from django.http import HttpResponse
+from django.utils.cache import patch_vary_headers
+from rest_framework.request import Request
+
+try:  # optional codecs, used only when installed
+    import brotli
+except ImportError:  # pragma: no cover
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover
+    zstandard = None
+
+IDENTITY = 'identity'
+
+# Server preference order when the client accepts several encodings
+PREFERRED_ENCODINGS = ('zstd', 'br', 'gzip')
+
+DEFAULT_COMPRESSION = {
+    'ENABLED': True,
+    'MIN_SIZE': 1024,
+    'LEVELS': {'gzip': 6, 'br': 5, 'zstd': 3},
+}
+
+
+def available_encodings() -> tuple[str, ...]:
+    """
+    Returns the encodings this process can produce, in preference order.
+    """
+    found = {'gzip'}
+    if brotli is not None:
+        found.add('br')
+    if zstandard is not None:
+        found.add('zstd')
+    return tuple(e for e in PREFERRED_ENCODINGS if e in found)
+
+
+def get_compression_config(endpoint: str | None = None) -> dict:
+    """
+    Merges RESPONSE_COMPRESSION defaults with the overrides
+    for the given endpoint (URL name).
+    """
+    conf = getattr(settings, 'RESPONSE_COMPRESSION', {})
+    merged = {**DEFAULT_COMPRESSION, **{k: v for k, v in conf.items() if k != 'ENDPOINTS'}}
+    merged['LEVELS'] = {**DEFAULT_COMPRESSION['LEVELS'], **conf.get('LEVELS', {})}
+
+    override = conf.get('ENDPOINTS', {}).get(endpoint, {}) if endpoint else {}
+    if override:
+        levels = {**merged['LEVELS'], **override.get('LEVELS', {})}
+        merged.update(override)
+        merged['LEVELS'] = levels
+    return merged
+
+
+def negotiate_encoding(accept_encoding: str) -> str | None:
+    """
+    Picks the preferred available encoding the client accepts
+    (per its Accept-Encoding header), or None for an uncompressed response.
+    """
+    if not accept_encoding:
+        return None
+
+    accepted: dict[str, float] = {}
+    for part in accept_encoding.split(','):
+        token, _, params = part.strip().partition(';')
+        q = 1.0
+        params = params.strip()
+        if params.startswith('q='):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        accepted[token.strip().lower()] = q
+
+    wildcard = accepted.get('*', 0.0)
+    for encoding in available_encodings():
+        if accepted.get(encoding, wildcard) > 0:
+            return encoding
+    return None
+
+
+def compress(data: bytes, encoding: str, level: int) -> bytes:
+    """
+    Compresses a payload with the given content-coding.
+    """
+    if encoding == 'gzip':
+        return gzip.compress(data, compresslevel=level, mtime=0)
+    if encoding == 'br' and brotli is not None:
+        return brotli.compress(data, quality=level)
+    if encoding == 'zstd' and zstandard is not None:
+        return zstandard.ZstdCompressor(level=level).compress(data)
+    raise ValueError(f"Unsupported content encoding: {encoding!r}")
+
+
+def precompressed_response(request: Request, payload: dict[str, bytes], content_type: str, endpoint: str) -> tuple[HttpResponse, bool]:
+    """
+    Builds a response from a payload dict holding the raw body under
+    IDENTITY plus any already-compressed variants keyed by encoding.
+
+    A missing variant is compressed once and added to `payload`.
+
+    Returns:
+        tuple: The response and whether `payload` gained a new variant
+        (so the caller can store it back in its cache).
+    """
+    config = get_compression_config(endpoint)
+    raw = payload[IDENTITY]
+    encoding = None
+    if config['ENABLED'] and len(raw) >= config['MIN_SIZE']:
+        encoding = negotiate_encoding(request.META.get('HTTP_ACCEPT_ENCODING', ''))
+
+    added = False
+    if encoding is None:
+        body = raw
+    else:
+        body = payload.get(encoding)
+        if body is None:
+            body = compress(raw, encoding, config['LEVELS'][encoding])
+            payload[encoding] = body
+            added = True
+
+    response = HttpResponse(body, content_type=content_type)
+    if encoding is not None:
+        response['Content-Encoding'] = encoding
+    response['Content-Length'] = str(len(body))
+    patch_vary_headers(response, ('Accept', 'Accept-Encoding'))
+    return response, added
@@ -0,0 +1,26 @@
+from rest_framework import status
+from rest_framework.exceptions import APIException
+from rest_framework.views import exception_handler as drf_exception_handler
+
+from phonebook.services.hashing_service import HashingBusyError
+
+
+class ServiceBusy(APIException):
+    status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+    default_detail = 'Service is busy, try again shortly.'
+    default_code = 'service_busy'
+
+    def __init__(self, detail=None, code=None, wait: int | None = None):
+        super().__init__(detail, code)
+        # DRF's handler turns `wait` into a Retry-After header
+        self.wait = wait
+
+
+def exception_handler(exc, context):
+    """
+    DRF exception handler that also maps service-level capacity errors
+    to 503 responses with Retry-After.
+    """
+    if isinstance(exc, HashingBusyError):
+        exc = ServiceBusy(wait=exc.retry_after)
+    return drf_exception_handler(exc, context)
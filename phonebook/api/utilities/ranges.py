@@ -0,0 +1,93 @@
+import re
+from pathlib import Path
+from django.http import FileResponse, HttpResponse, StreamingHttpResponse
+from django.http.response import HttpResponseBase
+from django.utils.http import content_disposition_header
+
+RANGE_RE = re.compile(r'^bytes=(\d*)-(\d*)$')
+BLOCK_SIZE = 64 * 1024
+
+
+class RangeNotSatisfiable(Exception):
+    """
+    Raised by parse_range when the requested range starts past the end.
+    """
+
+
+def parse_range(header: str | None, size: int) -> tuple[int, int] | None:
+    """
+    Parses a single-range `Range: bytes=...` header against a `size`-byte body.
+
+    Returns:
+        tuple[int, int] | None: The inclusive (first, last) byte positions,
+        or None to serve the whole body: no header, or a form not served
+        as a partial response, such as multiple ranges (RFC 9110 allows
+        ignoring those).
+    Raises:
+        RangeNotSatisfiable: If no byte of the range exists.
+    """
+    if not header:
+        return None
+    match = RANGE_RE.match(header.strip())
+    if match is None:
+        return None
+    first, last = match.groups()
+    if not first and not last:
+        return None
+    if not first:
+        # suffix range: the last N bytes
+        if int(last) == 0 or size == 0:
+            raise RangeNotSatisfiable()
+        return max(size - int(last), 0), size - 1
+    start = int(first)
+    if last and int(last) < start:
+        return None
+    if start >= size:
+        raise RangeNotSatisfiable()
+    return start, min(int(last), size - 1) if last else size - 1
+
+
+def _read_span(stream, length: int):
+    try:
+        while length > 0:
+            block = stream.read(min(BLOCK_SIZE, length))
+            if not block:
+                break
+            length -= len(block)
+            yield block
+    finally:
+        stream.close()
+
+
+def ranged_file_response(request, path: Path, content_type: str, filename: str, etag: str) -> HttpResponseBase:
+    """
+    Streams a file as a download, honouring `Range` (and `If-Range`
+    against `etag`) with 206 Partial Content or 416 responses.
+    """
+    size = path.stat().st_size
+    header = request.META.get('HTTP_RANGE')
+    if_range = request.META.get('HTTP_IF_RANGE')
+    if if_range and if_range != etag:
+        # the client's partial copy is of another version: send it all
+        header = None
+
+    try:
+        byte_range = parse_range(header, size)
+    except RangeNotSatisfiable:
+        response = HttpResponse(status=416)
+        response['Content-Range'] = f'bytes */{size}'
+        return response
+
+    stream = open(path, 'rb')
+    if byte_range is None:
+        response = FileResponse(stream, content_type=content_type, as_attachment=True, filename=filename)
+    else:
+        first, last = byte_range
+        stream.seek(first)
+        response = StreamingHttpResponse(_read_span(stream, last - first + 1), status=206, content_type=content_type)
+        response['Content-Range'] = f'bytes {first}-{last}/{size}'
+        response['Content-Length'] = str(last - first + 1)
+        response['Content-Disposition'] = content_disposition_header(True, filename)
+    response['Accept-Ranges'] = 'bytes'
+    response['ETag'] = etag
+    return response
@@ -1,5 +1,15 @@
 import re
-from .valid_patterns import PHONE_PATTERNS, ALLOWED_CHARS_RE
+from .valid_patterns import (
+    ALLOWED_CHARS_RE,
+    DOUBLE_SPACE_RE,
+    NAME_ALLOWED_CHARS_RE,
+    NAME_BARE_APOSTROPHE_RE,
+    NAME_BARE_HYPHEN_RE,
+    NAME_LAST_FIRST_RE,
+    NON_DIGITS_RE,
+    PHONE_PATTERNS,
+    TEN_DIGITS_RE,
+)
 
 
 def valid_phone_number(number: str) -> tuple[str, bool]:
@@ -20,14 +30,14 @@ def valid_phone_number(number: str) -> tuple[str, bool]:
     if '<' in cleaned_number or '>' in cleaned_number:
         return ("Invalid characters in phone number.", False)
 
-    if re.search(r"\s{2,}", cleaned_number):
+    if DOUBLE_SPACE_RE.search(cleaned_number):
         # disallow double or more spaces
         return ("Invalid spacing in phone number.", False)
 
     if not ALLOWED_CHARS_RE.fullmatch(cleaned_number):
         return ("Invalid characters in phone number.", False)
 
-    if re.fullmatch(r"\d{10}", cleaned_number):
+    if TEN_DIGITS_RE.fullmatch(cleaned_number):
         # raw 10 digits without separators not allowed
         return ("Invalid phone number format.", False)
 
@@ -38,6 +48,27 @@ def valid_phone_number(number: str) -> tuple[str, bool]:
     return (cleaned_number, True)
 
 
+def normalize_phone_number(number: str) -> str:
+    """
+    Reduces a phone number to a canonical digit string for lookups:
+        - Separators, parentheses and a leading '+' are dropped
+        - A leading international '011' prefix is dropped
+        - Ten digits without a '+'/'011' prefix get the NA country code '1'
+
+    e.g. "(703)111-2121", "1 (703) 111-2121" and "+1 703.111.2121" all
+    normalize to "17031112121". Stored numbers keep their original format.
+    """
+    stripped = number.strip()
+    digits = NON_DIGITS_RE.sub("", stripped)
+    if stripped.startswith("011"):
+        return digits[3:]
+    if stripped.startswith("+"):
+        return digits
+    if len(digits) == 10:
+        return "1" + digits
+    return digits
+
+
 def valid_name(name: str) -> tuple[str, bool]:
     """
     Validates a contact name:
@@ -51,7 +82,6 @@ def valid_name(name: str) -> tuple[str, bool]:
         - Max 3 tokens (reject overly long token counts)
     """
     cleaned = name.strip()
-    NAME_ALLOWED_CHARS_RE = re.compile(r"^[A-Za-z\u00C0-\u024F ’'\-.,]+$")
 
     if not cleaned:
         return "Name cannot be empty or whitespace.", False
@@ -61,14 +91,13 @@ def valid_name(name: str) -> tuple[str, bool]:
         return "Invalid characters in name.", False
 
     # No double spaces
-    if re.search(r"\s{2,}", cleaned):
+    if DOUBLE_SPACE_RE.search(cleaned):
         return "Invalid name.", False
 
     # Apostrophes and hyphens must be surrounded by letters
-    letter = r"[A-Za-z\u00C0-\u024F]"
-    if re.search(fr"(?<!{letter})[’']|[’'](?!{letter})", cleaned):
+    if NAME_BARE_APOSTROPHE_RE.search(cleaned):
         return "Invalid Name.", False
-    if re.search(fr"(?<!{letter})-|-(?!{letter})", cleaned):
+    if NAME_BARE_HYPHEN_RE.search(cleaned):
         return "Invalid Name.", False
 
     # If there is a comma, enforce “Last, First …”
@@ -76,7 +105,7 @@ def valid_name(name: str) -> tuple[str, bool]:
         if cleaned.count(",") != 1:
             return "Invalid Name.", False
         # Must be "something, space something"
-        if not re.fullmatch(fr"{letter}[A-Za-z\u00C0-\u024F ’'\-]*, {letter}[A-Za-z\u00C0-\u024F ’'\-\.]*", cleaned):
+        if not NAME_LAST_FIRST_RE.fullmatch(cleaned):
             return "Invalid Name.", False
 
     # Dots must be used only for initials (single letter followed by dot, then end or space)
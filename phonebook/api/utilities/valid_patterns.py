@@ -3,6 +3,15 @@ import re
 # Accept only these characters up-front (rejects slashes/XSS/etc.)
 ALLOWED_CHARS_RE = re.compile(r"^[0-9()+.\- ]+$")
 
+# Raw 10 digits without separators are rejected
+TEN_DIGITS_RE = re.compile(r"^\d{10}$")
+
+# Everything but digits, stripped when normalizing numbers
+NON_DIGITS_RE = re.compile(r"\D")
+
+# Two or more consecutive whitespace characters
+DOUBLE_SPACE_RE = re.compile(r"\s{2,}")
+
 # Union of accepted phone formats
 PHONE_PATTERNS = [
     # 1) Internal 5-digit extension: 12345
@@ -35,3 +44,12 @@ ATTACKER_REGEX = re.compile(
     r"\b(SELECT|INSERT|UPDATE|DELETE|DROP|ALTER|CREATE|EXEC|UNION)\b|--|;",
     re.IGNORECASE,
 )
+
+# Name validation (see valid_name)
+_LETTER = r"[A-Za-z\u00C0-\u024F]"
+NAME_ALLOWED_CHARS_RE = re.compile(r"^[A-Za-z\u00C0-\u024F ’'\-.,]+$")
+# Apostrophes and hyphens must be surrounded by letters
+NAME_BARE_APOSTROPHE_RE = re.compile(fr"(?<!{_LETTER})[’']|[’'](?!{_LETTER})")
+NAME_BARE_HYPHEN_RE = re.compile(fr"(?<!{_LETTER})-|-(?!{_LETTER})")
+# “Last, First …” form
+NAME_LAST_FIRST_RE = re.compile(fr"{_LETTER}[A-Za-z\u00C0-\u024F ’'\-]*, {_LETTER}[A-Za-z\u00C0-\u024F ’'\-\.]*")
@@ -0,0 +1,51 @@
+import gc
+import tracemalloc
+
+from django.core.management.base import BaseCommand, CommandError
+
+from phonebook.services.contact_index import ContactIndex
+
+
+def synthetic_rows(count: int):
+    """
+    Yields (id, name, phone_number) rows shaped like real contacts.
+    """
+    for i in range(1, count + 1):
+        yield i, f"Contact Person{i:07d}", f"({200 + i % 800}) {i // 10_000 % 1000:03d}-{i % 10_000:04d}"
+
+
+class Command(BaseCommand):
+    help = "Measures the in-memory contact index footprint and reports it per million contacts."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--contacts', type=int, default=100_000,
+            help="Synthetic contacts to index (default: 100000).")
+        parser.add_argument(
+            '--from-db', action='store_true',
+            help="Index the contacts in the database instead of synthetic rows.")
+
+    def handle(self, *args, **options):
+        index = ContactIndex()
+        gc.collect()
+        tracemalloc.start()
+        try:
+            if options['from_db']:
+                index.refresh()
+            else:
+                if options['contacts'] < 1:
+                    raise CommandError("--contacts must be a positive integer.")
+                index.load(synthetic_rows(options['contacts']))
+            gc.collect()
+            used, _ = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        size = len(index)
+        if not size:
+            raise CommandError("No contacts to index.")
+
+        per_contact = used / size
+        self.stdout.write(
+            f"{size} contacts: {used / 2**20:.1f} MiB, {per_contact:.0f} bytes/contact, "
+            f"{per_contact * 1_000_000 / 2**20:.0f} MiB per million contacts")
@@ -0,0 +1,65 @@
+import gzip
+import io
+import sys
+from contextlib import contextmanager
+from django.core.management.base import BaseCommand, CommandError
+
+from phonebook.services import ExportService
+from phonebook.services.export_service import EXPORT_FORMATS
+
+
+class Command(BaseCommand):
+    help = "Streams every contact to a CSV or NDJSON file (or stdout)."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--format', choices=EXPORT_FORMATS, default='csv',
+            help="Output format (default: csv).")
+        parser.add_argument(
+            '--output', '-o', default='-',
+            help="Destination file path, or '-' for stdout (default).")
+        parser.add_argument(
+            '--gzip', action='store_true',
+            help="Gzip-compress the output. Implied by a '.gz' output path.")
+        parser.add_argument(
+            '--chunk-size', type=int, default=2000,
+            help="Rows fetched from the database per round trip.")
+
+    @contextmanager
+    def _open(self, path: str, compress: bool):
+        if path == '-':
+            if not compress:
+                yield self.stdout
+                return
+            gz = gzip.GzipFile(fileobj=sys.stdout.buffer, mode='wb')
+            stream = io.TextIOWrapper(gz, encoding='utf-8', newline='')
+            try:
+                yield stream
+            finally:
+                stream.close()
+            return
+
+        try:
+            if compress:
+                stream = gzip.open(path, 'wt', encoding='utf-8', newline='')
+            else:
+                stream = open(path, 'w', encoding='utf-8', newline='')
+        except OSError as e:
+            raise CommandError(f"Cannot open {path}: {e}")
+        with stream:
+            yield stream
+
+    def handle(self, *args, **options):
+        if options['chunk_size'] < 1:
+            raise CommandError("--chunk-size must be a positive integer.")
+
+        path = options['output']
+        compress = options['gzip'] or path.endswith('.gz')
+        service = ExportService(chunk_size=options['chunk_size'])
+
+        with self._open(path, compress) as stream:
+            count = service.write(stream, options['format'])
+
+        if path != '-':
+            self.stdout.write(self.style.SUCCESS(
+                f"Exported {count} contacts to {path}."))
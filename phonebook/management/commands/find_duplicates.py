@@ -0,0 +1,54 @@
+import json
+from django.core.management.base import BaseCommand, CommandError
+from django.core.serializers.json import DjangoJSONEncoder
+
+from phonebook.services import DuplicateService
+
+
+class Command(BaseCommand):
+    help = "Reports contacts duplicated up to name case/whitespace or number formatting, optionally merging them."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--merge', action='store_true',
+            help="Remove each group's duplicates, keeping one contact (groups with conflicting numbers are skipped).")
+        parser.add_argument(
+            '--batch-size', type=int, default=500,
+            help="Contacts removed per transaction with --merge.")
+        parser.add_argument(
+            '--format', choices=['text', 'json'], default='text',
+            help="Report format (default text).")
+        parser.add_argument(
+            '--limit', type=int, default=None,
+            help="Print at most this many groups (all are merged).")
+
+    def handle(self, *args, **options):
+        if options['batch_size'] < 1 or (options['limit'] is not None and options['limit'] < 0):
+            raise CommandError("--batch-size must be >= 1 and --limit >= 0.")
+
+        service = DuplicateService()
+        groups = service.find()
+        shown = groups[:options['limit']] if options['limit'] is not None else groups
+
+        if options['format'] == 'json':
+            self.stdout.write(json.dumps(shown, cls=DjangoJSONEncoder, indent=2))
+        else:
+            for group in shown:
+                self.stdout.write(self._describe(group))
+
+        conflicts = sum(group['conflict'] for group in groups)
+        duplicates = sum(len(group['duplicates']) for group in groups)
+        summary = f"Found {len(groups)} duplicate groups ({duplicates} duplicates, {conflicts} with conflicting numbers)."
+        if options['merge']:
+            removed = service.merge(groups, batch_size=options['batch_size'])
+            summary += f" Removed {removed} contacts."
+        # the JSON report goes to stdout on its own; keep it parseable
+        (self.stderr if options['format'] == 'json' else self.stdout).write(self.style.SUCCESS(summary))
+
+    def _describe(self, group: dict) -> str:
+        keep = group['keep']
+        lines = [f"keep {keep['name']!r} {keep['phone_number'] or '-'} (id {keep['id']}, {keep['database']})"
+                 f" [{', '.join(group['reasons'])}{', conflict' if group['conflict'] else ''}]"]
+        lines += [f"  dup {c['name']!r} {c['phone_number'] or '-'} (id {c['id']}, {c['database']})"
+                  for c in group['duplicates']]
+        return '\n'.join(lines)
@@ -0,0 +1,25 @@
+from django.core.exceptions import ImproperlyConfigured
+from django.core.management.base import BaseCommand, CommandError
+from django.db import IntegrityError
+
+from phonebook.services import ContactService
+
+
+class Command(BaseCommand):
+    help = "Moves the contacts in the default database onto the CONTACT_SHARDS shards, in batches."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size', type=int, default=5000,
+            help="Contacts moved per batch.")
+
+    def handle(self, *args, **options):
+        if options['batch_size'] < 1:
+            raise CommandError("--batch-size must be >= 1.")
+
+        try:
+            moved = ContactService().move_to_shards(batch_size=options['batch_size'])
+        except (ImproperlyConfigured, IntegrityError) as e:
+            raise CommandError(str(e))
+
+        self.stdout.write(self.style.SUCCESS(f"Moved {moved} contacts to the shards."))
@@ -0,0 +1,113 @@
+import os
+import subprocess
+import sys
+from collections import defaultdict
+from typing import NamedTuple
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+# What a fresh worker runs before it can take traffic, cumulatively per stage
+STAGES = {
+    'settings': "from django.conf import settings; settings.INSTALLED_APPS",
+    'setup': "import django; django.setup()",
+    'app': (
+        "from django.core.wsgi import get_wsgi_application; get_wsgi_application(); "
+        "from django.urls import get_resolver; get_resolver().url_patterns"
+    ),
+}
+
+SCRIPT = """\
+import time
+start = time.perf_counter()
+{code}
+print(time.perf_counter() - start)
+"""
+
+
+class ImportTiming(NamedTuple):
+    module: str
+    self_us: int
+    cumulative_us: int
+
+
+def parse_importtime(output: str) -> list[ImportTiming]:
+    """
+    Parses the `-X importtime` report written to stderr.
+    Lines look like: `import time:   self [us] | cumulative | <indent>module`.
+    """
+    timings = []
+    for line in output.splitlines():
+        if not line.startswith('import time:'):
+            continue
+        fields = line[len('import time:'):].split('|')
+        if len(fields) != 3 or not fields[0].strip().isdigit():
+            continue  # header line
+        timings.append(ImportTiming(
+            module=fields[2].strip(),
+            self_us=int(fields[0]),
+            cumulative_us=int(fields[1]),
+        ))
+    return timings
+
+
+def package_totals(timings: list[ImportTiming]) -> dict[str, int]:
+    """
+    Sums self time per top-level package, largest first.
+    """
+    totals: dict[str, int] = defaultdict(int)
+    for timing in timings:
+        totals[timing.module.partition('.')[0]] += timing.self_us
+    return dict(sorted(totals.items(), key=lambda item: item[1], reverse=True))
+
+
+class Command(BaseCommand):
+    help = "Reports where a fresh worker spends its import time before it can serve requests."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--stage', choices=STAGES, default='app',
+            help="How far to boot: settings import, django.setup(), or WSGI app plus URLconf (default).")
+        parser.add_argument(
+            '--settings-module', default=os.environ.get('DJANGO_SETTINGS_MODULE', 'config.settings'),
+            help="Settings profile to boot (default: the current one).")
+        parser.add_argument(
+            '--top', type=int, default=15,
+            help="Number of modules and packages to list.")
+        parser.add_argument(
+            '--budget-ms', type=float,
+            help="Fail if boot takes longer than this many milliseconds.")
+
+    def handle(self, *args, **options):
+        stages = list(STAGES)
+        code = '\n'.join(STAGES[s] for s in stages[:stages.index(options['stage']) + 1])
+        env = {**os.environ, 'DJANGO_SETTINGS_MODULE': options['settings_module']}
+
+        result = subprocess.run(
+            [sys.executable, '-X', 'importtime', '-c', SCRIPT.format(code=code)],
+            env=env, capture_output=True, text=True, cwd=settings.BASE_DIR,
+        )
+        if result.returncode != 0:
+            raise CommandError(f"Worker boot failed:\n{result.stderr.strip().splitlines()[-1]}")
+
+        elapsed_ms = float(result.stdout.strip().splitlines()[-1]) * 1000
+        timings = parse_importtime(result.stderr)
+        top = options['top']
+
+        self.stdout.write(
+            f"{options['settings_module']} ({options['stage']}): {elapsed_ms:.1f} ms, "
+            f"{len(timings)} modules imported")
+
+        self.stdout.write("\nSlowest modules (cumulative ms):")
+        for timing in sorted(timings, key=lambda t: t.cumulative_us, reverse=True)[:top]:
+            self.stdout.write(f"  {timing.cumulative_us / 1000:8.1f}  {timing.module}")
+
+        self.stdout.write("\nSelf time per package (ms):")
+        for package, self_us in list(package_totals(timings).items())[:top]:
+            self.stdout.write(f"  {self_us / 1000:8.1f}  {package}")
+
+        budget = options['budget_ms']
+        if budget is not None:
+            if elapsed_ms > budget:
+                raise CommandError(f"Boot took {elapsed_ms:.1f} ms, over the {budget:.0f} ms budget.")
+            self.stdout.write(self.style.SUCCESS(f"\nWithin the {budget:.0f} ms budget."))
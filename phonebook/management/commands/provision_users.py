@@ -0,0 +1,66 @@
+import contextlib
+import csv
+import sys
+from django.core.management.base import BaseCommand, CommandError
+
+from phonebook.api.signup.serializers import ProvisionUserInputSerializer
+from phonebook.services import ProvisioningError, ProvisioningService
+from phonebook.services.hashing_service import hash_passwords_parallel
+
+
+class Command(BaseCommand):
+    help = (
+        "Creates users in bulk from a CSV file with the columns "
+        "username,password[,first_name,last_name,groups]. "
+        "'groups' is a ';'-separated list of reader/writer (default: reader)."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('path', help="CSV file to read, or '-' for stdin.")
+        parser.add_argument(
+            '--batch-size', type=int, default=500,
+            help="Rows per INSERT statement.")
+
+    def _read_rows(self, path: str) -> list[dict]:
+        try:
+            # stdin is not ours to close
+            fh = contextlib.nullcontext(sys.stdin) if path == '-' else open(path, newline='', encoding='utf-8')
+        except OSError as e:
+            raise CommandError(f"Cannot open {path}: {e}")
+
+        with fh as lines:
+            rows = []
+            for row in csv.DictReader(lines):
+                groups = [g.strip() for g in (row.pop('groups', None) or '').split(';') if g.strip()]
+                entry = {k: v for k, v in row.items() if v}
+                if groups:
+                    entry['groups'] = groups
+                rows.append(entry)
+        return rows
+
+    def _fail(self, errors: dict[int, dict]) -> None:
+        for i, field_errors in sorted(errors.items()):
+            for field, messages in field_errors.items():
+                # +2: 1-based line numbers plus the header line
+                self.stderr.write(f"line {i + 2}: {field}: {' '.join(map(str, messages))}")
+        raise CommandError(f"{len(errors)} invalid rows; no users were created.")
+
+    def handle(self, *args, **options):
+        rows = self._read_rows(options['path'])
+        if not rows:
+            raise CommandError("No users to provision.")
+
+        serializer = ProvisionUserInputSerializer(data=rows, many=True)
+        if not serializer.is_valid():
+            self._fail({i: e for i, e in enumerate(serializer.errors) if e})
+
+        service = ProvisioningService()
+        try:
+            users = service.provision_users(
+                list(serializer.validated_data), batch_size=options['batch_size'],
+                # offline: hash on every core rather than the request-serving pool
+                hash_passwords=hash_passwords_parallel)
+        except ProvisioningError as e:
+            self._fail(e.errors)
+
+        self.stdout.write(self.style.SUCCESS(f"Provisioned {len(users)} users."))
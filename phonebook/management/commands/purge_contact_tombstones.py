@@ -0,0 +1,26 @@
+from datetime import timedelta
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from phonebook.services import ContactService
+
+
+class Command(BaseCommand):
+    help = "Hard-deletes soft-deleted contacts older than the tombstone retention, in batches."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--older-than', type=int, default=settings.CONTACT_TOMBSTONE_RETENTION,
+            help="Purge tombstones older than this many seconds (default: CONTACT_TOMBSTONE_RETENTION).")
+        parser.add_argument(
+            '--batch-size', type=int, default=5000,
+            help="Contacts deleted per transaction.")
+
+    def handle(self, *args, **options):
+        if options['older_than'] < 0 or options['batch_size'] < 1:
+            raise CommandError("--older-than must be >= 0 and --batch-size >= 1.")
+
+        purged = ContactService().purge_tombstones(
+            timedelta(seconds=options['older_than']), batch_size=options['batch_size'])
+
+        self.stdout.write(self.style.SUCCESS(f"Purged {purged} contact tombstones."))
@@ -0,0 +1,70 @@
+import multiprocessing
+import signal
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections
+
+from phonebook.services import JobWorker
+from phonebook.services.job_service import job_kinds
+
+
+def work(kinds: list[str] | None, burst: bool, max_jobs: int | None) -> int:
+    """
+    Runs one JobWorker on this process until SIGTERM/SIGINT, finishing the
+    job in hand first.
+    """
+    worker = JobWorker(kinds=kinds)
+    previous = {signum: signal.signal(signum, lambda *_: worker.stop())
+                for signum in (signal.SIGTERM, signal.SIGINT)}
+    try:
+        return worker.run(burst=burst, max_jobs=max_jobs)
+    finally:
+        for signum, handler in previous.items():
+            signal.signal(signum, handler)
+
+
+class Command(BaseCommand):
+    help = "Runs background job workers: one process claims and runs one job at a time."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--processes', '-p', type=int, default=1,
+            help="Worker processes to run (default 1, in this process).")
+        parser.add_argument(
+            '--kinds', default='',
+            help="Comma-separated job kinds to run (default: all).")
+        parser.add_argument(
+            '--burst', action='store_true',
+            help="Exit once no job is due instead of polling.")
+        parser.add_argument(
+            '--max-jobs', type=int, default=None,
+            help="Exit after running this many jobs (per process).")
+
+    def handle(self, *args, **options):
+        kinds = [kind.strip() for kind in options['kinds'].split(',') if kind.strip()] or None
+        unknown = set(kinds or ()) - set(job_kinds())
+        if unknown:
+            raise CommandError(
+                f"Unknown job kind(s): {', '.join(sorted(unknown))}. Choose from: {', '.join(job_kinds())}.")
+        processes = options['processes']
+        if processes < 1:
+            raise CommandError("--processes must be >= 1.")
+        worker_args = (kinds, options['burst'], options['max_jobs'])
+
+        if processes == 1:
+            ran = work(*worker_args)
+            self.stdout.write(self.style.SUCCESS(f"Ran {ran} jobs."))
+            return
+
+        # children must open their own connections, not share the parent's sockets
+        connections.close_all()
+        context = multiprocessing.get_context('fork')
+        pool = [context.Process(target=work, args=worker_args, name=f'phonebook-worker-{i}')
+                for i in range(processes)]
+        for process in pool:
+            process.start()
+        # Ctrl-C reaches the whole process group; each child stops after its current job
+        signal.signal(signal.SIGTERM, lambda *_: [p.terminate() for p in pool if p.is_alive()])
+        signal.signal(signal.SIGINT, signal.SIG_IGN)
+        for process in pool:
+            process.join()
+        self.stdout.write(self.style.SUCCESS(f"{processes} worker processes exited."))
@@ -0,0 +1,31 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from phonebook.services.contact_cache import contact_cache_is_shared
+from phonebook.services.contact_snapshot import write_snapshot
+
+
+class Command(BaseCommand):
+    help = "Writes and publishes the memory-mapped contact snapshot shared by every worker."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--output', '-o', default=settings.CONTACT_SNAPSHOT_PATH,
+            help="Snapshot file (default: CONTACT_SNAPSHOT_PATH).")
+
+    def handle(self, *args, **options):
+        path = options['output']
+        if not path:
+            raise CommandError("Set CONTACT_SNAPSHOT_PATH or pass --output.")
+        # the generation is published through the cache; this process's own memory reaches no worker
+        if not contact_cache_is_shared():
+            raise CommandError("write_contact_snapshot needs a shared CACHE_URL; "
+                               "per-process memory is not seen by other workers.")
+
+        try:
+            count, generation = write_snapshot(path)
+        except OSError as e:
+            raise CommandError(f"Cannot write {path}: {e}")
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Wrote {count} contacts (generation {generation}) to {path}."))
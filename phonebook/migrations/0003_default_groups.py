@@ -0,0 +1,21 @@
+from django.db import migrations
+
+DEFAULT_GROUPS = ('reader', 'writer')
+
+
+def create_default_groups(apps, schema_editor):
+    Group = apps.get_model('auth', 'Group')
+    for name in DEFAULT_GROUPS:
+        Group.objects.get_or_create(name=name)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('auth', '0012_alter_user_first_name_max_length'),
+        ('phonebook', '0002_remove_phonenumber_is_primary_and_more'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_default_groups, migrations.RunPython.noop),
+    ]
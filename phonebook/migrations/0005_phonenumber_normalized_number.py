@@ -0,0 +1,40 @@
+# Generated by Django 4.2.25 on 2026-10-19 12:47
+
+from django.db import migrations, models
+
+from phonebook.api.utilities import normalize_phone_number
+
+BATCH_SIZE = 2000
+
+
+def backfill_normalized_numbers(apps, schema_editor):
+    PhoneNumber = apps.get_model('phonebook', 'PhoneNumber')
+    numbers = PhoneNumber.objects.using(schema_editor.connection.alias)
+    batch = []
+    for pn in numbers.only('id', 'phone_number').iterator(chunk_size=BATCH_SIZE):
+        pn.normalized_number = normalize_phone_number(pn.phone_number)
+        batch.append(pn)
+        if len(batch) == BATCH_SIZE:
+            numbers.bulk_update(batch, ['normalized_number'])
+            batch = []
+    if batch:
+        numbers.bulk_update(batch, ['normalized_number'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('phonebook', '0004_revokedtoken'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='phonenumber',
+            name='normalized_number',
+            field=models.CharField(db_index=True, default='', max_length=50),
+        ),
+        # model_name lets the shard router run the backfill on contact shards too
+        migrations.RunPython(
+            backfill_normalized_numbers, migrations.RunPython.noop,
+            hints={'model_name': 'phonenumber'}),
+    ]
@@ -0,0 +1,52 @@
+# Generated by Django 4.2.25 on 2026-10-19 13:17
+
+from django.db import connections, migrations, models
+import django.utils.timezone
+
+from phonebook.services.sharding import contact_databases, is_shard_alias, shard_for_number
+
+
+def claim_existing_numbers(apps, schema_editor):
+    """
+    Claims, on the shard being migrated, the numbers it owns among the
+    live contacts already spread over the shards.
+    """
+    target = schema_editor.connection.alias
+    if not is_shard_alias(target):
+        return
+    PhoneNumber = apps.get_model('phonebook', 'PhoneNumber')
+    PhoneNumberClaim = apps.get_model('phonebook', 'PhoneNumberClaim')
+    for alias in contact_databases():
+        # shards are migrated one by one; one not migrated yet may still be empty
+        if 'phonebook_phonenumber' not in connections[alias].introspection.table_names():
+            continue
+        rows = (PhoneNumber.objects.using(alias)
+                .filter(contact__deleted_at__isnull=True)
+                .values_list('phone_number', 'contact__full_name')
+                .iterator(chunk_size=5000))
+        PhoneNumberClaim.objects.using(target).bulk_create(
+            (PhoneNumberClaim(phone_number=number, full_name=name)
+             for number, name in rows if shard_for_number(number) == target),
+            batch_size=5000, ignore_conflicts=True)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('phonebook', '0008_job'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PhoneNumberClaim',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('phone_number', models.CharField(max_length=50, unique=True)),
+                ('full_name', models.CharField(max_length=255)),
+                ('claimed_at', models.DateTimeField(default=django.utils.timezone.now)),
+            ],
+        ),
+        migrations.RunPython(
+            claim_existing_numbers, migrations.RunPython.noop,
+            hints={'model_name': 'phonenumberclaim'}),
+    ]
@@ -1,27 +1,138 @@
+from django.conf import settings
 from django.db import models
+from django.utils import timezone
 from typing import TYPE_CHECKING
 
 # Create your models here.
 
 
+class ActiveContactManager(models.Manager):
+    """
+    Default Contact manager: hides soft-deleted (tombstoned) contacts.
+    """
+
+    def get_queryset(self):
+        return super().get_queryset().filter(deleted_at__isnull=True)
+
+
+class ActivePhoneNumberManager(models.Manager):
+    """
+    Default PhoneNumber manager: hides the numbers of tombstoned contacts.
+    """
+
+    def get_queryset(self):
+        return super().get_queryset().filter(contact__deleted_at__isnull=True)
+
+
 class Contact(models.Model):
     full_name = models.CharField(max_length=255, unique=True)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
+    # set instead of deleting the row when CONTACT_SOFT_DELETE is on
+    deleted_at = models.DateTimeField(null=True, blank=True)
+
+    objects = ActiveContactManager()
+    all_objects = models.Manager()
 
     if TYPE_CHECKING:
         phone_number: 'PhoneNumber | None'
 
+    class Meta:
+        # back the list filters/orderings; id breaks ties deterministically.
+        # Partial on the default manager's filter, so tombstones stay out of them
+        # and the tombstone index only covers tombstones (purge, sync).
+        indexes = [
+            models.Index(fields=['created_at', 'id'], name='contact_created_idx',
+                         condition=models.Q(deleted_at__isnull=True)),
+            models.Index(fields=['updated_at', 'id'], name='contact_updated_idx',
+                         condition=models.Q(deleted_at__isnull=True)),
+            models.Index(fields=['deleted_at'], name='contact_deleted_idx',
+                         condition=models.Q(deleted_at__isnull=False)),
+        ]
+
     def __str__(self):
         return self.full_name
 
 
 class PhoneNumber(models.Model):
     phone_number = models.CharField(max_length=50, unique=True)
+    # digits-only form from normalize_phone_number, for reverse lookups
+    normalized_number = models.CharField(max_length=50, db_index=True, default='')
     contact = models.OneToOneField(
         Contact, related_name='phone_number', on_delete=models.CASCADE)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = ActivePhoneNumberManager()
+    all_objects = models.Manager()
+
     def __str__(self):
         return self.phone_number
+
+
+class PhoneNumberClaim(models.Model):
+    """
+    With CONTACT_SHARDS, reserves a phone number across every shard.
+
+    Contacts are placed by name, so two contacts with the same number can
+    land on different shards, where the per-shard unique constraint on
+    phone_number cannot see both. The table is split across the shards by
+    shard_for_number, so a claim adds no write to the default database.
+    """
+
+    phone_number = models.CharField(max_length=50, unique=True)
+    full_name = models.CharField(max_length=255)
+    claimed_at = models.DateTimeField(default=timezone.now)
+
+    def __str__(self):
+        return f'{self.phone_number} ({self.full_name})'
+
+
+class RevokedToken(models.Model):
+    jti = models.CharField(max_length=255, unique=True)
+    expires_at = models.DateTimeField(db_index=True)
+    created_at = models.DateTimeField(auto_now_add=True, db_index=True)
+
+    def __str__(self):
+        return self.jti
+
+
+class Job(models.Model):
+    """
+    A unit of background work, claimed and run by `manage.py run_worker`.
+    """
+
+    class Status(models.TextChoices):
+        QUEUED = 'queued'
+        RUNNING = 'running'
+        SUCCEEDED = 'succeeded'
+        FAILED = 'failed'
+
+    kind = models.CharField(max_length=100)
+    payload = models.JSONField(default=dict)
+    status = models.CharField(max_length=20, choices=Status.choices, default=Status.QUEUED)
+    # not claimed before this time; retries are pushed back by the backoff
+    run_at = models.DateTimeField(default=timezone.now)
+    attempts = models.PositiveIntegerField(default=0)
+    max_attempts = models.PositiveIntegerField(default=5)
+    # the worker holding the job, until lease_expires_at; an expired lease can be reclaimed
+    lease_owner = models.CharField(max_length=100, blank=True, default='')
+    lease_expires_at = models.DateTimeField(null=True, blank=True)
+    progress = models.FloatField(default=0.0)
+    result = models.JSONField(null=True, blank=True)
+    error = models.TextField(blank=True, default='')
+    created_by = models.ForeignKey(
+        settings.AUTH_USER_MODEL, null=True, blank=True, related_name='+', on_delete=models.SET_NULL)
+    created_at = models.DateTimeField(auto_now_add=True)
+    started_at = models.DateTimeField(null=True, blank=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        indexes = [
+            # the claim query: due queued jobs, then running jobs with expired leases
+            models.Index(fields=['status', 'run_at'], name='job_claim_idx'),
+            models.Index(fields=['status', 'lease_expires_at'], name='job_lease_idx'),
+        ]
+
+    def __str__(self):
+        return f'{self.kind}#{self.pk} ({self.status})'
@@ -1,7 +1,49 @@
 from .contact_services import (
+    CONTACT_FIELDS,
+    CONTACT_FILTERS,
+    CONTACT_ORDERINGS,
+    DEFAULT_CONTACT_FIELDS,
     ContactService,
 )
 
 from .signup_service import (
     SignUpService,
+    UsernameTakenError,
 )
+
+from .export_service import (
+    ExportService,
+)
+
+from .contact_cache import (
+    ContactListCache,
+    bump_contacts_generation,
+    get_contacts_generation,
+)
+
+from .provisioning_service import (
+    ProvisioningError,
+    ProvisioningService,
+)
+
+from .revocation_service import (
+    TokenRevocationService,
+)
+
+from .lookup_service import (
+    LookupService,
+)
+
+from .duplicate_service import (
+    DuplicateService,
+)
+
+from .job_service import (
+    JobService,
+    JobWorker,
+    PermanentJobError,
+    job_handler,
+)
+
+# registers the built-in job kinds
+from . import job_handlers  # noqa: E402,F401
@@ -0,0 +1,68 @@
+from django.conf import settings
+from django.core.cache import caches
+from django.core.cache.backends.dummy import DummyCache
+from django.core.cache.backends.locmem import LocMemCache
+
+GENERATION_KEY = 'phonebook:contacts:generation'
+
+
+def _cache():
+    return caches[getattr(settings, 'CONTACT_CACHE_ALIAS', 'default')]
+
+
+def contact_cache_is_shared() -> bool:
+    """
+    Whether the contact cache (generation, list payloads, snapshot publish
+    key) is visible to other processes, i.e. not per-process memory.
+    """
+    return not isinstance(_cache(), (LocMemCache, DummyCache))
+
+
+def get_contacts_generation() -> int:
+    """
+    Returns the current write generation of the contact book.
+    Every contact write bumps it, which invalidates cached reads.
+    """
+    return _cache().get_or_set(GENERATION_KEY, 0, timeout=None)
+
+
+def bump_contacts_generation() -> int:
+    """
+    Advances the write generation after a contact write.
+    """
+    cache = _cache()
+    try:
+        return cache.incr(GENERATION_KEY)
+    except ValueError:
+        cache.add(GENERATION_KEY, 0, timeout=None)
+        return cache.incr(GENERATION_KEY)
+
+
+class ContactListCache:
+    """
+    Caches rendered contact list payloads per media type.
+
+    Each entry holds the raw body plus any compressed variants, and is keyed
+    by the write generation read when the cache object is created, so a write
+    anywhere makes every older entry unreachable.
+    """
+
+    def __init__(self):
+        self.ttl = getattr(settings, 'CONTACT_LIST_CACHE_TTL', 0)
+        self.generation = get_contacts_generation() if self.enabled else 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl > 0
+
+    def _key(self, variant: str) -> str:
+        return f'phonebook:contacts:list:{self.generation}:{variant}'
+
+    def get(self, variant: str) -> dict[str, bytes] | None:
+        if not self.enabled:
+            return None
+        return _cache().get(self._key(variant))
+
+    def set(self, variant: str, payload: dict[str, bytes]) -> None:
+        if self.enabled:
+            _cache().set(self._key(variant), payload, timeout=self.ttl)
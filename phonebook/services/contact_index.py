@@ -0,0 +1,171 @@
+import threading
+import structlog
+from datetime import timedelta
+from django.conf import settings
+from django.db.models import Q
+from django.utils import timezone
+
+from phonebook.api.utilities import normalize_phone_number
+from phonebook.models import Contact
+from .contact_cache import get_contacts_generation
+
+logger = structlog.get_logger(__name__)
+
+# rows committed slightly out of order are picked up by re-reading this overlap
+REFRESH_OVERLAP = timedelta(seconds=5)
+
+
+class ContactRecord:
+    """
+    One indexed contact. __slots__ keeps it to the stored fields; the
+    normalized number only lives as a key of the number map.
+    """
+
+    __slots__ = ('id', 'name', 'phone_number')
+
+    def __init__(self, id: int, name: str, phone_number: str | None):
+        self.id = id
+        self.name = name
+        self.phone_number = phone_number
+
+    @property
+    def normalized(self) -> str | None:
+        return normalize_phone_number(self.phone_number) if self.phone_number else None
+
+
+class ContactIndex:
+    """
+    Per-worker in-memory index of contacts by name and normalized number.
+
+    It loads on first use and checks the shared write generation on every
+    lookup. When the generation moved, rows created (or whose number
+    changed, or were tombstoned) since the last refresh are pulled
+    incrementally. Contacts this worker deletes are dropped from the index
+    directly; a row count that no longer matches means contacts were
+    hard-deleted elsewhere, which triggers a full reload. Sharing the
+    generation across processes needs a shared CACHE_URL.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._records: dict[int, ContactRecord] = {}
+        self._by_name: dict[str, int] = {}
+        self._by_number: dict[str, int] = {}
+        self._generation: int | None = None
+        self._max_id = 0
+        self._seen_until = None
+
+    @property
+    def enabled(self) -> bool:
+        return getattr(settings, 'CONTACT_INDEX_ENABLED', False)
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def _rows(self, queryset):
+        return queryset.values_list('id', 'full_name', 'phone_number__phone_number').iterator(chunk_size=5000)
+
+    def _unlink(self, by_name, by_number, record: ContactRecord) -> None:
+        if by_name.get(record.name) == record.id:
+            del by_name[record.name]
+        normalized = record.normalized
+        if normalized and by_number.get(normalized) == record.id:
+            del by_number[normalized]
+
+    def _add(self, records, by_name, by_number, record: ContactRecord) -> None:
+        previous = records.get(record.id)
+        if previous is not None:
+            self._unlink(by_name, by_number, previous)
+        records[record.id] = record
+        by_name[record.name] = record.id
+        normalized = record.normalized
+        if normalized:
+            # the first contact keeps a normalized number shared by several formats
+            by_number.setdefault(normalized, record.id)
+
+    def load(self, rows) -> None:
+        """
+        Replaces the index contents with (id, name, phone_number) rows.
+        """
+        records: dict[int, ContactRecord] = {}
+        by_name: dict[str, int] = {}
+        by_number: dict[str, int] = {}
+        for row in rows:
+            self._add(records, by_name, by_number, ContactRecord(*row))
+
+        self._records, self._by_name, self._by_number = records, by_name, by_number
+        self._max_id = max(records, default=0)
+
+    def _reload(self) -> None:
+        started = timezone.now()
+        self.load(self._rows(Contact.objects.all()))
+        self._seen_until = started
+        logger.info('contact_index.loaded', size=len(self._records))
+
+    def _top_up(self) -> None:
+        started = timezone.now()
+        since = self._seen_until - REFRESH_OVERLAP
+        # all_objects: contacts tombstoned since the last refresh are evicted here
+        changed = Contact.all_objects.filter(
+            Q(id__gt=self._max_id) | Q(updated_at__gte=since) | Q(phone_number__updated_at__gte=since))
+        rows = changed.values_list('id', 'full_name', 'phone_number__phone_number', 'deleted_at')
+        for *row, deleted_at in rows.iterator(chunk_size=5000):
+            if deleted_at is None:
+                self._add(self._records, self._by_name, self._by_number, ContactRecord(*row))
+            elif (record := self._records.pop(row[0], None)) is not None:
+                self._unlink(self._by_name, self._by_number, record)
+        self._max_id = max(self._records, default=0)
+        self._seen_until = started
+
+        if Contact.objects.count() != len(self._records):
+            self._reload()
+
+    def discard(self, ids) -> None:
+        """
+        Drops the contacts with the given ids, deleted by this worker, so
+        the next top-up's row count still matches.
+        """
+        with self._lock:
+            for contact_id in ids:
+                if (record := self._records.pop(contact_id, None)) is not None:
+                    self._unlink(self._by_name, self._by_number, record)
+
+    def refresh(self) -> None:
+        """
+        Brings the index up to the current write generation.
+        """
+        generation = get_contacts_generation()
+        if generation == self._generation:
+            return
+        with self._lock:
+            if generation == self._generation:
+                return
+            if self._generation is None:
+                self._reload()
+            else:
+                self._top_up()
+            self._generation = generation
+
+    def get_by_name(self, name: str) -> ContactRecord | None:
+        self.refresh()
+        contact_id = self._by_name.get(name)
+        return None if contact_id is None else self._records.get(contact_id)
+
+    def get_by_number(self, phone_number: str) -> ContactRecord | None:
+        """
+        Returns the contact whose number normalizes like `phone_number`,
+        which may be stored in a different format.
+        """
+        self.refresh()
+        contact_id = self._by_number.get(normalize_phone_number(phone_number))
+        return None if contact_id is None else self._records.get(contact_id)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._records, self._by_name, self._by_number = {}, {}, {}
+            self._generation = None
+            self._max_id = 0
+            self._seen_until = None
+
+
+contact_index = ContactIndex()
@@ -1,16 +1,65 @@
+import heapq
 import structlog
-from django.core.exceptions import ObjectDoesNotExist
-from django.shortcuts import get_object_or_404
+from collections import defaultdict
+from datetime import timedelta
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.db import DEFAULT_DB_ALIAS, IntegrityError, transaction
+from django.db.models import Q
+from django.http import Http404
+from django.utils import timezone
 
-from phonebook.models import Contact, PhoneNumber
+from phonebook.api.utilities import normalize_phone_number
+from phonebook.models import Contact, PhoneNumber, PhoneNumberClaim
+from .contact_cache import bump_contacts_generation
+from .contact_index import contact_index
+from .contact_snapshot import snapshot_reader
+from .group_commit import group_commit
+from .sharding import contact_databases, shard_count, shard_for_name, shard_for_number
 
 logger = structlog.get_logger(__name__)
 
+# a sharded number claim whose contact is missing this long after it was made is orphaned
+CLAIM_GRACE = timedelta(seconds=60)
+
+# output field -> column selected for it; phone_number is the only one that joins
+CONTACT_FIELDS = {
+    'name': 'full_name',
+    'phone_number': 'phone_number__phone_number',
+    'created_at': 'created_at',
+    'updated_at': 'updated_at',
+}
+DEFAULT_CONTACT_FIELDS = ('name', 'phone_number')
+
+# ?ordering= value -> order_by columns; id keeps equal timestamps in a fixed order
+CONTACT_ORDERINGS = {
+    'name': ('full_name',),
+    'created_at': ('created_at', 'id'),
+    'updated_at': ('updated_at', 'id'),
+}
+CONTACT_FILTERS = (
+    'name_prefix', 'number_prefix',
+    'created_after', 'created_before', 'updated_after', 'updated_before',
+)
+
+
+def prefix_range(prefix: str) -> tuple[str, str]:
+    """
+    Returns the half-open [low, high) range of strings starting with `prefix`.
+
+    Unlike `startswith` (LIKE ... ESCAPE on SQLite) a range comparison can
+    be answered from a B-tree index; it is case-sensitive.
+    """
+    return prefix, prefix[:-1] + chr(ord(prefix[-1]) + 1)
+
 
 class ContactService:
     """
     Service class for managing contacts
     and their associated phone numbers.
+
+    With CONTACT_SHARDS set, name lookups and writes go to the shard that
+    owns the name; number lookups and listing query every shard.
     """
 
     def _check_name_exists(self, full_name: str) -> bool:
@@ -21,7 +70,15 @@ class ContactService:
         Returns:
             bool: True if a contact with the given name exists, False otherwise.
         """
-        return Contact.objects.filter(full_name=full_name).exists()
+        if contact_index.enabled:
+            # neither answer is final: another worker may have created or deleted
+            # the contact since this index last saw the write generation move
+            record = contact_index.get_by_name(full_name)
+            if record is not None and Contact.objects.filter(pk=record.id, full_name=full_name).exists():
+                return True
+        elif (snapshot := snapshot_reader.current()) is not None:
+            return snapshot.get_by_name(full_name) is not None
+        return Contact.objects.using(shard_for_name(full_name)).filter(full_name=full_name).exists()
 
     def _check_phone_number_exists(self, phone_number: str) -> bool:
         """
@@ -31,7 +88,22 @@ class ContactService:
         Returns:
             bool: True if the phone number exists, False otherwise.
         """
-        return PhoneNumber.objects.filter(phone_number=phone_number).exists()
+        if contact_index.enabled:
+            record = contact_index.get_by_number(phone_number)
+            if record is not None and record.phone_number == phone_number and PhoneNumber.objects.filter(
+                    contact_id=record.id, phone_number=phone_number).exists():
+                return True
+            # missed, stale, or indexed in another format: the number column decides
+        elif (snapshot := snapshot_reader.current()) is not None:
+            row = snapshot.get_by_number(phone_number)
+            if row is None:
+                return False
+            if row[1] == phone_number:
+                return True
+        return any(
+            PhoneNumber.objects.using(alias).filter(phone_number=phone_number).exists()
+            for alias in contact_databases()
+        )
 
     def create_new_contact(self, name: str, phone_number: str) -> dict[str, str]:
         """
@@ -43,14 +115,15 @@ class ContactService:
         Returns:
             dict[str, str]: A dictionary containing the contact's name and phone number.
         """
+        alias = shard_for_name(name)
+        if settings.CONTACT_GROUP_COMMIT and not transaction.get_connection(alias).in_atomic_block:
+            # committed with concurrent creates in one transaction; a caller
+            # already in a transaction keeps its write in that one
+            new_contact = group_commit(alias).submit(lambda: self._create_contact(alias, name, phone_number))
+        else:
+            new_contact = self._create_contact(alias, name, phone_number)
 
-        new_contact = Contact.objects.create(full_name=name)
-
-        PhoneNumber.objects.create(
-            phone_number=phone_number,
-            contact=new_contact
-        )
-
+        bump_contacts_generation()
         logger.info('contact_service.created',
                     contact_name=new_contact.full_name)
 
@@ -59,29 +132,180 @@ class ContactService:
             'phone_number': phone_number
         }
 
-    def retrieve_all_contacts(self) -> list[dict[str, str | None]]:
+    def contact_queryset(self, filters: dict | None = None, ordering: str | None = None,
+                         using: str = 'default'):
         """
-        Retrieves all contacts from the database.
+        Returns the Contact queryset for the list filters and ordering.
 
-        Returns:
-            list[dict[str, str | None]]: A list of dictionaries representing all contacts.
+        Every filter is an index range: name_prefix on the unique full_name
+        index, number_prefix (international digits, e.g. a country code) on
+        normalized_number, and the created/updated bounds (after inclusive,
+        before exclusive) on the (timestamp, id) indexes. Without an
+        ordering, rows come in the order of the index the filter ranges over
+        (so no sort step is needed), or primary key order.
         """
-        qs = (
-            Contact.objects
-            .select_related("phone_number")
-            .only("full_name", "id", "phone_number__phone_number")
-        )
+        filters = filters or {}
+        queryset = Contact.objects.using(using)
+        if name_prefix := filters.get('name_prefix'):
+            low, high = prefix_range(name_prefix)
+            queryset = queryset.filter(full_name__gte=low, full_name__lt=high)
+        if number_prefix := filters.get('number_prefix'):
+            low, high = prefix_range(number_prefix)
+            queryset = queryset.filter(
+                phone_number__normalized_number__gte=low, phone_number__normalized_number__lt=high)
+        for column in ('created_at', 'updated_at'):
+            prefix = column.removesuffix('_at')
+            if (after := filters.get(f'{prefix}_after')) is not None:
+                queryset = queryset.filter(**{f'{column}__gte': after})
+            if (before := filters.get(f'{prefix}_before')) is not None:
+                queryset = queryset.filter(**{f'{column}__lt': before})
+
+        ordering = ordering or self._index_ordering(filters)
+        if not ordering:
+            return queryset.order_by('pk')
+        sign = '-' if ordering.startswith('-') else ''
+        return queryset.order_by(*(sign + column for column in CONTACT_ORDERINGS[ordering.lstrip('-')]))
 
-        results: list[dict[str, str | None]] = []
-        for c in qs:
+    @staticmethod
+    def _index_ordering(filters: dict) -> str | None:
+        if filters.get('name_prefix'):
+            return 'name'
+        for column in ('created_at', 'updated_at'):
+            prefix = column.removesuffix('_at')
+            if filters.get(f'{prefix}_after') is not None or filters.get(f'{prefix}_before') is not None:
+                return column
+        return None
+
+    def _create_contact(self, alias: str, name: str, phone_number: str) -> Contact:
+        claim = self._claim_number(name, phone_number) if shard_count() else None
+        try:
             try:
-                number_obj = c.phone_number  # reverse OneToOne; may not exist
-                number = number_obj.phone_number if number_obj else None
-            except ObjectDoesNotExist:
-                number = None
-            results.append({"name": c.full_name, "phone_number": number})
+                return self._insert_contact(alias, name, phone_number)
+            except IntegrityError:
+                # a tombstone awaiting purge may still hold the name or number
+                if not self._purge_conflicting_tombstones(alias, name, phone_number):
+                    raise
+                return self._insert_contact(alias, name, phone_number)
+        except IntegrityError:
+            if claim is not None:
+                claim.delete()
+            raise
+
+    def _claim_number(self, name: str, phone_number: str) -> PhoneNumberClaim:
+        """
+        Reserves `phone_number` across shards before a sharded create.
+
+        Contacts with different names may live on different shards, so the
+        unique constraint that decides between them is the claim's, on the
+        shard that owns the number (shard_for_number). Claims are released
+        when their contact is deleted or its create fails; one older than
+        CLAIM_GRACE whose contact does not exist (its process died
+        mid-create) is taken over.
+
+        Raises:
+            IntegrityError: If another contact holds the number.
+        """
+        alias = shard_for_number(phone_number)
+        claims = PhoneNumberClaim.objects.using(alias)
+        for _ in range(2):
+            try:
+                with transaction.atomic(using=alias):
+                    return claims.create(phone_number=phone_number, full_name=name)
+            except IntegrityError:
+                holder = claims.filter(phone_number=phone_number).first()
+            if holder is None:
+                continue
+            if holder.claimed_at > timezone.now() - CLAIM_GRACE or PhoneNumber.objects.using(
+                    shard_for_name(holder.full_name)).filter(phone_number=phone_number).exists():
+                break
+            # orphaned: of several creates racing to drop it, each still has to win the insert
+            claims.filter(pk=holder.pk, claimed_at=holder.claimed_at).delete()
+        raise IntegrityError(f"Phone number {phone_number!r} is claimed by another contact.")
+
+    @staticmethod
+    def _release_claims(numbers: list[str]) -> None:
+        by_shard = defaultdict(list)
+        for number in numbers:
+            by_shard[shard_for_number(number)].append(number)
+        for alias, batch in by_shard.items():
+            PhoneNumberClaim.objects.using(alias).filter(phone_number__in=batch).delete()
+
+    @staticmethod
+    def _numbers_of(contacts) -> list[str]:
+        return [number for number in contacts.values_list('phone_number__phone_number', flat=True) if number]
+
+    def _insert_contact(self, alias: str, name: str, phone_number: str) -> Contact:
+        with transaction.atomic(using=alias):
+            new_contact = Contact.objects.using(alias).create(full_name=name)
+
+            PhoneNumber.objects.using(alias).create(
+                phone_number=phone_number,
+                normalized_number=normalize_phone_number(phone_number),
+                contact=new_contact
+            )
+        return new_contact
+
+    def _purge_conflicting_tombstones(self, alias: str, name: str, phone_number: str) -> int:
+        deleted, _ = Contact.all_objects.using(alias).filter(
+            Q(full_name=name) | Q(phone_number__phone_number=phone_number),
+            deleted_at__isnull=False,
+        ).delete()
+        return deleted
+
+    def retrieve_contact_rows(self, fields: tuple[str, ...] = DEFAULT_CONTACT_FIELDS,
+                              filters: dict | None = None, ordering: str | None = None):
+        """
+        Returns a lazy values_list of `fields` tuples over the matching contacts.
+
+        Only the requested columns are selected (phone_number through a
+        LEFT JOIN, so contacts without a number yield None, and only when
+        it is requested) and no model instances are built.
+
+        Across shards the per-shard rows are merged on the ordering columns,
+        creation order by default.
+        """
+        columns = [CONTACT_FIELDS[field] for field in fields]
+        if not shard_count():
+            return self.contact_queryset(filters, ordering).values_list(*columns)
+
+        ordering = ordering or self._index_ordering(filters or {}) or 'created_at'
+        keys = CONTACT_ORDERINGS[ordering.lstrip('-')]
+        per_shard = (
+            self.contact_queryset(filters, ordering, using=alias)
+            .values_list(*keys, *columns)
+            .iterator()
+            for alias in contact_databases()
+        )
+        merged = heapq.merge(*per_shard, key=lambda row: row[:len(keys)], reverse=ordering.startswith('-'))
+        return (row[len(keys):] for row in merged)
+
+    def retrieve_all_contacts(self, fields: tuple[str, ...] = DEFAULT_CONTACT_FIELDS,
+                              filters: dict | None = None,
+                              ordering: str | None = None) -> list[dict[str, object]]:
+        """
+        Retrieves the matching contacts from the database, or from the
+        shared snapshot file while it is current and the request is for the
+        unfiltered, default-ordered book within the snapshot's fields.
+
+        Args:
+            fields (tuple[str, ...]): Keys of CONTACT_FIELDS to return, in order.
+            filters (dict | None): Any of CONTACT_FILTERS.
+            ordering (str | None): A CONTACT_ORDERINGS key, '-' prefixed for descending.
+        Returns:
+            list[dict[str, object]]: A list of dictionaries representing the contacts.
+        """
+        snapshot = None
+        if not filters and not ordering and set(fields) <= set(DEFAULT_CONTACT_FIELDS):
+            snapshot = snapshot_reader.current()
+        if snapshot is not None:
+            positions = [DEFAULT_CONTACT_FIELDS.index(field) for field in fields]
+            rows = (tuple(row[i] for i in positions) for row in snapshot.iter_rows())
+        else:
+            rows = self.retrieve_contact_rows(fields, filters, ordering)
+        results: list[dict[str, object]] = [dict(zip(fields, row)) for row in rows]
 
-        logger.info('contact_service.retrieve_all', count=len(results))
+        logger.info('contact_service.retrieve_all', count=len(results), fields=list(fields),
+                    filters=sorted(filters or ()), ordering=ordering)
 
         return results
 
@@ -90,21 +314,218 @@ class ContactService:
         Deletes a contact based on the provided name or phone number.
 
         - If both are provided, name takes precedence.
+        - With CONTACT_SOFT_DELETE, the contact is tombstoned instead (see _remove).
         - Raises Http404 if the target record does not exist.
         - Raises ValueError if neither identifier is provided.
         """
+        if contact_index.enabled and self._delete_indexed_contact(name, phone_number):
+            return
+
         if name:
-            contact = get_object_or_404(Contact, full_name=name)
-            contact.delete()
+            if not self._remove(Contact.objects.using(shard_for_name(name)).filter(full_name=name)):
+                raise Http404("No Contact matches the given query.")
+            bump_contacts_generation()
             logger.info('contact_service.deleted', contact_name=name)
             return
 
         if phone_number:
-            pn = get_object_or_404(PhoneNumber, phone_number=phone_number)
             # One-to-one; deleting the contact will cascade-delete the phone record
-            pn.contact.delete()
-            logger.info('contact_service.deleted',
-                        contact_name=pn.contact.full_name)
+            if not any(
+                self._remove(Contact.objects.using(alias).filter(phone_number__phone_number=phone_number))
+                for alias in contact_databases()
+            ):
+                raise Http404("No Contact matches the given query.")
+            bump_contacts_generation()
+            logger.info('contact_service.deleted', phone_number=phone_number)
             return
 
         raise ValueError("Either 'name' or 'phone_number' must be provided.")
+
+    def remove_contacts(self, ids: list[int], using: str = 'default', batch_size: int = 500) -> int:
+        """
+        Deletes the contacts with the given primary keys on one database,
+        `batch_size` per transaction, as delete_contact would (tombstones
+        with CONTACT_SOFT_DELETE).
+
+        Returns:
+            int: The number of contacts removed; ids already gone do not count.
+        """
+        removed = 0
+        for start in range(0, len(ids), batch_size):
+            with transaction.atomic(using=using):
+                batch = ids[start:start + batch_size]
+                removed += self._remove(Contact.objects.using(using).filter(pk__in=batch), batch)
+        if removed:
+            bump_contacts_generation()
+        logger.info('contact_service.removed', database=using, count=removed)
+        return removed
+
+    def _remove(self, contacts, ids: list[int] | None = None) -> int:
+        """
+        Deletes the contacts in the queryset and returns how many there were.
+
+        With CONTACT_SOFT_DELETE this is a single UPDATE setting the deleted_at
+        tombstone (and updated_at, so syncing clients see the change); the
+        rows are hard-deleted later by purge_tombstones. Otherwise the
+        delete cascades to the phone number through Django's collector.
+
+        The removed contacts are dropped from the contact index; `ids`, when
+        the caller knows them, saves selecting them first.
+        """
+        if contact_index.enabled and ids is None:
+            ids = list(contacts.values_list('pk', flat=True))
+        numbers = self._numbers_of(contacts) if shard_count() else []
+        if settings.CONTACT_SOFT_DELETE:
+            now = timezone.now()
+            removed = contacts.update(deleted_at=now, updated_at=now)
+        else:
+            # the total would also count the cascaded phone numbers
+            removed = contacts.delete()[1].get(Contact._meta.label, 0)
+        # a tombstone keeps its number on its shard, but not the claim
+        self._release_claims(numbers)
+        if contact_index.enabled and removed:
+            contact_index.discard(ids)
+        return removed
+
+    def purge_tombstones(self, older_than: timedelta, batch_size: int = 5000) -> int:
+        """
+        Hard-deletes contacts tombstoned more than `older_than` ago, with
+        their phone numbers, `batch_size` contacts per transaction so the
+        write lock is released between batches.
+
+        Returns:
+            int: The number of contacts purged.
+        """
+        cutoff = timezone.now() - older_than
+        purged = 0
+        for alias in contact_databases():
+            tombstones = Contact.all_objects.using(alias).filter(deleted_at__lt=cutoff)
+            while True:
+                ids = list(tombstones.values_list('pk', flat=True)[:batch_size])
+                if not ids:
+                    break
+                with transaction.atomic(using=alias):
+                    PhoneNumber.all_objects.using(alias).filter(contact_id__in=ids).delete()
+                    Contact.all_objects.using(alias).filter(pk__in=ids).delete()
+                purged += len(ids)
+                if len(ids) < batch_size:
+                    break
+
+        logger.info('contact_service.purged_tombstones', count=purged)
+        return purged
+
+    def move_to_shards(self, batch_size: int = 5000) -> int:
+        """
+        Moves the contacts in the default database onto the shards that own
+        them, `batch_size` at a time, keeping their timestamps and claiming
+        their numbers. Run it once after setting CONTACT_SHARDS and
+        migrating the shards: reads only look at the shards.
+
+        A batch is deleted from the default database once its shards have
+        committed it, and a contact whose name is already on its shard is
+        not copied again, so an interrupted run can be repeated. Tombstones
+        are not moved; the remaining ones are purged at the end.
+
+        Returns:
+            int: The number of contacts moved.
+
+        Raises:
+            ImproperlyConfigured: If CONTACT_SHARDS is not set.
+            IntegrityError: If a number is claimed by another contact.
+        """
+        if not shard_count():
+            raise ImproperlyConfigured("CONTACT_SHARDS is not set: there are no shards to move contacts to.")
+
+        source = Contact.objects.using(DEFAULT_DB_ALIAS).order_by('pk').values_list(
+            'pk', 'full_name', 'created_at', 'updated_at',
+            'phone_number__phone_number', 'phone_number__normalized_number',
+            'phone_number__created_at', 'phone_number__updated_at')
+        moved = 0
+        while rows := list(source[:batch_size]):
+            by_shard = defaultdict(list)
+            for row in rows:
+                by_shard[shard_for_name(row[1])].append(row)
+            for alias, shard_rows in by_shard.items():
+                moved += self._copy_to_shard(alias, shard_rows)
+            Contact.all_objects.using(DEFAULT_DB_ALIAS).filter(pk__in=[row[0] for row in rows]).delete()
+        Contact.all_objects.using(DEFAULT_DB_ALIAS).filter(deleted_at__isnull=False).delete()
+
+        bump_contacts_generation()
+        logger.info('contact_service.moved_to_shards', count=moved)
+        return moved
+
+    def _copy_to_shard(self, alias: str, rows: list[tuple]) -> int:
+        # bulk_create would stamp auto_now(_add) fields with the current time;
+        # the original timestamps are written back with bulk_update
+        contacts = Contact.all_objects.using(alias)
+        with transaction.atomic(using=alias):
+            present = set(contacts.filter(full_name__in=[row[1] for row in rows])
+                          .values_list('full_name', flat=True))
+            rows = [row for row in rows if row[1] not in present]
+            self._claim_numbers([(row[4], row[1]) for row in rows if row[4]])
+
+            contacts.bulk_create([Contact(full_name=row[1]) for row in rows])
+            ids = dict(contacts.filter(full_name__in=[row[1] for row in rows]).values_list('full_name', 'pk'))
+            contacts.bulk_update(
+                [Contact(pk=ids[name], created_at=created, updated_at=updated)
+                 for _, name, created, updated, *_ in rows],
+                ['created_at', 'updated_at'])
+
+            numbers = PhoneNumber.all_objects.using(alias)
+            with_numbers = [row for row in rows if row[4]]
+            numbers.bulk_create([
+                PhoneNumber(contact_id=ids[row[1]], phone_number=row[4],
+                            normalized_number=row[5] or normalize_phone_number(row[4]))
+                for row in with_numbers])
+            number_ids = dict(numbers.filter(contact_id__in=[ids[row[1]] for row in with_numbers])
+                              .values_list('contact_id', 'pk'))
+            numbers.bulk_update(
+                [PhoneNumber(pk=number_ids[ids[row[1]]], created_at=row[6], updated_at=row[7])
+                 for row in with_numbers],
+                ['created_at', 'updated_at'])
+        return len(rows)
+
+    @staticmethod
+    def _claim_numbers(numbers: list[tuple[str, str]]) -> None:
+        """
+        Claims (phone_number, full_name) pairs in bulk; claims already held
+        by the same name, from an interrupted run, are kept.
+        """
+        by_shard = defaultdict(list)
+        for number, name in numbers:
+            by_shard[shard_for_number(number)].append((number, name))
+        for alias, batch in by_shard.items():
+            claims = PhoneNumberClaim.objects.using(alias)
+            claims.bulk_create([PhoneNumberClaim(phone_number=number, full_name=name) for number, name in batch],
+                               ignore_conflicts=True)
+            held = dict(claims.filter(phone_number__in=[number for number, _ in batch])
+                        .values_list('phone_number', 'full_name'))
+            taken = [number for number, name in batch if held.get(number) != name]
+            if taken:
+                raise IntegrityError(f"Phone numbers claimed by other contacts: {', '.join(taken)}")
+
+    def _delete_indexed_contact(self, name: str | None, phone_number: str | None) -> bool:
+        """
+        delete_contact through the in-memory index: the target is resolved
+        without a SELECT and deleted by primary key.
+
+        Returns False, leaving the database lookup (and the 404) to the
+        caller, when the index misses, holds the number in another format,
+        or points at a row that is gone: the index only catches up with
+        other workers' writes once the shared write generation moves.
+        """
+        if name:
+            record = contact_index.get_by_name(name)
+        elif phone_number:
+            record = contact_index.get_by_number(phone_number)
+            if record is not None and record.phone_number != phone_number:
+                return False
+        else:
+            return False
+
+        if record is None or not self._remove(Contact.objects.filter(pk=record.id), [record.id]):
+            return False
+
+        bump_contacts_generation()
+        logger.info('contact_service.deleted', contact_name=record.name)
+        return True
@@ -0,0 +1,238 @@
+import mmap
+import os
+import struct
+import threading
+import time
+import uuid
+import structlog
+from pathlib import Path
+from django.conf import settings
+from django.core.cache import caches
+
+from phonebook.api.utilities import normalize_phone_number
+from .contact_cache import get_contacts_generation
+
+logger = structlog.get_logger(__name__)
+
+MAGIC = b'PBSNAP01'
+# magic, snapshot id, write generation, contacts, indexed numbers,
+# then the offsets of the record table, name index and number index
+HEADER = struct.Struct('<8s16sqIIQQQ')
+# name offset/length, phone number offset/length (length 0: no number)
+RECORD = struct.Struct('<QIQI')
+# record number, sorted by name
+NAME_ENTRY = struct.Struct('<I')
+# normalized number offset/length and record number, sorted by number
+NUMBER_ENTRY = struct.Struct('<QII')
+
+PUBLISHED_KEY = 'phonebook:contacts:snapshot'
+
+# seconds between checks for a newly published file
+CHECK_INTERVAL = 1.0
+
+
+def _cache():
+    return caches[getattr(settings, 'CONTACT_CACHE_ALIAS', 'default')]
+
+
+def write_snapshot(path: str | Path) -> tuple[int, int]:
+    """
+    Writes every contact to an immutable snapshot file and publishes it.
+
+    The file is written next to `path` and moved over it with os.replace,
+    so readers holding the previous file keep a valid mapping. Returns the
+    number of contacts written and the write generation they reflect.
+    """
+    path = Path(path)
+    # read before the rows: a write during the dump leaves the snapshot stale, never wrong
+    generation = get_contacts_generation()
+    from .contact_services import ContactService
+
+    # same rows, in the same order, as the list endpoint
+    rows = list(ContactService().retrieve_contact_rows())
+    snapshot_id = uuid.uuid4().bytes
+
+    blob = bytearray()
+
+    def put(text: str) -> tuple[int, int]:
+        data = text.encode('utf-8')
+        offset = HEADER.size + len(blob)
+        blob.extend(data)
+        return offset, len(data)
+
+    records = bytearray()
+    name_keys = []
+    number_keys = []
+    for i, (name, number) in enumerate(rows):
+        name_off, name_len = put(name)
+        num_off, num_len = put(number) if number else (0, 0)
+        records += RECORD.pack(name_off, name_len, num_off, num_len)
+        name_keys.append((name.encode('utf-8'), i))
+        if number:
+            normalized = normalize_phone_number(number)
+            norm_off, norm_len = put(normalized)
+            number_keys.append((normalized.encode('ascii'), i, norm_off, norm_len))
+
+    name_index = b''.join(NAME_ENTRY.pack(i) for _, i in sorted(name_keys))
+    number_index = b''.join(
+        NUMBER_ENTRY.pack(off, length, i) for _, i, off, length in sorted(number_keys))
+
+    records_off = HEADER.size + len(blob)
+    name_index_off = records_off + len(records)
+    number_index_off = name_index_off + len(name_index)
+    header = HEADER.pack(MAGIC, snapshot_id, generation, len(rows), len(number_keys),
+                         records_off, name_index_off, number_index_off)
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f'.{path.name}.{os.getpid()}.tmp')
+    try:
+        with open(tmp, 'wb') as f:
+            f.write(header)
+            f.write(blob)
+            f.write(records)
+            f.write(name_index)
+            f.write(number_index)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+    finally:
+        if tmp.exists():
+            tmp.unlink()
+
+    _cache().set(PUBLISHED_KEY, (snapshot_id, generation), timeout=None)
+    logger.info('contact_snapshot.written', path=str(path), size=len(rows), generation=generation)
+    return len(rows), generation
+
+
+class ContactSnapshot:
+    """
+    Read-only view over a snapshot file mapped into memory.
+
+    Lookups binary-search the sorted index tables directly in the mapping;
+    only the compared keys and returned strings are copied out. Every
+    worker mapping the same file shares one page-cache copy.
+    """
+
+    def __init__(self, path: str | Path):
+        with open(path, 'rb') as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        (magic, self.snapshot_id, self.generation, self._count, self._number_count,
+         self._records_off, self._name_index_off, self._number_index_off) = HEADER.unpack_from(self._mm)
+        if magic != MAGIC:
+            self._mm.close()
+            raise ValueError(f"{path} is not a contact snapshot.")
+
+    def __len__(self) -> int:
+        return self._count
+
+    def close(self) -> None:
+        self._mm.close()
+
+    def _text(self, offset: int, length: int) -> str:
+        return self._mm[offset:offset + length].decode('utf-8')
+
+    def _row(self, i: int) -> tuple[str, str | None]:
+        name_off, name_len, num_off, num_len = RECORD.unpack_from(
+            self._mm, self._records_off + i * RECORD.size)
+        return self._text(name_off, name_len), self._text(num_off, num_len) if num_len else None
+
+    def _name_key(self, pos: int) -> tuple[bytes, int]:
+        (i,) = NAME_ENTRY.unpack_from(self._mm, self._name_index_off + pos * NAME_ENTRY.size)
+        name_off, name_len, _, _ = RECORD.unpack_from(self._mm, self._records_off + i * RECORD.size)
+        return self._mm[name_off:name_off + name_len], i
+
+    def _number_key(self, pos: int) -> tuple[bytes, int]:
+        off, length, i = NUMBER_ENTRY.unpack_from(self._mm, self._number_index_off + pos * NUMBER_ENTRY.size)
+        return self._mm[off:off + length], i
+
+    @staticmethod
+    def _search(key_at, count: int, target: bytes) -> int | None:
+        lo, hi = 0, count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if key_at(mid)[0] < target:
+                lo = mid + 1
+            else:
+                hi = mid
+        if lo < count:
+            key, i = key_at(lo)
+            if key == target:
+                return i
+        return None
+
+    def get_by_name(self, name: str) -> tuple[str, str | None] | None:
+        i = self._search(self._name_key, self._count, name.encode('utf-8'))
+        return None if i is None else self._row(i)
+
+    def get_by_number(self, phone_number: str) -> tuple[str, str | None] | None:
+        """
+        Returns the first contact whose number normalizes like `phone_number`.
+        """
+        target = normalize_phone_number(phone_number).encode('ascii')
+        i = self._search(self._number_key, self._number_count, target)
+        return None if i is None else self._row(i)
+
+    def iter_rows(self):
+        """
+        Yields (name, phone_number) in the list endpoint's order.
+        """
+        for i in range(self._count):
+            yield self._row(i)
+
+
+class SnapshotReader:
+    """
+    Per-worker holder of the mapped snapshot at CONTACT_SNAPSHOT_PATH.
+
+    It remaps when a newer file is published, and only hands the snapshot
+    out while it is the published one and no contact was written since.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._snapshot: ContactSnapshot | None = None
+        self._stat: tuple[int, int] | None = None
+        self._next_check = 0.0
+
+    def _reopen_if_replaced(self, path: str) -> None:
+        now = time.monotonic()
+        if now < self._next_check:
+            return
+        with self._lock:
+            if now < self._next_check:
+                return
+            self._next_check = now + CHECK_INTERVAL
+            try:
+                st = os.stat(path)
+            except FileNotFoundError:
+                self._snapshot, self._stat = None, None
+                return
+            stat = (st.st_ino, st.st_mtime_ns)
+            if stat == self._stat:
+                return
+            try:
+                # the old mapping is dropped, not closed: in-flight readers may still use it
+                self._snapshot, self._stat = ContactSnapshot(path), stat
+            except (OSError, ValueError):
+                logger.exception('contact_snapshot.open_failed', path=path)
+                self._snapshot, self._stat = None, None
+
+    def current(self) -> ContactSnapshot | None:
+        path = getattr(settings, 'CONTACT_SNAPSHOT_PATH', '')
+        if not path:
+            return None
+        self._reopen_if_replaced(path)
+        snapshot = self._snapshot
+        if snapshot is None:
+            return None
+        if _cache().get(PUBLISHED_KEY) != (snapshot.snapshot_id, get_contacts_generation()):
+            return None
+        return snapshot
+
+    def reset(self) -> None:
+        with self._lock:
+            self._snapshot, self._stat = None, None
+            self._next_check = 0.0
+
+
+snapshot_reader = SnapshotReader()
@@ -0,0 +1,125 @@
+import structlog
+from collections import defaultdict
+
+from phonebook.api.utilities import normalize_phone_number
+from phonebook.models import Contact
+from .contact_services import ContactService
+from .sharding import contact_databases, normalize_name
+
+logger = structlog.get_logger(__name__)
+
+
+class DuplicateService:
+    """
+    Service class for finding near-duplicate contacts: the same name up to
+    case and whitespace, or the same number in another format.
+    """
+
+    def __init__(self, chunk_size: int = 5000):
+        self.chunk_size = chunk_size
+
+    def _scan(self):
+        for alias in contact_databases():
+            rows = (
+                Contact.objects.using(alias)
+                .order_by('created_at', 'pk')
+                .values_list('pk', 'full_name', 'phone_number__phone_number',
+                             'phone_number__normalized_number', 'created_at')
+                .iterator(chunk_size=self.chunk_size)
+            )
+            for pk, name, number, normalized, created_at in rows:
+                if number and not normalized:
+                    normalized = normalize_phone_number(number)
+                yield alias, pk, name, number, normalized, created_at
+
+    def find(self) -> list[dict]:
+        """
+        Groups contacts sharing a normalized name or number in one pass.
+
+        Each key maps to the first contact seen with it, and a collision
+        unions the two contacts' groups (union-find), so chains such as
+        A~B by name and B~C by number form one group without comparing
+        contacts pairwise.
+
+        Returns:
+            list[dict]: Groups in creation order of their first contact, each with
+            'keep' (the contact to keep: the oldest with a number, else the
+            oldest), 'duplicates', 'reasons' ('name' and/or 'number') and
+            'conflict', set when the group holds several distinct numbers,
+            which a merge would lose.
+        """
+        rows = []
+        parent: list[int] = []
+        first_by_key: dict[tuple[str, str], int] = {}
+        reasons: dict[int, set[str]] = defaultdict(set)
+
+        def root(i: int) -> int:
+            while parent[i] != i:
+                parent[i] = parent[parent[i]]
+                i = parent[i]
+            return i
+
+        for i, row in enumerate(self._scan()):
+            rows.append(row)
+            parent.append(i)
+            keys = [('name', normalize_name(row[2]))]
+            if row[4]:
+                keys.append(('number', row[4]))
+            for key in keys:
+                j = first_by_key.setdefault(key, i)
+                if j != i:
+                    a, b = root(j), root(i)
+                    if a != b:
+                        parent[b] = a
+                        reasons[a] |= reasons.pop(b, set())
+                    reasons[a].add(key[0])
+
+        members: dict[int, list[int]] = defaultdict(list)
+        for i in range(len(rows)):
+            members[root(i)].append(i)
+
+        groups = [self._group([rows[i] for i in group], reasons[r])
+                  for r, group in members.items() if len(group) > 1]
+        groups.sort(key=lambda g: g['keep']['created_at'])
+        logger.info('duplicate_service.found', contacts=len(rows), groups=len(groups))
+        return groups
+
+    def _group(self, rows: list[tuple], reasons: set[str]) -> dict:
+        contacts = [
+            {'database': alias, 'id': pk, 'name': name, 'phone_number': number,
+             'normalized_number': normalized, 'created_at': created_at}
+            for alias, pk, name, number, normalized, created_at in rows
+        ]
+        contacts.sort(key=lambda c: (c['phone_number'] is None, c['created_at']))
+        keep, *duplicates = contacts
+        numbers = {c['normalized_number'] for c in contacts if c['normalized_number']}
+        return {
+            'keep': keep,
+            'duplicates': duplicates,
+            'reasons': sorted(reasons),
+            'conflict': len(numbers) > 1,
+        }
+
+    def merge(self, groups: list[dict], batch_size: int = 500) -> int:
+        """
+        Removes every group's duplicates, keeping its 'keep' contact, in
+        transactions of `batch_size` contacts per database. Conflicting
+        groups are skipped. Removal is a delete, or a tombstone with
+        CONTACT_SOFT_DELETE, as for delete_contact.
+
+        Returns:
+            int: The number of contacts removed; any removed since find() ran
+            are not counted.
+        """
+        doomed: dict[str, list[int]] = defaultdict(list)
+        for group in groups:
+            if group['conflict']:
+                continue
+            for contact in group['duplicates']:
+                doomed[contact['database']].append(contact['id'])
+
+        service = ContactService()
+        removed = sum(service.remove_contacts(ids, using=alias, batch_size=batch_size)
+                      for alias, ids in doomed.items())
+        logger.info('duplicate_service.merged', removed=removed)
+        return removed
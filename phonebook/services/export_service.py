@@ -0,0 +1,197 @@
+import csv
+import gzip
+import hashlib
+import io
+import json
+import os
+import time
+import structlog
+from collections.abc import Callable, Iterable, Iterator
+from itertools import chain
+from pathlib import Path
+from typing import TextIO
+from django.db.models import Count, Max
+
+from phonebook.models import Contact, Job
+from .job_service import JobService
+from .sharding import contact_databases
+
+logger = structlog.get_logger(__name__)
+
+EXPORT_FORMATS = ('csv', 'ndjson')
+EXPORT_HEADER = ('name', 'phone_number')
+EXPORT_JOB_KIND = 'export_contacts'
+
+
+def contacts_fingerprint() -> str:
+    """
+    Identifies the exportable state of the book without reading it: live
+    contact count, highest id and latest contact and number change on each
+    contact database. Any create, delete or soft delete moves at least one.
+    """
+    parts = []
+    for alias in contact_databases():
+        stats = Contact.objects.using(alias).aggregate(
+            count=Count('pk'), max_id=Max('pk'),
+            changed=Max('updated_at'), number_changed=Max('phone_number__updated_at'))
+        parts.append(f"{alias}:{stats['count']}:{stats['max_id']}:{stats['changed']}:{stats['number_changed']}")
+    return hashlib.sha1('|'.join(parts).encode()).hexdigest()[:16]
+
+
+def artifact_path(directory: str | Path, fingerprint: str, fmt: str) -> Path:
+    return Path(directory) / f'contacts-{fingerprint}.{fmt}.gz'
+
+
+class ExportService:
+    """
+    Service class for streaming the whole phone book out
+    as flat CSV or NDJSON rows.
+    """
+
+    def __init__(self, chunk_size: int = 2000):
+        self.chunk_size = chunk_size
+
+    def iter_rows(self) -> Iterator[tuple[str, str | None]]:
+        """
+        Iterates over (name, phone_number) tuples in primary key order
+        (shard by shard when contacts are sharded).
+
+        Only the two exported columns are selected and no model instances
+        are built; rows are fetched from the cursor `chunk_size` at a time.
+        """
+        return chain.from_iterable(
+            Contact.objects.using(alias)
+            .order_by('pk')
+            .values_list('full_name', 'phone_number__phone_number')
+            .iterator(chunk_size=self.chunk_size)
+            for alias in contact_databases()
+        )
+
+    def request_export(self, fmt: str, created_by_id: int | None = None) -> tuple[Job, bool]:
+        """
+        Returns an export job for the book as it is now, and whether it was
+        newly queued.
+
+        With no write since a finished export whose artifact is still on
+        disk, that job is returned; an identical export still queued or
+        running is shared as well.
+        """
+        fingerprint = contacts_fingerprint()
+        exports = Job.objects.filter(kind=EXPORT_JOB_KIND, payload__format=fmt)
+
+        done = (exports.filter(status=Job.Status.SUCCEEDED, result__fingerprint=fingerprint)
+                .order_by('-finished_at').first())
+        if done is not None and Path(done.result['path']).exists():
+            return done, False
+        pending = (exports.filter(status__in=(Job.Status.QUEUED, Job.Status.RUNNING),
+                                  payload__fingerprint=fingerprint)
+                   .order_by('-pk').first())
+        if pending is not None:
+            return pending, False
+
+        job = JobService().enqueue(
+            EXPORT_JOB_KIND, {'format': fmt, 'fingerprint': fingerprint}, created_by_id=created_by_id)
+        return job, True
+
+    def write(self, stream: TextIO, fmt: str = 'csv', progress: Callable[[int], None] | None = None) -> int:
+        """
+        Writes every contact to the given text stream.
+
+        Args:
+            stream (TextIO): The destination stream.
+            fmt (str): Either 'csv' or 'ndjson'.
+            progress (Callable[[int], None], optional): Called with the rows
+                written so far after every `chunk_size` rows.
+        Returns:
+            int: The number of contacts written.
+        """
+        rows = self.iter_rows()
+        if progress is not None:
+            rows = self._reporting(rows, progress)
+        if fmt == 'csv':
+            count = self._write_csv(stream, rows)
+        elif fmt == 'ndjson':
+            count = self._write_ndjson(stream, rows)
+        else:
+            raise ValueError(f"Unsupported export format: {fmt!r}")
+
+        logger.info('export_service.completed', format=fmt, count=count)
+        return count
+
+    def write_artifact(self, directory: str | Path, fmt: str = 'csv',
+                       progress: Callable[[int], None] | None = None) -> dict:
+        """
+        Writes a gzip-compressed export to `directory`, named after the
+        contacts fingerprint, unless that file already exists: with no write
+        since the last export, the last artifact is reused as is, its mtime
+        refreshed so remove_stale_artifacts counts its age from this use.
+
+        The fingerprint is read before the rows, so a write during the
+        export leaves the artifact stale, never wrong. The file appears
+        atomically (os.replace).
+
+        Returns:
+            dict: 'path', 'format', 'fingerprint', 'size' and, when written, 'count'.
+        """
+        if fmt not in EXPORT_FORMATS:
+            raise ValueError(f"Unsupported export format: {fmt!r}")
+        fingerprint = contacts_fingerprint()
+        path = artifact_path(directory, fingerprint, fmt)
+        result = {'path': str(path), 'format': fmt, 'fingerprint': fingerprint}
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            pass
+        else:
+            logger.info('export_service.artifact_reused', path=str(path))
+            return {**result, 'size': path.stat().st_size, 'reused': True}
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f'.{path.name}.{os.getpid()}.tmp')
+        try:
+            # no mtime or file name in the gzip header: the same fingerprint
+            # always gives the same bytes, as its strong ETag promises
+            with open(tmp, 'wb') as raw, \
+                    gzip.GzipFile(filename='', mode='wb', fileobj=raw, mtime=0) as compressed, \
+                    io.TextIOWrapper(compressed, encoding='utf-8', newline='') as stream:
+                count = self.write(stream, fmt, progress)
+            os.replace(tmp, path)
+        finally:
+            tmp.unlink(missing_ok=True)
+        return {**result, 'size': path.stat().st_size, 'count': count, 'reused': False}
+
+    def remove_stale_artifacts(self, directory: str | Path, max_age: float, keep: str | Path) -> int:
+        """
+        Deletes export artifacts older than `max_age` seconds, except `keep`.
+        """
+        cutoff = time.time() - max_age
+        removed = 0
+        for path in Path(directory).glob('contacts-*.gz'):
+            if path != Path(keep) and path.stat().st_mtime < cutoff:
+                path.unlink(missing_ok=True)
+                removed += 1
+        return removed
+
+    def _reporting(self, rows: Iterable, progress: Callable[[int], None]) -> Iterator:
+        for count, row in enumerate(rows, 1):
+            yield row
+            if count % self.chunk_size == 0:
+                progress(count)
+
+    def _write_csv(self, stream: TextIO, rows: Iterable) -> int:
+        writer = csv.writer(stream, lineterminator='\n')
+        writer.writerow(EXPORT_HEADER)
+        count = 0
+        for row in rows:
+            writer.writerow(row)
+            count += 1
+        return count
+
+    def _write_ndjson(self, stream: TextIO, rows: Iterable) -> int:
+        dumps = json.JSONEncoder(ensure_ascii=False, separators=(',', ':')).encode
+        write = stream.write
+        count = 0
+        for name, number in rows:
+            write(dumps({'name': name, 'phone_number': number}) + '\n')
+            count += 1
+        return count
@@ -0,0 +1,140 @@
+import threading
+import structlog
+from collections.abc import Callable
+from typing import Any
+from django.conf import settings
+from django.db import transaction
+
+logger = structlog.get_logger(__name__)
+
+DEFAULT_GROUP_COMMIT = {
+    # seconds a leader waits for more writes to join its transaction
+    'WINDOW': 0.002,
+    # writes per transaction; a full batch commits without waiting out the window
+    'MAX_BATCH': 64,
+}
+
+
+def _config() -> dict:
+    return {**DEFAULT_GROUP_COMMIT, **getattr(settings, 'GROUP_COMMIT', {})}
+
+
+class _Write:
+    __slots__ = ('fn', 'done', 'promoted', 'result', 'error')
+
+    def __init__(self, fn: Callable[[], Any]):
+        self.fn = fn
+        self.done = threading.Event()
+        self.promoted = False
+        self.result = None
+        self.error: BaseException | None = None
+
+
+class GroupCommit:
+    """
+    Coalesces concurrent writes to one database into shared transactions.
+
+    The first thread to submit becomes the leader: it waits up to WINDOW
+    seconds (or until MAX_BATCH writes are queued), then runs every queued
+    write in one transaction, each in its own savepoint, and commits once.
+    The wait is skipped while the previous batch held a single write, so a
+    lone writer is not delayed.
+
+    A write that raises is rolled back to its savepoint and its exception
+    is re-raised in the thread that submitted it; the others still commit.
+    Writes queued while a leader commits are handed to a new leader
+    promoted from the queue, so under load batches form without waiting.
+
+    Writes run on the leader's thread and connection, so they must name
+    the database explicitly and must not rely on thread-local state.
+    """
+
+    def __init__(self, alias: str):
+        self.alias = alias
+        self._lock = threading.Lock()
+        self._queue: list[_Write] = []
+        self._leading = False
+        self._full = threading.Event()
+        self._last_batch = 0
+
+    def submit(self, fn: Callable[[], Any]) -> Any:
+        """
+        Runs `fn` in the next group transaction and returns its result,
+        or raises its exception, once that transaction has committed.
+        """
+        write = _Write(fn)
+        with self._lock:
+            self._queue.append(write)
+            lead = not self._leading
+            self._leading = True
+            if len(self._queue) >= _config()['MAX_BATCH']:
+                self._full.set()
+
+        if lead:
+            self._lead()
+        while True:
+            write.done.wait()
+            if not write.promoted:
+                break
+            write.promoted = False
+            write.done.clear()
+            self._lead()
+
+        if write.error is not None:
+            raise write.error
+        return write.result
+
+    def _lead(self) -> None:
+        conf = _config()
+        if self._last_batch > 1 or len(self._queue) > 1:
+            self._full.wait(conf['WINDOW'])
+        with self._lock:
+            batch = self._queue[:conf['MAX_BATCH']]
+            del self._queue[:conf['MAX_BATCH']]
+            self._full.clear()
+        self._last_batch = len(batch)
+
+        try:
+            self._commit(batch)
+        finally:
+            with self._lock:
+                if self._queue:
+                    successor = self._queue[0]
+                    successor.promoted = True
+                    successor.done.set()
+                else:
+                    self._leading = False
+            for write in batch:
+                write.done.set()
+
+    def _commit(self, batch: list[_Write]) -> None:
+        try:
+            with transaction.atomic(using=self.alias):
+                for write in batch:
+                    try:
+                        with transaction.atomic(using=self.alias):
+                            write.result = write.fn()
+                    except Exception as e:
+                        write.error = e
+        except Exception as e:
+            # the commit itself failed: nothing in the batch was written
+            for write in batch:
+                write.result, write.error = None, write.error or e
+            logger.exception('group_commit.failed', database=self.alias, size=len(batch))
+            return
+        logger.debug('group_commit.committed', database=self.alias, size=len(batch))
+
+
+_committers: dict[str, GroupCommit] = {}
+_committers_lock = threading.Lock()
+
+
+def group_commit(alias: str) -> GroupCommit:
+    """
+    Returns this process's GroupCommit for the `alias` database.
+    """
+    committer = _committers.get(alias)
+    if committer is None:
+        with _committers_lock:
+            committer = _committers.setdefault(alias, GroupCommit(alias))
+    return committer
@@ -0,0 +1,136 @@
+import os
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from django.conf import settings
+from django.contrib.auth.hashers import check_password, make_password
+
+DEFAULT_POOL = {
+    'WORKERS': 2,
+    'MAX_PENDING': 32,
+    'QUEUE_TIMEOUT': 2.0,
+}
+
+
+class HashingBusyError(Exception):
+    """
+    Raised when the hashing pool has no free slot within the queue timeout.
+    """
+
+    def __init__(self, retry_after: int = 1):
+        super().__init__("Password hashing is at capacity.")
+        self.retry_after = retry_after
+
+
+def _verify(password: str, encoded: str) -> tuple[bool, bool]:
+    needs_update: list[bool] = []
+    ok = check_password(password, encoded, setter=lambda raw: needs_update.append(True))
+    return ok, bool(needs_update)
+
+
+class PasswordHashingPool:
+    """
+    Runs password hashing on a bounded, dedicated thread pool.
+
+    The stdlib PBKDF2 (and the argon2/bcrypt bindings) release the GIL while
+    hashing, so the threads use separate cores while request threads block.
+    At most `workers + max_pending` hashes are admitted at once; callers
+    waiting longer than `queue_timeout` for a slot get HashingBusyError.
+    With `workers=0` hashing runs inline on the calling thread.
+    """
+
+    def __init__(self, workers: int = 2, max_pending: int = 32, queue_timeout: float = 2.0):
+        self.workers = workers
+        self.queue_timeout = queue_timeout
+        self._slots = threading.BoundedSemaphore(max(1, workers + max_pending))
+        self._executor = (
+            ThreadPoolExecutor(max_workers=workers, thread_name_prefix='pwhash')
+            if workers > 0 else None
+        )
+
+    def _submit(self, fn, *args) -> Future:
+        if not self._slots.acquire(timeout=self.queue_timeout):
+            raise HashingBusyError(retry_after=max(1, round(self.queue_timeout)))
+        try:
+            future = self._executor.submit(fn, *args)
+        except BaseException:
+            self._slots.release()
+            raise
+        future.add_done_callback(lambda f: self._slots.release())
+        return future
+
+    def _run(self, fn, *args):
+        if self._executor is None:
+            return fn(*args)
+        return self._submit(fn, *args).result()
+
+    def make_password(self, password: str) -> str:
+        """
+        Hashes a password with the preferred hasher.
+        """
+        return self._run(make_password, password)
+
+    def make_passwords(self, passwords: list[str]) -> list[str]:
+        """
+        Hashes a batch of passwords, in order. Each hash takes a slot like
+        a single one, so a large batch queues behind (and bounds) the pool
+        instead of using every core.
+        """
+        if self._executor is None:
+            return [make_password(password) for password in passwords]
+        futures: list[Future] = []
+        try:
+            for password in passwords:
+                futures.append(self._submit(make_password, password))
+        except HashingBusyError:
+            for future in futures:
+                future.cancel()
+            raise
+        return [future.result() for future in futures]
+
+    def check_password(self, password: str, encoded: str) -> tuple[bool, bool]:
+        """
+        Verifies a password against its stored hash.
+
+        Returns:
+            tuple: Whether it matched, and whether the hash should be upgraded
+            to the current hasher/iteration settings.
+        """
+        return self._run(_verify, password, encoded)
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+
+
+_pool: PasswordHashingPool | None = None
+_pool_lock = threading.Lock()
+
+
+def get_hashing_pool() -> PasswordHashingPool:
+    """
+    Returns the process-wide pool configured by PASSWORD_HASHING_POOL.
+    """
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                conf = {**DEFAULT_POOL, **getattr(settings, 'PASSWORD_HASHING_POOL', {})}
+                _pool = PasswordHashingPool(
+                    workers=conf['WORKERS'],
+                    max_pending=conf['MAX_PENDING'],
+                    queue_timeout=conf['QUEUE_TIMEOUT'],
+                )
+    return _pool
+
+
+def hash_passwords_parallel(passwords: list[str], workers: int | None = None) -> list[str]:
+    """
+    Hashes many passwords at once on a temporary pool with one thread
+    per core, for offline bulk work that should not queue behind (or
+    starve) the request-serving hashing pool.
+    """
+    if not passwords:
+        return []
+    workers = workers or os.cpu_count() or 1
+    with ThreadPoolExecutor(max_workers=min(workers, len(passwords))) as executor:
+        return list(executor.map(make_password, passwords))
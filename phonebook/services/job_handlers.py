@@ -0,0 +1,89 @@
+"""
+Built-in job kinds. Each mirrors a management command so maintenance can
+be queued (e.g. from the jobs API) instead of run on an HTTP worker.
+"""
+from datetime import timedelta
+from django.conf import settings
+
+from .job_service import JobProgress, PermanentJobError, job_handler
+
+
+@job_handler('merge_duplicate_contacts')
+def merge_duplicate_contacts(payload: dict, progress: JobProgress) -> dict:
+    from .duplicate_service import DuplicateService
+
+    batch_size = payload.get('batch_size', 500)
+    if type(batch_size) is not int or batch_size < 1:
+        raise PermanentJobError("'batch_size' must be a positive integer.")
+
+    service = DuplicateService()
+    groups = service.find()
+    removed = service.merge(groups, batch_size=batch_size)
+    return {'groups': len(groups), 'removed': removed}
+
+
+@job_handler('export_contacts')
+def export_contacts(payload: dict, progress: JobProgress) -> dict:
+    from .export_service import EXPORT_FORMATS, ExportService
+    from .sharding import contact_databases
+    from phonebook.models import Contact
+
+    fmt = payload.get('format', 'csv')
+    if fmt not in EXPORT_FORMATS:
+        raise PermanentJobError(f"Unsupported export format: {fmt!r}")
+
+    total = sum(Contact.objects.using(alias).count() for alias in contact_databases())
+    service = ExportService()
+    result = service.write_artifact(settings.EXPORT_DIR, fmt, progress=lambda done: progress(done, total))
+    service.remove_stale_artifacts(settings.EXPORT_DIR, settings.EXPORT_ARTIFACT_TTL, keep=result['path'])
+    return result
+
+
+@job_handler('purge_contact_tombstones')
+def purge_contact_tombstones(payload: dict, progress: JobProgress) -> dict:
+    from .contact_services import ContactService
+
+    older_than = payload.get('older_than', settings.CONTACT_TOMBSTONE_RETENTION)
+    batch_size = payload.get('batch_size', 5000)
+    if type(older_than) is not int or older_than < 0:
+        raise PermanentJobError("'older_than' must be a non-negative integer.")
+    if type(batch_size) is not int or batch_size < 1:
+        raise PermanentJobError("'batch_size' must be a positive integer.")
+
+    purged = ContactService().purge_tombstones(timedelta(seconds=older_than), batch_size=batch_size)
+    return {'purged': purged}
+
+
+def _require_shared_cache(kind: str) -> None:
+    from .contact_cache import contact_cache_is_shared
+
+    # the worker's own memory is invisible to the HTTP workers the job is for
+    if not contact_cache_is_shared():
+        raise PermanentJobError(f"{kind} needs a shared CACHE_URL; per-process memory is not seen by other workers.")
+
+
+@job_handler('write_contact_snapshot')
+def write_contact_snapshot(payload: dict, progress: JobProgress) -> dict:
+    from .contact_snapshot import write_snapshot
+
+    _require_shared_cache('write_contact_snapshot')
+    path = payload.get('path') or settings.CONTACT_SNAPSHOT_PATH
+    if not path:
+        raise PermanentJobError("Set CONTACT_SNAPSHOT_PATH or pass a 'path'.")
+    count, generation = write_snapshot(path)
+    return {'count': count, 'generation': generation}
+
+
+@job_handler('prefill_contact_list_cache')
+def prefill_contact_list_cache(payload: dict, progress: JobProgress) -> None:
+    from .warmup_service import WarmupService
+
+    _require_shared_cache('prefill_contact_list_cache')
+    WarmupService(prefill_caches=True)._prefill_caches()
+
+
+@job_handler('purge_revoked_tokens')
+def purge_revoked_tokens(payload: dict, progress: JobProgress) -> dict:
+    from .revocation_service import TokenRevocationService
+
+    return {'purged': TokenRevocationService().purge_expired()}
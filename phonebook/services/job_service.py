@@ -0,0 +1,282 @@
+import os
+import socket
+import threading
+import time
+import traceback
+import structlog
+from collections.abc import Callable
+from datetime import timedelta
+from django.conf import settings
+from django.db import close_old_connections, connection
+from django.db.models import F, Q
+from django.utils import timezone
+
+from phonebook.models import Job
+
+logger = structlog.get_logger(__name__)
+
+DEFAULT_JOB_QUEUE = {
+    # seconds a claimed job stays leased; renewed every third of it while the handler runs
+    'LEASE_SECONDS': 300,
+    'MAX_ATTEMPTS': 5,
+    # retry n waits min(BACKOFF_BASE * 2 ** (n - 1), BACKOFF_MAX) seconds
+    'BACKOFF_BASE': 5.0,
+    'BACKOFF_MAX': 3600.0,
+    # seconds an idle worker sleeps between claim attempts
+    'POLL_INTERVAL': 1.0,
+    # minimum seconds between progress writes
+    'PROGRESS_INTERVAL': 1.0,
+}
+
+# candidates looked at per claim; losing all of them to other workers just means polling again
+CLAIM_CANDIDATES = 5
+
+JobHandler = Callable[[dict, 'JobProgress'], dict | None]
+
+_handlers: dict[str, JobHandler] = {}
+
+
+def _config() -> dict:
+    return {**DEFAULT_JOB_QUEUE, **getattr(settings, 'JOB_QUEUE', {})}
+
+
+def job_handler(kind: str):
+    """
+    Registers the decorated function as the handler for `kind` jobs.
+
+    Handlers are called as handler(payload, progress) and return a
+    JSON-serializable result (or None). Raising retries the job with
+    backoff, except for PermanentJobError.
+    """
+    def register(fn: JobHandler) -> JobHandler:
+        _handlers[kind] = fn
+        return fn
+    return register
+
+
+def job_kinds() -> list[str]:
+    return sorted(_handlers)
+
+
+class PermanentJobError(Exception):
+    """
+    Raised by a handler for failures a retry cannot fix, e.g. a bad payload.
+    """
+
+
+class JobLeaseLost(Exception):
+    """
+    Raised from a progress report when another worker has reclaimed the job.
+    """
+
+
+def _renew_lease(job_id: int, owner: str, **fields) -> bool:
+    """
+    Extends the lease of a job still held by `owner`, writing `fields` along.
+    Returns False once another worker has reclaimed it.
+    """
+    return bool(Job.objects.filter(pk=job_id, lease_owner=owner, status=Job.Status.RUNNING).update(
+        lease_expires_at=timezone.now() + timedelta(seconds=_config()['LEASE_SECONDS']), **fields))
+
+
+class LeaseHeartbeat:
+    """
+    Renews a running job's lease from a background thread every third of
+    LEASE_SECONDS, so a handler that never reports progress keeps its job
+    for as long as it runs. Used as a context manager around the handler.
+    """
+
+    def __init__(self, job: Job, owner: str):
+        self.job_id = job.pk
+        self.owner = owner
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._beat, name=f'job-{job.pk}-heartbeat', daemon=True)
+
+    def __enter__(self) -> 'LeaseHeartbeat':
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self._stop.set()
+        self._thread.join()
+
+    def _beat(self) -> None:
+        try:
+            while not self._stop.wait(_config()['LEASE_SECONDS'] / 3):
+                try:
+                    if not _renew_lease(self.job_id, self.owner):
+                        # reclaimed: the final update in JobService.run will match nothing
+                        return
+                except Exception:
+                    # e.g. the database was locked; the next beat tries again
+                    logger.exception('job_service.heartbeat_failed', job_id=self.job_id)
+        finally:
+            connection.close()
+
+
+class JobProgress:
+    """
+    Passed to handlers as `progress(done, total)`. Records the fraction done
+    and renews the lease, writing at most every PROGRESS_INTERVAL seconds.
+    """
+
+    timer = time.monotonic
+
+    def __init__(self, job: Job, owner: str):
+        self.job_id = job.pk
+        self.owner = owner
+        self._next_write = 0.0
+
+    def __call__(self, done: int, total: int) -> None:
+        conf = _config()
+        now = self.timer()
+        if now < self._next_write and done < total:
+            return
+        self._next_write = now + conf['PROGRESS_INTERVAL']
+        if not _renew_lease(self.job_id, self.owner, progress=min(done / total, 1.0) if total else 0.0):
+            raise JobLeaseLost(f"Job {self.job_id} is no longer leased to {self.owner}.")
+
+
+class JobService:
+    """
+    Service class for the database-backed job queue: enqueueing, claiming
+    by conditional UPDATE, and recording outcomes.
+    """
+
+    def enqueue(self, kind: str, payload: dict | None = None, *, delay: float = 0,
+                max_attempts: int | None = None, created_by_id: int | None = None) -> Job:
+        """
+        Queues a job of a registered kind.
+
+        Raises:
+            ValueError: If no handler is registered for `kind`.
+        """
+        if kind not in _handlers:
+            raise ValueError(f"Unknown job kind: {kind!r}")
+        job = Job.objects.create(
+            kind=kind,
+            payload=payload or {},
+            run_at=timezone.now() + timedelta(seconds=delay),
+            max_attempts=max_attempts or _config()['MAX_ATTEMPTS'],
+            created_by_id=created_by_id,
+        )
+        logger.info('job_service.enqueued', job_id=job.pk, kind=kind)
+        return job
+
+    def claim(self, owner: str, kinds: list[str] | None = None) -> Job | None:
+        """
+        Leases the next due job to `owner`, or returns None.
+
+        Candidates are due queued jobs and running jobs whose lease expired
+        (their worker died). Each is taken with an UPDATE that only matches
+        while it is still claimable, so of several workers racing for a job
+        exactly one gets a row count of 1.
+        """
+        now = timezone.now()
+        claimable = Q(status=Job.Status.QUEUED, run_at__lte=now) | Q(
+            status=Job.Status.RUNNING, lease_expires_at__lt=now)
+        candidates = Job.objects.filter(claimable)
+        if kinds:
+            candidates = candidates.filter(kind__in=kinds)
+
+        for pk in candidates.order_by('run_at', 'pk').values_list('pk', flat=True)[:CLAIM_CANDIDATES]:
+            claimed = Job.objects.filter(claimable, pk=pk).update(
+                status=Job.Status.RUNNING,
+                lease_owner=owner,
+                lease_expires_at=now + timedelta(seconds=_config()['LEASE_SECONDS']),
+                attempts=F('attempts') + 1,
+                started_at=now,
+            )
+            if claimed:
+                return Job.objects.get(pk=pk)
+        return None
+
+    def run(self, job: Job, owner: str) -> None:
+        """
+        Runs a claimed job's handler and records success, a retry or failure.
+        """
+        log = logger.bind(job_id=job.pk, kind=job.kind, attempt=job.attempts)
+        handler = _handlers.get(job.kind)
+        try:
+            if handler is None:
+                raise PermanentJobError(f"No handler registered for job kind {job.kind!r}.")
+            if job.attempts > job.max_attempts:
+                # reclaimed after its worker died on the last attempt
+                raise PermanentJobError("Lease expired on the final attempt.")
+            with LeaseHeartbeat(job, owner):
+                result = handler(job.payload, JobProgress(job, owner))
+        except JobLeaseLost:
+            log.warning('job_service.lease_lost')
+            return
+        except Exception as e:
+            if self._fail(job, owner, e, retry=not isinstance(e, PermanentJobError)):
+                log.exception('job_service.failed')
+            else:
+                log.warning('job_service.lease_lost', error=str(e))
+            return
+
+        # a lease lost despite the heartbeat (e.g. the worker stalled): the new holder records the outcome
+        if not self._held(job, owner).update(
+                status=Job.Status.SUCCEEDED, result=result, progress=1.0, error='',
+                lease_expires_at=None, finished_at=timezone.now()):
+            log.warning('job_service.lease_lost')
+            return
+        log.info('job_service.succeeded')
+
+    def backoff(self, attempts: int) -> float:
+        conf = _config()
+        return min(conf['BACKOFF_BASE'] * 2 ** (attempts - 1), conf['BACKOFF_MAX'])
+
+    def _held(self, job: Job, owner: str):
+        return Job.objects.filter(pk=job.pk, lease_owner=owner, status=Job.Status.RUNNING)
+
+    def _fail(self, job: Job, owner: str, error: Exception, retry: bool) -> int:
+        message = ''.join(traceback.format_exception_only(error)).strip()
+        if retry and job.attempts < job.max_attempts:
+            return self._held(job, owner).update(
+                status=Job.Status.QUEUED, error=message, lease_owner='', lease_expires_at=None,
+                run_at=timezone.now() + timedelta(seconds=self.backoff(job.attempts)))
+        else:
+            return self._held(job, owner).update(
+                status=Job.Status.FAILED, error=message, lease_expires_at=None,
+                finished_at=timezone.now())
+
+
+class JobWorker:
+    """
+    Claims and runs jobs one at a time until stopped. `manage.py run_worker`
+    runs one per process; throughput scales with the number of processes.
+    """
+
+    def __init__(self, kinds: list[str] | None = None, owner: str | None = None):
+        self.kinds = kinds
+        self.owner = owner or f'{socket.gethostname()}:{os.getpid()}'
+        self._stop = threading.Event()
+
+    def stop(self) -> None:
+        """
+        Asks the worker to exit once the current job is done.
+        """
+        self._stop.set()
+
+    def run(self, burst: bool = False, max_jobs: int | None = None) -> int:
+        """
+        Processes jobs until stopped, until `max_jobs` have run, or, with
+        `burst`, until no job is due. Returns the number of jobs run.
+        """
+        service = JobService()
+        ran = 0
+        logger.info('job_worker.started', owner=self.owner, kinds=self.kinds)
+        while not self._stop.is_set() and (max_jobs is None or ran < max_jobs):
+            close_old_connections()
+            job = service.claim(self.owner, self.kinds)
+            if job is None:
+                if burst:
+                    break
+                self._stop.wait(_config()['POLL_INTERVAL'])
+                continue
+            service.run(job, self.owner)
+            ran += 1
+
+        logger.info('job_worker.stopped', owner=self.owner, ran=ran)
+        return ran
@@ -0,0 +1,205 @@
+import threading
+import time
+import structlog
+from collections import OrderedDict
+from collections.abc import Iterable, Iterator
+from django.conf import settings
+
+from phonebook.api.utilities import normalize_phone_number, valid_phone_number
+from phonebook.models import PhoneNumber
+from .contact_cache import get_contacts_generation
+from .sharding import contact_databases
+
+logger = structlog.get_logger(__name__)
+
+DEFAULT_LOOKUP_CACHE = {
+    # off by default: other workers' writes only reach it through a shared CACHE_URL
+    'ENABLED': False,
+    'SIZE': 100_000,
+    # seconds a known number stays cached
+    'TTL': 60.0,
+    # seconds an unknown number stays cached; short, so new contacts show up quickly
+    'NEGATIVE_TTL': 5.0,
+    # seconds between checks of the shared write generation; a change clears the cache
+    'GENERATION_CHECK_INTERVAL': 1.0,
+}
+
+# returned by HotNumberCache.get when the number is not cached at all
+MISSING = object()
+
+
+def _config() -> dict:
+    return {**DEFAULT_LOOKUP_CACHE, **getattr(settings, 'LOOKUP_CACHE', {})}
+
+
+class HotNumberCache:
+    """
+    Per-worker LRU/TTL cache of normalized number -> contact name.
+
+    Unknown numbers are cached as None (negative caching). The whole cache
+    is dropped when the shared write generation moves, which is checked at
+    most every GENERATION_CHECK_INTERVAL seconds. Only used with ENABLED:
+    with per-process memory the generation misses other workers' writes,
+    which would keep serving a deleted contact's name for up to TTL.
+    """
+
+    timer = time.monotonic
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[str, tuple[str | None, float]] = OrderedDict()
+        self._generation: int | None = None
+        self._next_check = 0.0
+
+    @property
+    def enabled(self) -> bool:
+        return _config()['ENABLED']
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _check_generation(self, now: float, conf: dict) -> None:
+        if now < self._next_check:
+            return
+        generation = get_contacts_generation()
+        with self._lock:
+            if generation != self._generation:
+                self._entries.clear()
+                self._generation = generation
+            self._next_check = now + conf['GENERATION_CHECK_INTERVAL']
+
+    def get(self, number: str):
+        """
+        Returns the cached name, None for a cached unknown number, or MISSING.
+        """
+        now = self.timer()
+        self._check_generation(now, _config())
+        with self._lock:
+            entry = self._entries.get(number)
+            if entry is None:
+                return MISSING
+            name, expires_at = entry
+            if expires_at <= now:
+                del self._entries[number]
+                return MISSING
+            self._entries.move_to_end(number)
+            return name
+
+    def set(self, number: str, name: str | None) -> None:
+        now = self.timer()
+        conf = _config()
+        self._check_generation(now, conf)
+        ttl = conf['TTL'] if name is not None else conf['NEGATIVE_TTL']
+        with self._lock:
+            self._entries[number] = (name, now + ttl)
+            self._entries.move_to_end(number)
+            while len(self._entries) > conf['SIZE']:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._generation = None
+            self._next_check = 0.0
+
+
+hot_number_cache = HotNumberCache()
+
+
+class LookupService:
+    """
+    Service class for caller-ID style reverse lookups: number -> contact name.
+    """
+
+    def lookup(self, phone_number: str) -> str | None:
+        """
+        Returns the name of the contact owning `phone_number` in any accepted
+        format, or None. Answers come from the hot-number cache when it is
+        enabled and holds the number, otherwise from the indexed
+        normalized_number column.
+        """
+        normalized = normalize_phone_number(phone_number)
+        if not hot_number_cache.enabled:
+            return self._query(normalized)
+        name = hot_number_cache.get(normalized)
+        if name is not MISSING:
+            return name
+
+        name = self._query(normalized)
+        hot_number_cache.set(normalized, name)
+        return name
+
+    def _query(self, normalized: str) -> str | None:
+        for alias in contact_databases():
+            rows = (
+                PhoneNumber.objects.using(alias)
+                .filter(normalized_number=normalized)
+                .values_list('contact__full_name', flat=True)[:1]
+            )
+            for name in rows:
+                return name
+        return None
+
+    def lookup_many(self, phone_numbers: Iterable[str], chunk_size: int = 500) -> dict[str, str | None]:
+        """
+        Resolves many already-validated numbers at once.
+
+        Numbers are normalized in bulk, answered from the hot-number cache
+        where possible and otherwise with one `IN` query per `chunk_size`
+        distinct numbers. Batch results are not written back to the cache,
+        so a nightly job cannot evict the numbers live calls need.
+
+        Returns:
+            dict[str, str | None]: input number -> contact name (None if unknown).
+        """
+        normalized = {number: normalize_phone_number(number) for number in phone_numbers}
+        names: dict[str, str | None] = {}
+        pending = []
+        cached = hot_number_cache.enabled
+        for key in set(normalized.values()):
+            name = hot_number_cache.get(key) if cached else MISSING
+            if name is MISSING:
+                pending.append(key)
+            else:
+                names[key] = name
+
+        for start in range(0, len(pending), chunk_size):
+            chunk = pending[start:start + chunk_size]
+            for alias in contact_databases():
+                names.update(
+                    PhoneNumber.objects.using(alias)
+                    .filter(normalized_number__in=chunk)
+                    .values_list('normalized_number', 'contact__full_name')
+                )
+
+        logger.info('lookup_service.batch', numbers=len(normalized), queried=len(pending))
+        return {number: names.get(key) for number, key in normalized.items()}
+
+    def iter_lookup(self, lines: Iterable[str], chunk_size: int = 500) -> Iterator[dict[str, str | None]]:
+        """
+        Streams results for an arbitrarily long sequence of numbers, one per
+        line, resolving them `chunk_size` at a time with lookup_many.
+
+        Yields {'phone_number', 'name'} per valid number and
+        {'phone_number', 'error'} per invalid one, in input order.
+        """
+        batch: list[str] = []
+        for line in lines:
+            number = line.strip()
+            if not number:
+                continue
+            batch.append(number)
+            if len(batch) >= chunk_size:
+                yield from self._resolve_batch(batch, chunk_size)
+                batch = []
+        if batch:
+            yield from self._resolve_batch(batch, chunk_size)
+
+    def _resolve_batch(self, batch: list[str], chunk_size: int) -> Iterator[dict[str, str | None]]:
+        checked = [(number, *valid_phone_number(number)) for number in batch]
+        names = self.lookup_many((cleaned for _, cleaned, ok in checked if ok), chunk_size)
+        for number, cleaned, ok in checked:
+            if ok:
+                yield {'phone_number': number, 'name': names[cleaned]}
+            else:
+                yield {'phone_number': number, 'error': cleaned}
@@ -0,0 +1,125 @@
+import structlog
+from collections.abc import Callable
+from django.contrib.auth import get_user_model
+from django.db import IntegrityError, transaction
+
+from .hashing_service import get_hashing_pool
+from .signup_service import DEFAULT_GROUPS, get_default_group_ids
+
+logger = structlog.get_logger(__name__)
+
+
+class ProvisioningError(Exception):
+    """
+    Raised when a bulk provisioning batch is rejected.
+    `errors` maps the index of each offending entry to its field errors.
+    """
+
+    def __init__(self, errors: dict[int, dict[str, list[str]]]):
+        super().__init__("Bulk provisioning failed validation.")
+        self.errors = errors
+
+
+class ProvisioningService:
+    """
+    Service class for creating many users at once.
+    """
+
+    def provision_users(self, entries: list[dict], batch_size: int = 500,
+                        hash_passwords: Callable[[list[str]], list[str]] | None = None) -> list:
+        """
+        Creates users and their group memberships in one transaction.
+
+        Each entry needs 'username' and 'password', and may carry 'first_name',
+        'last_name' and 'groups' (default ['reader']). The batch is all or
+        nothing: if any username is repeated or already taken, nothing is created.
+
+        Args:
+            entries (list[dict]): Already-validated user entries.
+            batch_size (int): Rows per INSERT statement.
+            hash_passwords (callable, optional): Hashes the list of passwords.
+                Defaults to the shared, bounded hashing pool; offline callers
+                can pass hash_passwords_parallel to use every core.
+        Returns:
+            list[User]: The created users, in input order.
+        Raises:
+            ProvisioningError: If any username is duplicated or already exists.
+            HashingBusyError: If the hashing pool is at capacity.
+        """
+        User = get_user_model()
+        # NFKC, as create_user does, so look-alike usernames collide
+        usernames = [User.normalize_username(e['username']) for e in entries]
+        self._check_usernames(usernames)
+
+        hash_passwords = hash_passwords or get_hashing_pool().make_passwords
+        hashed = hash_passwords([e['password'] for e in entries])
+        users = [
+            User(
+                username=username,
+                password=password,
+                first_name=entry.get('first_name', ""),
+                last_name=entry.get('last_name', ""),
+            )
+            for username, entry, password in zip(usernames, entries, hashed)
+        ]
+
+        try:
+            self._insert(users, entries, batch_size)
+        except IntegrityError:
+            # a concurrent request took a username after the check
+            self._check_usernames(usernames)
+            raise ProvisioningError({i: {'username': ["Conflicted with a concurrent request; retry."]}
+                                     for i in range(len(entries))})
+
+        logger.info('provisioning_service.created', count=len(users))
+        return users
+
+    def _insert(self, users: list, entries: list[dict], batch_size: int) -> None:
+        User = get_user_model()
+        group_ids = get_default_group_ids()
+        Membership = User.groups.through
+
+        with transaction.atomic():
+            User.objects.bulk_create(users, batch_size=batch_size)
+            if any(u.pk is None for u in users):
+                # backends without RETURNING support: fetch the new ids
+                ids = dict(
+                    User.objects
+                    .filter(username__in=[u.username for u in users])
+                    .values_list('username', 'id')
+                )
+                for u in users:
+                    u.pk = ids[u.username]
+
+            Membership.objects.bulk_create(
+                [
+                    Membership(user_id=user.pk, group_id=group_ids[name])
+                    for user, entry in zip(users, entries)
+                    for name in dict.fromkeys(entry.get('groups') or ['reader'])
+                    if name in DEFAULT_GROUPS
+                ],
+                batch_size=batch_size,
+            )
+
+    def _check_usernames(self, usernames: list[str]) -> None:
+        errors: dict[int, dict[str, list[str]]] = {}
+
+        seen: set[str] = set()
+        for i, username in enumerate(usernames):
+            if username in seen:
+                errors[i] = {'username': ["Duplicate username in request."]}
+            seen.add(username)
+
+        # one set-based query for the whole batch
+        User = get_user_model()
+        taken = set(
+            User.objects
+            .filter(username__in=seen)
+            .values_list('username', flat=True)
+        )
+        for i, username in enumerate(usernames):
+            if username in taken:
+                errors.setdefault(i, {'username': ["Username is already taken."]})
+
+        if errors:
+            raise ProvisioningError(errors)
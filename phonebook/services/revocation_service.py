@@ -0,0 +1,140 @@
+import threading
+import time
+import structlog
+from datetime import datetime, timedelta
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.utils import timezone
+
+from phonebook.models import RevokedToken
+from .bloom_filter import BloomFilter
+
+logger = structlog.get_logger(__name__)
+
+DEFAULT_REVOCATION = {
+    'CAPACITY': 100_000,
+    'ERROR_RATE': 0.001,
+    # seconds between incremental pulls of new denylist rows
+    'REFRESH_INTERVAL': 1.0,
+    # seconds between full rebuilds, which also drop expired tokens
+    'REBUILD_INTERVAL': 3600.0,
+}
+
+# rows committed slightly out of order are picked up by re-reading this overlap
+REFRESH_OVERLAP = timedelta(seconds=5)
+
+
+def _config() -> dict:
+    return {**DEFAULT_REVOCATION, **getattr(settings, 'TOKEN_REVOCATION', {})}
+
+
+class RevocationFilter:
+    """
+    Per-worker Bloom filter over the revoked token denylist.
+
+    It is rebuilt from the unexpired rows on first use and then every
+    REBUILD_INTERVAL, and topped up from recently created rows every
+    REFRESH_INTERVAL, so revocations from other workers land within that
+    interval.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._bloom: BloomFilter | None = None
+        self._seen_until: datetime | None = None
+        self._next_refresh = 0.0
+        self._next_rebuild = 0.0
+
+    def _rebuild(self, conf: dict, now: float) -> None:
+        started = timezone.now()
+        rows = RevokedToken.objects.filter(expires_at__gt=started).values_list('jti', flat=True)
+        jtis = list(rows)
+        bloom = BloomFilter(max(conf['CAPACITY'], 2 * len(jtis)), conf['ERROR_RATE'])
+        for jti in jtis:
+            bloom.add(jti)
+        self._bloom = bloom
+        self._seen_until = started
+        self._next_rebuild = now + conf['REBUILD_INTERVAL']
+        logger.info('revocation_filter.rebuilt', size=len(jtis))
+
+    def _top_up(self) -> None:
+        started = timezone.now()
+        rows = (
+            RevokedToken.objects
+            .filter(created_at__gte=self._seen_until - REFRESH_OVERLAP)
+            .values_list('jti', flat=True)
+        )
+        for jti in rows:
+            self._bloom.add(jti)  # type: ignore[union-attr]
+        self._seen_until = started
+
+    def _refresh_if_due(self) -> None:
+        now = time.monotonic()
+        if now < self._next_refresh:
+            return
+        with self._lock:
+            if now < self._next_refresh:
+                return
+            conf = _config()
+            if self._bloom is None or self._bloom.is_full or now >= self._next_rebuild:
+                self._rebuild(conf, now)
+            else:
+                self._top_up()
+            self._next_refresh = now + conf['REFRESH_INTERVAL']
+
+    def might_contain(self, jti: str) -> bool:
+        self._refresh_if_due()
+        return jti in self._bloom  # type: ignore[operator]
+
+    def add(self, jti: str) -> None:
+        with self._lock:
+            if self._bloom is not None:
+                self._bloom.add(jti)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._bloom = None
+            self._seen_until = None
+            self._next_refresh = 0.0
+            self._next_rebuild = 0.0
+
+
+revocation_filter = RevocationFilter()
+
+
+class TokenRevocationService:
+    """
+    Service class for revoking JWTs before they expire.
+    """
+
+    def revoke(self, jti: str, expires_at: datetime) -> None:
+        """
+        Adds a token id to the persisted denylist and this worker's filter.
+        Revoking an already revoked token is a no-op.
+        """
+        try:
+            with transaction.atomic():
+                RevokedToken.objects.create(jti=jti, expires_at=expires_at)
+        except IntegrityError:
+            pass
+        revocation_filter.add(jti)
+        logger.info('revocation_service.revoked', jti=jti)
+
+    def is_revoked(self, jti: str) -> bool:
+        """
+        Checks a token id against the denylist. Only Bloom filter
+        positives cost a database query.
+        """
+        if not revocation_filter.might_contain(jti):
+            return False
+        return RevokedToken.objects.filter(jti=jti).exists()
+
+    def purge_expired(self) -> int:
+        """
+        Deletes denylist rows whose tokens have expired anyway.
+
+        Returns:
+            int: The number of rows deleted.
+        """
+        deleted, _ = RevokedToken.objects.filter(expires_at__lte=timezone.now()).delete()
+        return deleted
@@ -0,0 +1,65 @@
+import hashlib
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS
+
+# Shard databases are named contacts_0 .. contacts_<CONTACT_SHARDS - 1>
+SHARD_ALIAS_PREFIX = 'contacts_'
+SHARDED_MODELS = ('contact', 'phonenumber', 'phonenumberclaim')
+
+
+def shard_count() -> int:
+    return getattr(settings, 'CONTACT_SHARDS', 0)
+
+
+def is_shard_alias(alias: str) -> bool:
+    return alias.startswith(SHARD_ALIAS_PREFIX)
+
+
+def contact_databases() -> list[str]:
+    """
+    Returns every database alias holding contacts: the shards when
+    CONTACT_SHARDS is set, otherwise just the default database.
+    """
+    count = shard_count()
+    if not count:
+        return [DEFAULT_DB_ALIAS]
+    return [f'{SHARD_ALIAS_PREFIX}{i}' for i in range(count)]
+
+
+def normalize_name(name: str) -> str:
+    """
+    Case- and whitespace-insensitive form of a contact name used as the shard key.
+    """
+    return ' '.join(name.split()).casefold()
+
+
+def shard_for_name(name: str) -> str:
+    """
+    Returns the database alias that owns `name`.
+
+    The key is a blake2b digest of the normalized name, which is stable
+    across processes (unlike hash()), so a name always lands on the same
+    shard and the per-shard unique constraint on full_name stays global.
+    The phone_number constraint does not: contacts with different names
+    and the same number can land on different shards, so sharded creates
+    also take a PhoneNumberClaim on the shard that owns the number.
+    """
+    return _shard_for_key(normalize_name(name))
+
+
+def shard_for_number(phone_number: str) -> str:
+    """
+    Returns the database alias holding the PhoneNumberClaim for `phone_number`.
+
+    Keyed on the number exactly as stored, like its unique constraint, so
+    claims spread over the shards instead of sharing one writer.
+    """
+    return _shard_for_key(phone_number)
+
+
+def _shard_for_key(key: str) -> str:
+    count = shard_count()
+    if not count:
+        return DEFAULT_DB_ALIAS
+    digest = hashlib.blake2b(key.encode('utf-8'), digest_size=8).digest()
+    return f'{SHARD_ALIAS_PREFIX}{int.from_bytes(digest, "big") % count}'
@@ -1,5 +1,48 @@
+import threading
 from django.contrib.auth import get_user_model
 from django.contrib.auth.models import Group
+from django.db import IntegrityError, transaction
+
+from .hashing_service import get_hashing_pool
+
+DEFAULT_GROUPS = ('reader', 'writer')
+
+# name -> id of the default groups, loaded once per process
+_default_group_ids: dict[str, int] = {}
+_default_group_lock = threading.Lock()
+
+
+class UsernameTakenError(Exception):
+    """
+    Raised when the username of a new user is already in use.
+    """
+
+
+def get_default_group_ids() -> dict[str, int]:
+    """
+    Returns the ids of the default groups, querying them only on first use.
+    The groups are provisioned by a migration; any that are missing
+    (e.g. after a database flush) are created here.
+    """
+    if len(_default_group_ids) == len(DEFAULT_GROUPS):
+        return _default_group_ids
+
+    with _default_group_lock:
+        found = dict(
+            Group.objects
+            .filter(name__in=DEFAULT_GROUPS)
+            .values_list('name', 'id')
+        )
+        for name in DEFAULT_GROUPS:
+            if name not in found:
+                found[name] = Group.objects.get_or_create(name=name)[0].pk
+        _default_group_ids.clear()
+        _default_group_ids.update(found)
+    return _default_group_ids
+
+
+def reset_default_group_ids() -> None:
+    _default_group_ids.clear()
 
 
 class SignUpService:
@@ -7,13 +50,14 @@ class SignUpService:
     Service class for managing user sign-up operations.
     """
 
-    def _ensure_default_groups(self):
-        Group.objects.get_or_create(name='reader')
-        Group.objects.get_or_create(name='writer')
-
     def create_user(self, *, username: str, password: str, first_name: str = "", last_name: str = ""):
         """
         Creates a Django auth User, and assigns the 'reader' group to it.
+
+        Username uniqueness is enforced by the INSERT itself; a clash raises
+        UsernameTakenError. The group membership is a single through-table insert.
+        The password is hashed on the shared hashing pool.
+
         Args:
             username (str): The desired username for the new user.
             password (str): The desired password for the new user.
@@ -21,16 +65,35 @@ class SignUpService:
             last_name (str, optional): The last name of the user. Defaults to "".
         Returns:
             User: The created Django auth User instance.
+        Raises:
+            UsernameTakenError: If the username is already in use.
+            HashingBusyError: If the hashing pool is at capacity.
         """
 
         User = get_user_model()
-        self._ensure_default_groups()
-        new_user = User.objects.create_user(
+        # as create_user does: NFKC, so look-alike usernames collide
+        username = User.normalize_username(username)
+        new_user = User(
             username=username,
-            password=password,
             first_name=first_name,
             last_name=last_name
         )
-        reader = Group.objects.get(name='reader')
-        new_user.groups.add(reader)
+        new_user.password = get_hashing_pool().make_password(password)
+
+        try:
+            self._insert_with_reader_group(new_user)
+        except IntegrityError:
+            if User.objects.filter(username=username).exists():
+                raise UsernameTakenError(username)
+            # the cached group id went stale; reload it and try once more
+            reset_default_group_ids()
+            new_user.pk = None
+            self._insert_with_reader_group(new_user)
         return new_user
+
+    def _insert_with_reader_group(self, user) -> None:
+        reader_id = get_default_group_ids()['reader']
+        with transaction.atomic():
+            user.save(force_insert=True)
+            user.groups.through.objects.create(
+                user_id=user.pk, group_id=reader_id)
@@ -0,0 +1,130 @@
+import threading
+import time
+import structlog
+from django.conf import settings
+from django.db import connections
+
+logger = structlog.get_logger(__name__)
+
+WARMUP_MODES = ('off', 'blocking', 'background')
+
+_ready = threading.Event()
+
+
+def is_ready() -> bool:
+    """
+    True once the worker's boot warm-up has finished, or when none is configured.
+    """
+    return _ready.is_set() or settings.WARMUP_ON_BOOT == 'off'
+
+
+def reset_readiness() -> None:
+    _ready.clear()
+
+
+class WarmupService:
+    """
+    Pays the first-request costs of a fresh worker up front: database
+    connections, URL resolution, validators, the contact index when enabled
+    and, optionally, the contact caches.
+
+    A failing step is logged and skipped; readiness flips once every step
+    has run.
+    """
+
+    def __init__(self, prefill_caches: bool | None = None):
+        if prefill_caches is None:
+            prefill_caches = settings.WARMUP_PREFILL_CACHES
+        self.prefill_caches = prefill_caches
+
+    def steps(self):
+        steps = [
+            ('connections', self._open_connections),
+            ('urls', self._resolve_urls),
+            ('validators', self._compile_validators),
+            ('auth', self._load_auth_state),
+        ]
+        if settings.CONTACT_INDEX_ENABLED:
+            steps.append(('contact_index', self._load_contact_index))
+        if self.prefill_caches:
+            steps.append(('caches', self._prefill_caches))
+        return steps
+
+    def run(self) -> dict[str, float]:
+        """
+        Runs every step on the calling thread and marks the worker ready.
+        Returns the milliseconds spent per step.
+        """
+        timings = {}
+        for name, step in self.steps():
+            started = time.perf_counter()
+            try:
+                step()
+            except Exception:
+                logger.exception('warmup_service.step_failed', step=name)
+            timings[name] = round((time.perf_counter() - started) * 1000, 2)
+
+        _ready.set()
+        logger.info('warmup_service.finished', timings_ms=timings)
+        return timings
+
+    def _open_connections(self) -> None:
+        # persistent only when CONN_MAX_AGE > 0; otherwise this checks connectivity
+        for conn in connections.all():
+            conn.ensure_connection()
+
+    def _resolve_urls(self) -> None:
+        from django.urls import get_resolver
+
+        resolver = get_resolver()
+        # imports every view/serializer and builds the reverse lookup tables
+        resolver.url_patterns
+        resolver.reverse_dict
+
+    def _compile_validators(self) -> None:
+        from django.contrib.auth.password_validation import get_default_password_validators
+        from phonebook.api.utilities.util_funcs import valid_name, valid_phone_number
+
+        valid_name("Warm Up")
+        valid_phone_number("670-123-4567")
+        # CommonPasswordValidator reads its password list on creation
+        get_default_password_validators()
+
+    def _load_auth_state(self) -> None:
+        from .revocation_service import revocation_filter
+        from .signup_service import get_default_group_ids
+
+        revocation_filter.might_contain('')
+        get_default_group_ids()
+
+    def _load_contact_index(self) -> None:
+        from .contact_index import contact_index
+
+        contact_index.refresh()
+
+    def _prefill_caches(self) -> None:
+        from rest_framework.settings import api_settings
+        from .contact_cache import ContactListCache
+        from .contact_services import ContactService
+        from phonebook.api.utilities.compression import IDENTITY
+
+        list_cache = ContactListCache()
+        if not list_cache.enabled:
+            return
+        renderer = api_settings.DEFAULT_RENDERER_CLASSES[0]()
+        contacts = ContactService().retrieve_all_contacts()
+        list_cache.set(renderer.media_type, {IDENTITY: renderer.render(contacts, renderer.media_type)})
+
+
+def warm_up_on_boot() -> None:
+    """
+    Runs the warm-up configured by WARMUP_ON_BOOT. Called by config.wsgi / config.asgi.
+
+    'blocking' warms the importing thread (and its DB connection) before the
+    server takes traffic; 'background' lets liveness answer while it runs.
+    """
+    mode = settings.WARMUP_ON_BOOT
+    if mode == 'blocking':
+        WarmupService().run()
+    elif mode == 'background':
+        threading.Thread(target=WarmupService().run, name='phonebook-warmup', daemon=True).start()
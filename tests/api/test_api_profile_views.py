@@ -0,0 +1,75 @@
+import pytest
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import Group
+from django.test import override_settings
+from rest_framework.test import APIClient
+
+from config import settings_api
+from config.authentication.tokens import PhonebookRefreshToken
+from phonebook.services import ContactService
+
+pytestmark = pytest.mark.django_db
+
+api_profile = override_settings(
+    MIDDLEWARE=settings_api.MIDDLEWARE,
+    ROOT_URLCONF=settings_api.ROOT_URLCONF,
+)
+
+
+"""FIXTURES"""
+
+
+@pytest.fixture
+def writer_client():
+    user = get_user_model().objects.create_user(username='writer', password='writerpass123')
+    user.groups.add(Group.objects.get_or_create(name='writer')[0])
+    client = APIClient(enforce_csrf_checks=True)
+    access = PhonebookRefreshToken.for_user(user).access_token
+    client.credentials(HTTP_AUTHORIZATION=f'Bearer {access}')
+    return client
+
+
+"""API TESTS"""
+
+
+def test_api_profile_trims_middleware():
+    assert not any(
+        name.startswith(('django.contrib.', 'django.middleware.csrf', 'django.middleware.clickjacking'))
+        for name in settings_api.MIDDLEWARE
+    )
+    assert 'django.contrib.admin' not in settings_api.INSTALLED_APPS
+    assert 'rest_framework.renderers.BrowsableAPIRenderer' not in \
+        settings_api.REST_FRAMEWORK['DEFAULT_RENDERER_CLASSES']
+
+
+@api_profile
+def test_api_profile_serves_jwt_endpoints(writer_client):
+    created = writer_client.post(
+        '/phone-book/add/', {'name': 'Bruce Schneier', 'phone_number': '(703)111-2121'},
+        format='json')
+    assert created.status_code == 201
+
+    listed = writer_client.get('/phone-book/list/')
+    assert listed.status_code == 200
+    assert listed.json() == [{'name': 'Bruce Schneier', 'phone_number': '(703)111-2121'}]
+
+    assert 'Set-Cookie' not in created
+    assert 'X-Frame-Options' not in created
+
+
+@api_profile
+def test_api_profile_has_no_admin():
+    assert APIClient().get('/admin/').status_code == 404
+
+
+@api_profile
+def test_api_profile_lists_contacts():
+    ContactService().create_new_contact('Cher', '670-123-4567')
+    reader = get_user_model().objects.create_user(username='reader', password='readerpass123')
+    reader.groups.add(Group.objects.get_or_create(name='reader')[0])
+    client = APIClient()
+    client.force_authenticate(user=reader)
+
+    response = client.get('/phone-book/list/')
+    assert response.status_code == 200
+    assert response.json() == [{'name': 'Cher', 'phone_number': '670-123-4567'}]
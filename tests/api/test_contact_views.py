@@ -1,10 +1,16 @@
+import gzip
+import json
 import pytest
+from unittest import mock
+from django.test import override_settings
 from django.urls import reverse
-from rest_framework.test import APITestCase, APIClient
+from rest_framework.test import APITestCase, APITransactionTestCase, APIClient
 from django.contrib.auth import get_user_model
 from django.contrib.auth.models import Group
 
+from phonebook.api.contacts.serializers import CreateContactInputSerializer
 from phonebook.models import Contact, PhoneNumber
+from phonebook.services import ContactService
 
 pytestmark = pytest.mark.django_db
 
@@ -31,7 +37,7 @@ class TestContactListAPI(APITestCase):
     def test_get_contacts(self):
         response = self.api_client.get(self.url)
         assert response.status_code == 200  # type: ignore
-        assert response.data == []  # Expecting an empty list initially #type:ignore
+        assert response.json() == []  # Expecting an empty list initially #type:ignore
 
     def test_get_contacts_with_existing_data(self):
         c1 = Contact.objects.create(full_name="Bruce Schneier")
@@ -74,6 +80,148 @@ class TestContactListAPI(APITestCase):
         response = client.get(self.url)
         assert response.status_code == 401  # Unauthorized #type: ignore
 
+    @override_settings(CONTACT_LIST_CACHE_TTL=0)
+    def test_fast_path_output_identical_to_serializer(self):
+        c1 = Contact.objects.create(full_name="Bruce Schneier")
+        PhoneNumber.objects.create(contact=c1, phone_number='(703)111-2121')
+        Contact.objects.create(full_name="Cher")
+        c3 = Contact.objects.create(full_name="Zoë O’Malley")
+        PhoneNumber.objects.create(contact=c3, phone_number='+45 12 34 56 78')
+
+        bodies = {}
+        for fast_path in (True, False):
+            with override_settings(CONTACT_LIST_FAST_PATH=fast_path):
+                response = self.api_client.get(self.url)
+            assert response.status_code == 200
+            bodies[fast_path] = response.content
+
+        assert bodies[True] == bodies[False]
+        assert json.loads(bodies[True]) == [
+            {"name": "Bruce Schneier", "phone_number": "(703)111-2121"},
+            {"name": "Cher", "phone_number": None},
+            {"name": "Zoë O’Malley", "phone_number": "+45 12 34 56 78"},
+        ]
+
+    @override_settings(CONTACT_LIST_FAST_PATH=True)
+    def test_fast_path_skips_serializer(self):
+        Contact.objects.create(full_name="Cher")
+        with mock.patch(
+                'phonebook.api.contacts.views.ContactListOutputSerializer') as serializer:
+            response = self.api_client.get(self.url)
+
+        serializer.assert_not_called()
+        assert response.json() == [{"name": "Cher", "phone_number": None}]
+
+    def test_get_contacts_sparse_fields(self):
+        c1 = Contact.objects.create(full_name="Bruce Schneier")
+        PhoneNumber.objects.create(contact=c1, phone_number='(703)111-2121')
+
+        response = self.api_client.get(self.url, {'fields': 'name'})
+        assert response.status_code == 200
+        assert response.json() == [{"name": "Bruce Schneier"}]
+
+        # canonical order and no duplicates, whatever the request says
+        response = self.api_client.get(self.url, {'fields': 'updated_at, name,name'})
+        assert list(response.json()[0]) == ["name", "updated_at"]
+
+    def test_get_contacts_unknown_field(self):
+        response = self.api_client.get(self.url, {'fields': 'name,password'})
+        assert response.status_code == 400
+        assert 'fields' in response.json()
+
+    @override_settings(CONTACT_LIST_CACHE_TTL=60)
+    def test_get_contacts_filtered_and_ordered(self):
+        service = ContactService()
+        service.create_new_contact("Bruce Schneier", "(703)111-2121")
+        service.create_new_contact("Brian Kernighan", "+44 20 7946 0958")
+        service.create_new_contact("Cher", "670-123-4567")
+
+        response = self.api_client.get(self.url, {'name_prefix': 'Br', 'ordering': '-name', 'fields': 'name'})
+        assert response.status_code == 200
+        assert response.json() == [{"name": "Bruce Schneier"}, {"name": "Brian Kernighan"}]
+
+        response = self.api_client.get(self.url, {'number_prefix': '+44'})
+        assert response.json() == [{"name": "Brian Kernighan", "phone_number": "+44 20 7946 0958"}]
+
+        response = self.api_client.get(self.url, {'created_after': '2000-01-01T00:00:00Z', 'ordering': '-created_at'})
+        assert [row['name'] for row in response.json()] == ["Cher", "Brian Kernighan", "Bruce Schneier"]
+
+    def test_get_contacts_invalid_filters(self):
+        for params in ({'ordering': 'password'}, {'number_prefix': '70x'}, {'created_after': 'yesterday'}):
+            response = self.api_client.get(self.url, params)
+            assert response.status_code == 400
+            assert set(response.json()) == set(params)
+
+    @override_settings(CONTACT_LIST_CACHE_TTL=0)
+    def test_fast_path_timestamps_identical_to_serializer(self):
+        c1 = Contact.objects.create(full_name="Bruce Schneier")
+        PhoneNumber.objects.create(contact=c1, phone_number='(703)111-2121')
+        Contact.objects.create(full_name="Cher")
+
+        bodies = {}
+        for fast_path in (True, False):
+            with override_settings(CONTACT_LIST_FAST_PATH=fast_path):
+                response = self.api_client.get(self.url, {'fields': 'name,created_at,updated_at'})
+            assert response.status_code == 200
+            bodies[fast_path] = response.content
+
+        assert bodies[True] == bodies[False]
+        assert json.loads(bodies[True])[0]['created_at'].endswith('Z')
+
+    @override_settings(CONTACT_LIST_CACHE_TTL=60)
+    def test_get_contacts_cache_keyed_by_fields(self):
+        ContactService().create_new_contact("Alice Smith", "670-123-4567")
+
+        assert self.api_client.get(self.url, {'fields': 'name'}).json() == [{"name": "Alice Smith"}]
+        assert self.api_client.get(self.url).json() == [
+            {"name": "Alice Smith", "phone_number": "670-123-4567"}]
+
+    @override_settings(RESPONSE_COMPRESSION={'MIN_SIZE': 10})
+    def test_get_contacts_gzip(self):
+        for i, name in enumerate(["Alice Smith", "Bob Jones", "Carol White"]):
+            c = Contact.objects.create(full_name=name)
+            PhoneNumber.objects.create(contact=c, phone_number=f'670-123-456{i}')
+
+        response = self.api_client.get(self.url, HTTP_ACCEPT_ENCODING='gzip')
+        assert response.status_code == 200
+        assert response['Content-Encoding'] == 'gzip'
+        assert 'Accept-Encoding' in response['Vary']
+        assert json.loads(gzip.decompress(response.content)) == [
+            {"name": "Alice Smith", "phone_number": "670-123-4560"},
+            {"name": "Bob Jones", "phone_number": "670-123-4561"},
+            {"name": "Carol White", "phone_number": "670-123-4562"},
+        ]
+
+    @override_settings(RESPONSE_COMPRESSION={'MIN_SIZE': 10}, CONTACT_LIST_CACHE_TTL=60)
+    def test_get_contacts_repeat_hits_skip_query_and_compression(self):
+        ContactService().create_new_contact("Alice Smith", "670-123-4567")
+
+        first = self.api_client.get(self.url, HTTP_ACCEPT_ENCODING='gzip')
+
+        with mock.patch.object(ContactService, 'retrieve_all_contacts') as retrieve, \
+                mock.patch('phonebook.api.utilities.compression.compress') as compress:
+            second = self.api_client.get(self.url, HTTP_ACCEPT_ENCODING='gzip')
+            plain = self.api_client.get(self.url)
+
+        retrieve.assert_not_called()
+        compress.assert_not_called()
+        assert second.content == first.content
+        assert plain.json() == [
+            {"name": "Alice Smith", "phone_number": "670-123-4567"}]
+
+    @override_settings(CONTACT_LIST_CACHE_TTL=60)
+    def test_get_contacts_cache_invalidated_by_writes(self):
+        service = ContactService()
+        service.create_new_contact("Alice Smith", "670-123-4567")
+        assert len(self.api_client.get(self.url).json()) == 1
+
+        service.create_new_contact("Bob Jones", "670-123-4568")
+        assert len(self.api_client.get(self.url).json()) == 2
+
+        service.delete_contact(name="Alice Smith")
+        assert self.api_client.get(self.url).json() == [
+            {"name": "Bob Jones", "phone_number": "670-123-4568"}]
+
 
 class TestContactCreateAPI(APITestCase):
 
@@ -248,6 +396,21 @@ class TestContactCreateAPI(APITestCase):
             ]
         }
 
+    @mock.patch.object(CreateContactInputSerializer, 'validate_phone_number', lambda self, value: value)
+    @mock.patch.object(CreateContactInputSerializer, 'validate_name', lambda self, value: value)
+    def test_create_contact_losing_a_race_is_400(self):
+        # both creates passed validation; the other one committed first
+        ContactService().create_new_contact("Alice Smith", "(123) 456-7890")
+
+        self.client.force_authenticate(user=self.writer)  # type: ignore
+        response = self.client.post(
+            self.url, data={"name": "Alice Smith", "phone_number": "(555) 010-0000"}, format='json')
+
+        assert response.status_code == 400
+        assert response.json() == {
+            "name": ["A contact with this name already exists."]
+        }
+
     def test_create_contact_invalid_phone_number_format(self):
         request_body = {
             "name": "Alice Smith",
@@ -277,6 +440,30 @@ class TestContactCreateAPI(APITestCase):
         }
 
 
+@override_settings(CONTACT_GROUP_COMMIT=True)
+class TestContactCreateGroupCommitAPI(APITransactionTestCase):
+
+    def setUp(self):
+        self.writer = get_user_model().objects.create_user(username='writer_user1', password='writerpass123')
+        self.writer.groups.add(Group.objects.get_or_create(name='writer')[0])
+        self.client.force_authenticate(user=self.writer)  # type: ignore
+
+    @mock.patch.object(CreateContactInputSerializer, 'validate_phone_number', lambda self, value: value)
+    @mock.patch.object(CreateContactInputSerializer, 'validate_name', lambda self, value: value)
+    def test_duplicate_in_a_group_commit_is_400(self):
+        first = self.client.post(
+            reverse('contact-add'), data={"name": "Alice Smith", "phone_number": "(123) 456-7890"}, format='json')
+        second = self.client.post(
+            reverse('contact-add'), data={"name": "Bob Jones", "phone_number": "(123) 456-7890"}, format='json')
+
+        assert first.status_code == 201
+        assert second.status_code == 400
+        assert second.json() == {
+            "phone_number": ["This phone number is already associated with another contact."]
+        }
+        assert Contact.objects.count() == 1
+
+
 class TestContactDeleteAPI(APITestCase):
 
     @classmethod
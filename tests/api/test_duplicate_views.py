@@ -0,0 +1,61 @@
+import pytest
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import Group
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from phonebook.services import ContactService
+
+pytestmark = pytest.mark.django_db
+
+
+"""FIXTURES"""
+
+
+def make_client(username, group):
+    user = get_user_model().objects.create_user(username=username, password='Pass!2345')
+    user.groups.add(Group.objects.get_or_create(name=group)[0])
+    client = APIClient()
+    client.force_authenticate(user=user)
+    return client
+
+
+@pytest.fixture
+def duplicates():
+    service = ContactService()
+    service.create_new_contact("John Smith", "670-123-4567")
+    service.create_new_contact("john smith", "(670)123-4567")
+    service.create_new_contact("Cher", "555-0100")
+    service.create_new_contact("CHER", "555-0199")
+
+
+"""API TESTS"""
+
+
+def test_report(duplicates):
+    response = make_client('writer_user', 'writer').get(reverse('duplicate-report'))
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body['total_groups'] == 2
+    assert body['total_duplicates'] == 2
+    assert body['conflicts'] == 1
+    smith = body['groups'][0]
+    assert smith['keep']['name'] == "John Smith"
+    assert [c['phone_number'] for c in smith['duplicates']] == ["(670)123-4567"]
+    assert smith['reasons'] == ['name', 'number'] and smith['conflict'] is False
+
+
+def test_report_limit(duplicates):
+    client = make_client('writer_user', 'writer')
+
+    response = client.get(reverse('duplicate-report'), {'limit': 1})
+    assert len(response.json()['groups']) == 1
+    assert response.json()['total_groups'] == 2
+
+    assert client.get(reverse('duplicate-report'), {'limit': 0}).status_code == 400
+
+
+def test_reader_forbidden():
+    response = make_client('reader_user', 'reader').get(reverse('duplicate-report'))
+    assert response.status_code == 403
@@ -0,0 +1,131 @@
+import gzip
+import os
+import pytest
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import Group
+from django.test import override_settings
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from phonebook.models import Job
+from phonebook.services import ContactService, JobWorker
+
+pytestmark = pytest.mark.django_db
+
+CSV = "name,phone_number\nBruce Schneier,(703)111-2121\n"
+
+
+"""FIXTURES"""
+
+
+@pytest.fixture(autouse=True)
+def export_dir(tmp_path):
+    with override_settings(EXPORT_DIR=str(tmp_path)):
+        yield tmp_path
+
+
+@pytest.fixture
+def client():
+    user = get_user_model().objects.create_user(username='reader_user', password='ReaderPass!23')
+    user.groups.add(Group.objects.get(name='reader'))
+    api_client = APIClient()
+    api_client.force_authenticate(user=user)
+    return api_client
+
+
+@pytest.fixture
+def contact():
+    ContactService().create_new_contact('Bruce Schneier', '(703)111-2121')
+
+
+def export(client, fmt='csv'):
+    response = client.post(reverse('export-create'), {'format': fmt}, format='json')
+    return response, response['Location']
+
+
+def run_worker():
+    JobWorker(owner='test-worker').run(burst=True)
+
+
+"""API TESTS"""
+
+
+def test_export_lifecycle(client, contact):
+    response, url = export(client)
+    assert response.status_code == 202
+    assert url == reverse('export-detail', args=[response.json()['id']])
+
+    pending = client.get(url)
+    assert pending.status_code == 202
+    assert pending['Retry-After'] == '2'
+    assert pending.json()['status'] == 'queued'
+
+    run_worker()
+
+    download = client.get(url)
+    assert download.status_code == 200
+    assert download['Content-Type'] == 'application/gzip'
+    assert download['Accept-Ranges'] == 'bytes'
+    assert 'contacts.csv.gz' in download['Content-Disposition']
+    assert gzip.decompress(b''.join(download.streaming_content)).decode() == CSV
+
+
+def test_export_range_requests(client, contact):
+    _, url = export(client)
+    run_worker()
+    body = b''.join(client.get(url).streaming_content)
+
+    partial = client.get(url, HTTP_RANGE='bytes=10-')
+    assert partial.status_code == 206
+    assert partial['Content-Range'] == f'bytes 10-{len(body) - 1}/{len(body)}'
+    assert b''.join(partial.streaming_content) == body[10:]
+
+    suffix = client.get(url, HTTP_RANGE='bytes=-5')
+    assert b''.join(suffix.streaming_content) == body[-5:]
+
+    stale = client.get(url, HTTP_RANGE='bytes=10-', HTTP_IF_RANGE='"older-version"')
+    assert stale.status_code == 200
+
+    beyond = client.get(url, HTTP_RANGE=f'bytes={len(body)}-')
+    assert beyond.status_code == 416
+    assert beyond['Content-Range'] == f'bytes */{len(body)}'
+
+
+def test_repeat_export_reuses_artifact_until_a_write(client, contact):
+    response, url = export(client)
+    run_worker()
+
+    again, again_url = export(client)
+    assert again.status_code == 200 and again_url == url
+
+    ContactService().create_new_contact('Cher', '670-123-4567')
+    changed, changed_url = export(client)
+    assert changed.status_code == 202 and changed_url != url
+
+
+def test_failed_and_expired_exports(client, contact):
+    _, url = export(client)
+    job = Job.objects.get()
+    Job.objects.update(status=Job.Status.FAILED, error='RuntimeError: disk full')
+    assert client.get(url).status_code == 409
+
+    Job.objects.update(status=Job.Status.QUEUED)
+    run_worker()
+    job.refresh_from_db()
+    os.remove(job.result['path'])
+    assert client.get(url).status_code == 410
+
+
+def test_export_invalid_format(client):
+    response = client.post(reverse('export-create'), {'format': 'xlsx'}, format='json')
+    assert response.status_code == 400
+    assert 'format' in response.json()
+
+
+def test_export_unknown_or_other_job(client):
+    other = Job.objects.create(kind='purge_revoked_tokens')
+    assert client.get(reverse('export-detail', args=[other.pk])).status_code == 404
+
+
+def test_export_no_auth():
+    assert APIClient().post(reverse('export-create')).status_code == 401
@@ -0,0 +1,49 @@
+import pytest
+from django.test import override_settings
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from phonebook.services.warmup_service import WarmupService
+
+pytestmark = pytest.mark.django_db
+
+
+"""API TESTS"""
+
+
+def test_liveness_needs_no_auth_or_queries(django_assert_num_queries):
+    with django_assert_num_queries(0):
+        response = APIClient().get(reverse('health-live'))
+
+    assert response.status_code == 200
+    assert response.json() == {'status': 'ok'}
+
+
+@override_settings(WARMUP_ON_BOOT='off')
+def test_readiness_without_warmup_is_ready(django_assert_num_queries):
+    with django_assert_num_queries(0):
+        response = APIClient().get(reverse('health-ready'))
+
+    assert response.status_code == 200
+    assert response.json() == {'status': 'ready'}
+
+
+@override_settings(WARMUP_ON_BOOT='background')
+def test_readiness_flips_after_warmup(django_assert_num_queries):
+    client = APIClient()
+    with django_assert_num_queries(0):
+        response = client.get(reverse('health-ready'))
+    assert response.status_code == 503
+    assert response.json() == {'status': 'warming_up'}
+
+    WarmupService().run()
+
+    with django_assert_num_queries(0):
+        response = client.get(reverse('health-ready'))
+    assert response.status_code == 200
+
+
+def test_health_ignores_bad_credentials():
+    client = APIClient()
+    client.credentials(HTTP_AUTHORIZATION='Bearer not-a-token')
+    assert client.get(reverse('health-live')).status_code == 200
@@ -0,0 +1,73 @@
+import pytest
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import Group
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from phonebook.services import JobService
+
+pytestmark = pytest.mark.django_db
+
+
+"""FIXTURES"""
+
+
+def make_client(username, **extra):
+    user = get_user_model().objects.create_user(username=username, password='Pass!2345', **extra)
+    user.groups.add(Group.objects.get(name='reader'))
+    client = APIClient()
+    client.force_authenticate(user=user)
+    return client, user
+
+
+@pytest.fixture
+def admin():
+    return make_client('admin_user', is_staff=True)
+
+
+@pytest.fixture
+def reader():
+    return make_client('reader_user')
+
+
+"""API TESTS"""
+
+
+def test_admin_queues_job(admin):
+    client, user = admin
+    response = client.post(reverse('job-create'), {'kind': 'purge_revoked_tokens'}, format='json')
+
+    assert response.status_code == 202
+    body = response.json()
+    assert body['kind'] == 'purge_revoked_tokens' and body['status'] == 'queued'
+
+    detail = client.get(reverse('job-detail', args=[body['id']]))
+    assert detail.status_code == 200
+    assert detail.json()['progress'] == 0.0
+
+
+def test_unknown_kind_rejected(admin):
+    client, _ = admin
+    response = client.post(reverse('job-create'), {'kind': 'reticulate_splines'}, format='json')
+
+    assert response.status_code == 400
+    assert 'kind' in response.json()
+
+
+def test_non_admin_cannot_queue(reader):
+    client, _ = reader
+    response = client.post(reverse('job-create'), {'kind': 'purge_revoked_tokens'}, format='json')
+    assert response.status_code == 403
+
+
+def test_users_only_see_their_own_jobs(reader, admin):
+    client, user = reader
+    own = JobService().enqueue('purge_revoked_tokens', created_by_id=user.pk)
+    other = JobService().enqueue('purge_revoked_tokens', created_by_id=admin[1].pk)
+
+    assert client.get(reverse('job-detail', args=[own.pk])).status_code == 200
+    assert client.get(reverse('job-detail', args=[other.pk])).status_code == 404
+
+
+def test_job_detail_no_auth():
+    assert APIClient().get(reverse('job-detail', args=[1])).status_code == 401
@@ -0,0 +1,94 @@
+import json
+import pytest
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import Group
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from phonebook.services import ContactService
+
+pytestmark = pytest.mark.django_db
+
+
+"""FIXTURES"""
+
+
+@pytest.fixture
+def client():
+    user = get_user_model().objects.create_user(username='reader_user', password='ReaderPass!23')
+    user.groups.add(Group.objects.get(name='reader'))
+    api_client = APIClient()
+    api_client.force_authenticate(user=user)
+    return api_client
+
+
+@pytest.fixture
+def contact():
+    ContactService().create_new_contact('Bruce Schneier', '(703)111-2121')
+
+
+"""API TESTS"""
+
+
+def test_lookup_known_number(client, contact):
+    response = client.get(reverse('contact-lookup'), {'phone_number': '+1 703.111.2121'})
+
+    assert response.status_code == 200
+    assert response.json() == {'phone_number': '+1 703.111.2121', 'name': 'Bruce Schneier'}
+
+
+def test_lookup_unknown_number(client, contact):
+    response = client.get(reverse('contact-lookup'), {'phone_number': '670-123-4567'})
+
+    assert response.status_code == 404
+
+
+def test_lookup_invalid_number(client):
+    response = client.get(reverse('contact-lookup'), {'phone_number': '<script>'})
+
+    assert response.status_code == 400
+    assert 'phone_number' in response.json()
+
+
+def test_lookup_missing_number(client):
+    assert client.get(reverse('contact-lookup')).status_code == 400
+
+
+def test_lookup_no_auth():
+    response = APIClient().get(reverse('contact-lookup'), {'phone_number': '670-123-4567'})
+    assert response.status_code == 401
+
+
+def test_batch_lookup(client, contact):
+    response = client.post(reverse('contact-lookup-batch'), {
+        'phone_numbers': ['+1 703.111.2121', '670-123-4567', '<script>'],
+    }, format='json')
+
+    assert response.status_code == 200
+    assert response.json() == {
+        'results': {'+1 703.111.2121': 'Bruce Schneier', '670-123-4567': None},
+        'invalid': ['<script>'],
+    }
+
+
+def test_batch_lookup_rejects_empty_and_oversized_batches(client):
+    url = reverse('contact-lookup-batch')
+    assert client.post(url, {'phone_numbers': []}, format='json').status_code == 400
+    assert client.post(url, {'phone_numbers': ['670-123-4567'] * 10_001}, format='json').status_code == 400
+
+
+def test_batch_lookup_stream(client, contact):
+    response = client.generic('POST', reverse('contact-lookup-batch-stream'),
+                              '703-111-2121\n<script>\n670-123-4567\n', content_type='text/plain')
+
+    assert response.status_code == 200
+    assert response['Content-Type'] == 'application/x-ndjson'
+    rows = [json.loads(line) for line in b''.join(response.streaming_content).splitlines()]
+    assert rows[0] == {'phone_number': '703-111-2121', 'name': 'Bruce Schneier'}
+    assert rows[1]['phone_number'] == '<script>' and 'error' in rows[1]
+    assert rows[2] == {'phone_number': '670-123-4567', 'name': None}
+
+
+def test_batch_lookup_no_auth():
+    response = APIClient().post(reverse('contact-lookup-batch'), {'phone_numbers': ['670-123-4567']}, format='json')
+    assert response.status_code == 401
@@ -219,3 +219,69 @@ class TestSignUpAPIView(APITestCase):
         data = response.json()
 
         assert data['last_name'] == ["Invalid characters in name."]
+
+
+class TestBulkProvisionAPIView(APITestCase):
+
+    def setUp(self):
+        self.url = reverse('user-bulk-provision')
+        self.api_client: APIClient = APIClient()
+        self.client = self.api_client
+        User = get_user_model()
+        self.admin = User.objects.create_user(
+            username='admin', password='AdminPass!23', is_staff=True)
+
+    def test_bulk_provision_successful(self):
+        payload = {
+            "users": [
+                {"username": "alice", "password": "StrongPass!23"},
+                {"username": "bob", "password": "StrongPass!23", "groups": ["writer"]},
+            ]
+        }
+        self.client.force_authenticate(user=self.admin)  # type: ignore
+        response = self.client.post(self.url, data=payload, format='json')
+
+        assert response.status_code == 201  # type: ignore
+        assert response.json() == {"created": 2, "usernames": ["alice", "bob"]}
+        bob = get_user_model().objects.get(username="bob")
+        assert list(bob.groups.values_list('name', flat=True)) == ['writer']
+
+    def test_bulk_provision_requires_admin(self):
+        User = get_user_model()
+        plain = User.objects.create_user(username='plain', password='PlainPass!23')
+        self.client.force_authenticate(user=plain)  # type: ignore
+        response = self.client.post(self.url, data={"users": []}, format='json')
+        assert response.status_code == 403  # type: ignore
+
+        response = APIClient().post(self.url, data={"users": []}, format='json')
+        assert response.status_code == 401  # type: ignore
+
+    def test_bulk_provision_invalid_entries(self):
+        payload = {
+            "users": [
+                {"username": "alice", "password": "StrongPass!23"},
+                {"username": "bob", "password": "123"},
+            ]
+        }
+        self.client.force_authenticate(user=self.admin)  # type: ignore
+        response = self.client.post(self.url, data=payload, format='json')
+
+        assert response.status_code == 400  # type: ignore
+        errors = response.json()['users']
+        assert errors[0] == {}
+        assert 'password' in errors[1]
+        assert not get_user_model().objects.filter(username="alice").exists()
+
+    def test_bulk_provision_taken_username(self):
+        payload = {
+            "users": [
+                {"username": "admin", "password": "StrongPass!23"},
+                {"username": "bob", "password": "StrongPass!23"},
+            ]
+        }
+        self.client.force_authenticate(user=self.admin)  # type: ignore
+        response = self.client.post(self.url, data=payload, format='json')
+
+        assert response.status_code == 400  # type: ignore
+        assert response.json() == {
+            "users": [{"username": ["Username is already taken."]}, {}]}
@@ -0,0 +1,33 @@
+import pytest
+from django.core.cache import caches
+
+from phonebook.services.contact_index import contact_index
+from phonebook.services.contact_snapshot import snapshot_reader
+from phonebook.services.lookup_service import hot_number_cache
+from phonebook.services.revocation_service import revocation_filter
+from phonebook.services.warmup_service import reset_readiness
+
+
+@pytest.fixture(autouse=True)
+def clear_caches():
+    # cached payloads are keyed by write generation, which survives DB rollbacks
+    for cache in caches.all():
+        cache.clear()
+
+
+@pytest.fixture(autouse=True)
+def reset_revocation_filter():
+    # the per-worker filter would otherwise outlive each test's DB rollback
+    revocation_filter.reset()
+
+
+@pytest.fixture(autouse=True)
+def reset_worker_readiness():
+    reset_readiness()
+
+
+@pytest.fixture(autouse=True)
+def reset_contact_index():
+    contact_index.reset()
+    snapshot_reader.reset()
+    hot_number_cache.clear()
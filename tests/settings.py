@@ -11,6 +11,20 @@ DATABASES = {
     }
 }
 
+# Shard databases stay idle unless a test sets CONTACT_SHARDS
+CONTACT_SHARDS = 0
+for _shard in range(2):
+    DATABASES[f"contacts_{_shard}"] = {
+        "ENGINE": "django.db.backends.sqlite3",
+        "NAME": ":memory:",
+    }
+
+# Cheap hashing so user fixtures stay fast
+PASSWORD_HASH_ITERATIONS = 1_000
+
+# No throttling unless a test opts in
+REST_FRAMEWORK = {**REST_FRAMEWORK, 'DEFAULT_THROTTLE_RATES': {}}
+
 # Quieter logs during tests
 LOGGING["root"]["level"] = "CRITICAL"
 for k in LOGGING.get("loggers", {}):
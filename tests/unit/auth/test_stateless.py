@@ -0,0 +1,154 @@
+import pytest
+from unittest import mock
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import Group
+from django.urls import reverse
+from rest_framework.test import APIClient, APIRequestFactory
+from rest_framework_simplejwt.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.tokens import AccessToken, RefreshToken
+
+from config.authentication import IsReaderOrWriter, IsWriter
+from config.authentication.stateless import (
+    ClaimsUser,
+    StatelessJWTAuthentication,
+    user_claims_cache,
+)
+from config.authentication.tokens import PhonebookRefreshToken
+from phonebook.api.contacts.views import ContactListAPI
+from phonebook.services import ContactService
+
+pytestmark = pytest.mark.django_db
+
+
+"""
+FIXTURES
+"""
+
+
+@pytest.fixture(autouse=True)
+def clear_user_cache():
+    user_claims_cache.clear()
+    yield
+    user_claims_cache.clear()
+
+
+@pytest.fixture
+def reader():
+    user = get_user_model().objects.create_user(
+        username='reader_user', password='ReaderPass!23')
+    user.groups.add(Group.objects.get(name='reader'))
+    return user
+
+
+def authenticate(raw_token: str):
+    request = APIRequestFactory().get('/', HTTP_AUTHORIZATION=f'Bearer {raw_token}')
+    return StatelessJWTAuthentication().authenticate(request)
+
+
+"""
+UNIT TESTS
+"""
+
+
+def test_tokens_carry_identity_claims(reader):
+    access = PhonebookRefreshToken.for_user(reader).access_token
+
+    assert access['username'] == 'reader_user'
+    assert access['groups'] == ['reader']
+    assert access['is_superuser'] is False
+    assert access['is_staff'] is False
+
+
+def test_login_issues_tokens_with_claims(reader):
+    response = APIClient().post(reverse('token_obtain_pair'), data={
+        'username': 'reader_user', 'password': 'ReaderPass!23'}, format='json')
+
+    assert response.status_code == 200
+    assert AccessToken(response.json()['access'])['groups'] == ['reader']
+
+
+def test_signup_issues_tokens_with_claims():
+    response = APIClient().post(reverse('user-signup'), data={
+        'username': 'newuser1', 'password': 'StrongPass!23'}, format='json')
+
+    assert response.status_code == 201
+    assert AccessToken(response.json()['access_token'])['groups'] == ['reader']
+
+
+def test_stateless_user_needs_no_queries(reader, django_assert_num_queries):
+    raw = str(PhonebookRefreshToken.for_user(reader).access_token)
+    authenticate(raw)  # builds this worker's revocation filter
+
+    with django_assert_num_queries(0):
+        user, _ = authenticate(raw)
+        request = APIRequestFactory().get('/')
+        request.user = user
+        assert IsReaderOrWriter().has_permission(request, None) is True
+        assert IsWriter().has_permission(request, None) is False
+
+    assert isinstance(user, ClaimsUser)
+    assert str(user.pk) == str(reader.pk)
+    assert user.username == 'reader_user'
+
+
+def test_tokens_without_claims_are_looked_up_once(reader, settings, django_assert_num_queries):
+    settings.JWT_USER_CACHE_TTL = 30
+    raw = str(RefreshToken.for_user(reader).access_token)
+
+    user, _ = authenticate(raw)
+    assert user.group_names == frozenset({'reader'})
+
+    with django_assert_num_queries(0):
+        cached, _ = authenticate(raw)
+    assert cached.group_names == frozenset({'reader'})
+
+
+def test_tokens_without_claims_reject_inactive_users(reader):
+    reader.is_active = False
+    reader.save()
+    raw = str(RefreshToken.for_user(reader).access_token)
+
+    with pytest.raises(AuthenticationFailed):
+        authenticate(raw)
+
+
+def test_refresh_picks_up_group_changes(reader):
+    refresh = PhonebookRefreshToken.for_user(reader)
+    reader.groups.add(Group.objects.get(name='writer'))
+
+    response = APIClient().post(reverse('token_refresh'), data={
+        'refresh': str(refresh)}, format='json')
+
+    assert response.status_code == 200
+    assert AccessToken(response.json()['access'])['groups'] == ['reader', 'writer']
+
+
+def test_refresh_rejects_inactive_users(reader):
+    refresh = PhonebookRefreshToken.for_user(reader)
+    reader.is_active = False
+    reader.save()
+
+    response = APIClient().post(reverse('token_refresh'), data={
+        'refresh': str(refresh)}, format='json')
+    assert response.status_code == 401
+
+
+"""
+API TESTS
+"""
+
+
+def test_cached_list_request_runs_zero_queries(reader, settings, django_assert_num_queries):
+    settings.CONTACT_LIST_CACHE_TTL = 60
+    ContactService().create_new_contact("Alice Smith", "670-123-4567")
+    client = APIClient()
+    client.credentials(
+        HTTP_AUTHORIZATION=f'Bearer {PhonebookRefreshToken.for_user(reader).access_token}')
+
+    with mock.patch.object(ContactListAPI, 'authentication_classes', [StatelessJWTAuthentication]):
+        assert client.get(reverse('contact-list')).status_code == 200
+
+        with django_assert_num_queries(0):
+            response = client.get(reverse('contact-list'))
+
+    assert response.json() == [{"name": "Alice Smith", "phone_number": "670-123-4567"}]
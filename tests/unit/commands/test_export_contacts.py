@@ -0,0 +1,82 @@
+import csv
+import gzip
+import io
+import json
+import pytest
+from django.core.management import call_command
+from django.core.management.base import CommandError
+
+from phonebook.models import Contact, PhoneNumber
+
+pytestmark = pytest.mark.django_db
+
+
+"""
+FIXTURES
+"""
+
+
+@pytest.fixture
+def contacts():
+    c1 = Contact.objects.create(full_name="Bruce Schneier")
+    PhoneNumber.objects.create(contact=c1, phone_number='(703)111-2121')
+    Contact.objects.create(full_name="Cher")
+    c3 = Contact.objects.create(full_name="John O'Malley-Smith")
+    PhoneNumber.objects.create(contact=c3, phone_number='1 (703) 123-1234')
+
+
+"""
+TESTS
+"""
+
+
+def test_export_csv_to_stdout(contacts):
+    out = io.StringIO()
+    call_command('export_contacts', stdout=out)
+
+    rows = list(csv.reader(io.StringIO(out.getvalue())))
+    assert rows == [
+        ['name', 'phone_number'],
+        ['Bruce Schneier', '(703)111-2121'],
+        ['Cher', ''],
+        ["John O'Malley-Smith", '1 (703) 123-1234'],
+    ]
+
+
+def test_export_ndjson_to_stdout(contacts):
+    out = io.StringIO()
+    call_command('export_contacts', '--format', 'ndjson', stdout=out)
+
+    lines = [json.loads(line) for line in out.getvalue().splitlines()]
+    assert lines == [
+        {"name": "Bruce Schneier", "phone_number": "(703)111-2121"},
+        {"name": "Cher", "phone_number": None},
+        {"name": "John O'Malley-Smith", "phone_number": "1 (703) 123-1234"},
+    ]
+
+
+def test_export_gzip_file(contacts, tmp_path):
+    path = tmp_path / 'contacts.ndjson.gz'
+    out = io.StringIO()
+    call_command('export_contacts', '--format', 'ndjson',
+                 '--output', str(path), '--chunk-size', '1', stdout=out)
+
+    with gzip.open(path, 'rt', encoding='utf-8') as fh:
+        lines = [json.loads(line) for line in fh]
+
+    assert [line['name'] for line in lines] == [
+        "Bruce Schneier", "Cher", "John O'Malley-Smith"]
+    assert "Exported 3 contacts" in out.getvalue()
+
+
+def test_export_empty_book_writes_header_only(tmp_path):
+    path = tmp_path / 'contacts.csv'
+    call_command('export_contacts', '--output', str(path), stdout=io.StringIO())
+
+    assert path.read_text(encoding='utf-8') == 'name,phone_number\n'
+
+
+def test_export_rejects_invalid_chunk_size():
+    with pytest.raises(CommandError):
+        call_command('export_contacts', '--chunk-size', '0',
+                     stdout=io.StringIO())
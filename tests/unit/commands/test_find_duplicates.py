@@ -0,0 +1,60 @@
+import io
+import json
+import pytest
+from django.core.management import call_command
+from django.core.management.base import CommandError
+
+from phonebook.models import Contact
+from phonebook.services import ContactService
+
+pytestmark = pytest.mark.django_db
+
+
+"""
+FIXTURES
+"""
+
+
+@pytest.fixture
+def duplicates():
+    service = ContactService()
+    service.create_new_contact("John Smith", "670-123-4567")
+    service.create_new_contact("john smith", "(670)123-4567")
+    service.create_new_contact("Bruce Schneier", "(703)111-2121")
+
+
+"""
+TESTS
+"""
+
+
+def test_report_only(duplicates):
+    out = io.StringIO()
+    call_command('find_duplicates', stdout=out)
+
+    assert "keep 'John Smith' 670-123-4567" in out.getvalue()
+    assert "dup 'john smith' (670)123-4567" in out.getvalue()
+    assert "Found 1 duplicate groups (1 duplicates, 0 with conflicting numbers)." in out.getvalue()
+    assert Contact.objects.count() == 3
+
+
+def test_json_report(duplicates):
+    out = io.StringIO()
+    call_command('find_duplicates', '--format', 'json', stdout=out, stderr=io.StringIO())
+
+    group, = json.loads(out.getvalue())
+    assert group['keep']['name'] == "John Smith"
+    assert group['reasons'] == ['name', 'number']
+
+
+def test_merge(duplicates):
+    out = io.StringIO()
+    call_command('find_duplicates', '--merge', '--batch-size', '1', stdout=out)
+
+    assert "Removed 1 contacts." in out.getvalue()
+    assert sorted(Contact.objects.values_list('full_name', flat=True)) == ["Bruce Schneier", "John Smith"]
+
+
+def test_rejects_bad_arguments():
+    with pytest.raises(CommandError):
+        call_command('find_duplicates', '--batch-size', '0')
@@ -0,0 +1,87 @@
+import io
+import pytest
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import override_settings
+
+from phonebook.models import Contact, PhoneNumber, PhoneNumberClaim
+from phonebook.services import ContactService
+from phonebook.services.sharding import shard_for_name, shard_for_number
+
+SHARDS = ['contacts_0', 'contacts_1']
+
+pytestmark = pytest.mark.django_db(databases=['default', *SHARDS])
+
+NAMES = ['Bruce Schneier', 'Cher', 'Alice Smith', 'Bob Jones', 'Carol White']
+
+
+"""
+FIXTURES
+"""
+
+
+@pytest.fixture
+def unsharded_contacts():
+    service = ContactService()
+    for i, name in enumerate(NAMES):
+        service.create_new_contact(name, f'670-123-456{i}')
+    Contact.objects.create(full_name='No Number')
+    with override_settings(CONTACT_SOFT_DELETE=True):
+        service.create_new_contact('Gone', '555-0199')
+        service.delete_contact(name='Gone')
+    return dict(Contact.objects.values_list('full_name', 'created_at'))
+
+
+"""
+TESTS
+"""
+
+
+@override_settings(CONTACT_SHARDS=2)
+def test_move_keeps_contacts_and_claims_their_numbers(unsharded_contacts):
+    out = io.StringIO()
+    call_command('move_contacts_to_shards', '--batch-size', '2', stdout=out)
+
+    assert "Moved 6 contacts to the shards." in out.getvalue()
+    assert not Contact.all_objects.exists()
+    assert not PhoneNumber.all_objects.exists()
+    for name, created_at in unsharded_contacts.items():
+        contact = Contact.objects.using(shard_for_name(name)).get(full_name=name)
+        assert contact.created_at == created_at
+    for i, name in enumerate(NAMES):
+        number = f'670-123-456{i}'
+        assert PhoneNumber.objects.using(shard_for_name(name)).get(phone_number=number).normalized_number
+        assert PhoneNumberClaim.objects.using(shard_for_number(number)).get(phone_number=number).full_name == name
+
+    rows = ContactService().retrieve_all_contacts(('name',))
+    assert [row['name'] for row in rows] == [*NAMES, 'No Number']
+
+
+@override_settings(CONTACT_SHARDS=2)
+def test_move_can_be_repeated(unsharded_contacts):
+    call_command('move_contacts_to_shards', stdout=io.StringIO())
+    # an interrupted run: copied to the shards, not yet deleted from the default database
+    contact = Contact.objects.create(full_name='Cher')
+    PhoneNumber.objects.create(contact=contact, phone_number='670-123-4561')
+
+    out = io.StringIO()
+    call_command('move_contacts_to_shards', stdout=out)
+
+    assert "Moved 0 contacts to the shards." in out.getvalue()
+    assert not Contact.objects.exists()
+    assert Contact.objects.using(shard_for_name('Cher')).filter(full_name='Cher').count() == 1
+
+
+@override_settings(CONTACT_SHARDS=2)
+def test_move_refuses_numbers_claimed_by_other_contacts(unsharded_contacts):
+    PhoneNumberClaim.objects.using(shard_for_number('670-123-4561')).create(
+        phone_number='670-123-4561', full_name='Someone Else')
+
+    with pytest.raises(CommandError):
+        call_command('move_contacts_to_shards', stdout=io.StringIO())
+    assert Contact.objects.filter(full_name='Cher').exists()
+
+
+def test_move_needs_shards():
+    with pytest.raises(CommandError):
+        call_command('move_contacts_to_shards', stdout=io.StringIO())
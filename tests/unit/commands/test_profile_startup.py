@@ -0,0 +1,59 @@
+import io
+import pytest
+from django.core.management import call_command
+from django.core.management.base import CommandError
+
+from phonebook.management.commands.profile_startup import (
+    ImportTiming,
+    package_totals,
+    parse_importtime,
+)
+
+
+"""
+FIXTURES
+"""
+
+
+REPORT = """\
+import time: self [us] | cumulative | imported package
+import time:       120 |        120 |   _io
+import time:       300 |       1500 | django
+import time:      1080 |       1080 |   django.utils.version
+import time:        40 |         40 | phonebook.apps
+"""
+
+
+"""
+TESTS
+"""
+
+
+def test_parse_importtime_skips_header():
+    assert parse_importtime(REPORT) == [
+        ImportTiming('_io', 120, 120),
+        ImportTiming('django', 300, 1500),
+        ImportTiming('django.utils.version', 1080, 1080),
+        ImportTiming('phonebook.apps', 40, 40),
+    ]
+
+
+def test_package_totals_sums_self_time_largest_first():
+    assert package_totals(parse_importtime(REPORT)) == {
+        'django': 1380, '_io': 120, 'phonebook': 40,
+    }
+
+
+def test_profile_startup_reports_boot():
+    out = io.StringIO()
+    call_command('profile_startup', stage='setup', top=3, budget_ms=60_000, stdout=out)
+
+    report = out.getvalue()
+    assert report.startswith('tests.settings (setup): ')
+    assert 'Slowest modules' in report
+    assert 'Within the 60000 ms budget.' in report
+
+
+def test_profile_startup_over_budget():
+    with pytest.raises(CommandError, match='over the 0 ms budget'):
+        call_command('profile_startup', stage='settings', budget_ms=0, stdout=io.StringIO())
@@ -0,0 +1,52 @@
+import io
+import pytest
+from unittest import mock
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.core.management.base import CommandError
+
+pytestmark = pytest.mark.django_db
+
+
+def test_provision_users_from_csv(tmp_path):
+    path = tmp_path / 'users.csv'
+    path.write_text(
+        "username,password,first_name,last_name,groups\n"
+        "alice,SafePassword123!,Alice,Smith,\n"
+        "bob,SafePassword123!,,,reader;writer\n",
+        encoding='utf-8',
+    )
+    out = io.StringIO()
+    call_command('provision_users', str(path), stdout=out)
+
+    User = get_user_model()
+    assert "Provisioned 2 users." in out.getvalue()
+    assert User.objects.get(username='alice').last_name == 'Smith'
+    assert set(User.objects.get(username='bob').groups.values_list('name', flat=True)) == {
+        'reader', 'writer'}
+
+
+def test_provision_users_from_stdin_leaves_it_open():
+    stdin = io.StringIO("username,password\nalice,SafePassword123!\n")
+    out = io.StringIO()
+    with mock.patch('sys.stdin', stdin):
+        call_command('provision_users', '-', stdout=out)
+
+    assert "Provisioned 1 users." in out.getvalue()
+    assert not stdin.closed
+
+
+def test_provision_users_reports_invalid_rows(tmp_path):
+    path = tmp_path / 'users.csv'
+    path.write_text(
+        "username,password\n"
+        "alice,SafePassword123!\n"
+        "<script>,SafePassword123!\n",
+        encoding='utf-8',
+    )
+    err = io.StringIO()
+    with pytest.raises(CommandError):
+        call_command('provision_users', str(path), stdout=io.StringIO(), stderr=err)
+
+    assert "line 3: username" in err.getvalue()
+    assert not get_user_model().objects.exists()
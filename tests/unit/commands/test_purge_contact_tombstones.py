@@ -0,0 +1,50 @@
+import io
+import pytest
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import override_settings
+
+from phonebook.models import Contact
+from phonebook.services import ContactService
+
+pytestmark = pytest.mark.django_db
+
+
+"""
+FIXTURES
+"""
+
+
+@pytest.fixture
+def tombstones():
+    service = ContactService()
+    service.create_new_contact("Bruce Schneier", "(703)111-2121")
+    service.create_new_contact("Cher", "670-123-4567")
+    with override_settings(CONTACT_SOFT_DELETE=True):
+        service.delete_contact(name="Cher")
+
+
+"""
+TESTS
+"""
+
+
+def test_purge_respects_retention(tombstones):
+    out = io.StringIO()
+    call_command('purge_contact_tombstones', stdout=out)
+
+    assert "Purged 0 contact tombstones." in out.getvalue()
+    assert Contact.all_objects.count() == 2
+
+
+def test_purge_older_than(tombstones):
+    out = io.StringIO()
+    call_command('purge_contact_tombstones', '--older-than', '0', '--batch-size', '1', stdout=out)
+
+    assert "Purged 1 contact tombstones." in out.getvalue()
+    assert list(Contact.all_objects.values_list('full_name', flat=True)) == ["Bruce Schneier"]
+
+
+def test_purge_rejects_bad_arguments():
+    with pytest.raises(CommandError):
+        call_command('purge_contact_tombstones', '--batch-size', '0')
@@ -0,0 +1,42 @@
+import io
+import pytest
+from django.core.management import call_command
+from django.core.management.base import CommandError
+
+from phonebook.models import Job
+from phonebook.services import JobService
+
+pytestmark = pytest.mark.django_db
+
+
+"""
+TESTS
+"""
+
+
+def test_burst_worker_runs_queued_jobs():
+    JobService().enqueue('purge_revoked_tokens')
+    JobService().enqueue('purge_contact_tombstones', {'older_than': 0})
+
+    out = io.StringIO()
+    call_command('run_worker', '--burst', stdout=out)
+
+    assert "Ran 2 jobs." in out.getvalue()
+    assert list(Job.objects.order_by('pk').values_list('status', 'result')) == [
+        (Job.Status.SUCCEEDED, {'purged': 0}),
+        (Job.Status.SUCCEEDED, {'purged': 0}),
+    ]
+
+
+def test_worker_limited_to_kinds():
+    JobService().enqueue('purge_revoked_tokens')
+
+    out = io.StringIO()
+    call_command('run_worker', '--burst', '--kinds', 'purge_contact_tombstones', stdout=out)
+
+    assert "Ran 0 jobs." in out.getvalue()
+
+
+def test_unknown_kinds_rejected():
+    with pytest.raises(CommandError):
+        call_command('run_worker', '--burst', '--kinds', 'reticulate_splines')
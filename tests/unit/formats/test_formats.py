@@ -0,0 +1,122 @@
+import io
+import datetime
+import decimal
+import pytest
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import Group
+from django.urls import reverse
+from rest_framework.exceptions import ParseError
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APIClient
+
+from phonebook.api.formats import (
+    FastJSONParser,
+    FastJSONRenderer,
+    MessagePackParser,
+    MessagePackRenderer,
+)
+from phonebook.models import Contact, PhoneNumber
+
+
+"""
+FIXTURES
+"""
+
+
+@pytest.fixture
+def sample_data():
+    return [
+        {"name": "Bruce Schneier", "phone_number": "(703)111-2121"},
+        {"name": "Cher", "phone_number": None},
+        {"name": "Zoë O’Malley ", "phone_number": "+45 12 34 56 78"},
+        {
+            "created_at": datetime.datetime(2025, 1, 2, 3, 4, 5, 678901, tzinfo=datetime.timezone.utc),
+            "amount": decimal.Decimal('1.50'),
+            1: "int key",
+        },
+    ]
+
+
+@pytest.fixture
+def writer_client():
+    writer_group, _ = Group.objects.get_or_create(name='writer')
+    writer = get_user_model().objects.create_user(
+        username='writer_user1', password='writerpass123')
+    writer.groups.add(writer_group)
+    client = APIClient()
+    client.force_authenticate(user=writer)
+    return client
+
+
+"""
+UNIT TESTS
+"""
+
+
+def test_fast_json_matches_drf_json(sample_data):
+    assert FastJSONRenderer().render(sample_data) == JSONRenderer().render(sample_data)
+
+
+def test_fast_json_indent_falls_back(sample_data):
+    media_type = 'application/json; indent=2'
+    assert FastJSONRenderer().render(sample_data, media_type) == \
+        JSONRenderer().render(sample_data, media_type)
+
+
+def test_fast_json_none_renders_empty():
+    assert FastJSONRenderer().render(None) == b''
+
+
+def test_fast_json_parser_round_trip():
+    data = {"name": "Zoë", "numbers": [1, 2.5, None, True]}
+    stream = io.BytesIO(FastJSONRenderer().render(data))
+    assert FastJSONParser().parse(stream) == data
+
+
+def test_fast_json_parser_rejects_invalid_json():
+    with pytest.raises(ParseError):
+        FastJSONParser().parse(io.BytesIO(b'{"name": '))
+
+
+def test_msgpack_round_trip():
+    pytest.importorskip('msgpack')
+    data = [{"name": "Zoë", "phone_number": None}]
+    stream = io.BytesIO(MessagePackRenderer().render(data))
+    assert MessagePackParser().parse(stream) == data
+
+
+def test_msgpack_parser_rejects_garbage():
+    pytest.importorskip('msgpack')
+    with pytest.raises(ParseError):
+        MessagePackParser().parse(io.BytesIO(b'\xc1'))
+
+
+"""
+API TESTS
+"""
+
+
+@pytest.mark.django_db
+def test_list_negotiates_msgpack(writer_client):
+    msgpack = pytest.importorskip('msgpack')
+    c = Contact.objects.create(full_name="Bruce Schneier")
+    PhoneNumber.objects.create(contact=c, phone_number='(703)111-2121')
+
+    response = writer_client.get(
+        reverse('contact-list'), HTTP_ACCEPT='application/msgpack')
+    assert response.status_code == 200
+    assert response['Content-Type'] == 'application/msgpack'
+    assert msgpack.unpackb(response.content) == [
+        {"name": "Bruce Schneier", "phone_number": "(703)111-2121"}]
+
+
+@pytest.mark.django_db
+def test_create_accepts_msgpack_body(writer_client):
+    msgpack = pytest.importorskip('msgpack')
+    body = msgpack.packb({"name": "Alice Smith", "phone_number": "(123) 456-7890"})
+
+    response = writer_client.post(
+        reverse('contact-add'), data=body, content_type='application/msgpack')
+    assert response.status_code == 201
+    assert response.json() == {
+        "name": "Alice Smith", "phone_number": "(123) 456-7890"}
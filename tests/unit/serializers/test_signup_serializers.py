@@ -92,7 +92,8 @@ class TestSignUpSerializerInput:
         assert not serializer.is_valid()
         assert 'username' in serializer.errors
 
-    def test_signup_input_denies_duplicate_username(self, user_factory):
+    def test_signup_input_leaves_duplicate_username_to_insert(self, user_factory, django_assert_num_queries):
+        # uniqueness is enforced by SignUpService.create_user, not a pre-check query
         user_factory(username='existing_user')
         data = {
             'username': 'existing_user',
@@ -100,8 +101,8 @@ class TestSignUpSerializerInput:
         }
 
         serializer = SignUpSerializerInput(data=data)
-        assert not serializer.is_valid()
-        assert 'username' in serializer.errors
+        with django_assert_num_queries(0):
+            assert serializer.is_valid()
 
     def test_signup_input_denies_invalid_phone_chars(self):
         data = {
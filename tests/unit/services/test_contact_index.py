@@ -0,0 +1,184 @@
+import io
+import pytest
+from django.core.management import call_command
+from django.http import Http404
+from django.test import override_settings
+
+from phonebook.models import Contact, PhoneNumber
+from phonebook.services import ContactService
+from phonebook.services.contact_index import ContactIndex, contact_index
+
+pytestmark = pytest.mark.django_db
+
+
+"""
+FIXTURES
+"""
+
+
+@pytest.fixture
+def service():
+    return ContactService()
+
+
+@pytest.fixture
+def indexed():
+    with override_settings(CONTACT_INDEX_ENABLED=True):
+        yield contact_index
+
+
+"""
+UNIT TESTS
+"""
+
+
+def test_index_looks_up_by_name_and_any_number_format(service, indexed):
+    service.create_new_contact('Bruce Schneier', '(703)111-2121')
+
+    assert indexed.get_by_name('Bruce Schneier').phone_number == '(703)111-2121'
+    assert indexed.get_by_number('+1 703.111.2121').name == 'Bruce Schneier'
+    assert indexed.get_by_name('Cher') is None
+    assert indexed.get_by_number('670-123-4567') is None
+
+
+def test_index_hits_are_confirmed_by_primary_key(service, indexed, django_assert_num_queries):
+    service.create_new_contact('Bruce Schneier', '(703)111-2121')
+    indexed.refresh()
+
+    with django_assert_num_queries(2):
+        assert service._check_name_exists('Bruce Schneier') is True
+        assert service._check_phone_number_exists('(703)111-2121') is True
+
+
+def test_stale_index_hits_are_not_trusted(service, indexed):
+    service.create_new_contact('Bruce Schneier', '(703)111-2121')
+    indexed.refresh()
+    # deleted by another worker: this worker's generation did not move
+    Contact.objects.all().delete()
+
+    assert service._check_name_exists('Bruce Schneier') is False
+    assert service._check_phone_number_exists('(703)111-2121') is False
+
+
+def test_index_misses_are_confirmed_against_the_database(service, indexed, django_assert_num_queries):
+    indexed.refresh()
+    # written by another worker: this worker's generation did not move
+    contact = Contact.objects.create(full_name='Cher')
+    PhoneNumber.objects.create(contact=contact, phone_number='670-123-4567', normalized_number='16701234567')
+
+    with django_assert_num_queries(2):
+        assert service._check_name_exists('Cher') is True
+        assert service._check_phone_number_exists('670-123-4567') is True
+    assert service._check_name_exists('Nobody Here') is False
+
+    service.delete_contact(name='Cher')
+    assert not Contact.objects.exists()
+
+
+def test_index_tops_up_new_contacts_incrementally(service, indexed, django_assert_num_queries):
+    service.create_new_contact('Bruce Schneier', '(703)111-2121')
+    indexed.refresh()
+    service.create_new_contact('Cher', '670-123-4567')
+
+    # one query for new/changed rows, one row count
+    with django_assert_num_queries(2):
+        assert indexed.get_by_name('Cher').phone_number == '670-123-4567'
+    assert len(indexed) == 2
+
+
+def test_index_picks_up_a_number_added_after_its_contact(indexed):
+    contact = Contact.objects.create(full_name='Cher')
+    indexed.refresh()
+    PhoneNumber.objects.create(contact=contact, phone_number='670-123-4567')
+    ContactService().create_new_contact('Bruce Schneier', '(703)111-2121')
+
+    assert indexed.get_by_number('670-123-4567').name == 'Cher'
+
+
+def test_index_reloads_after_deletes(service, indexed):
+    service.create_new_contact('Bruce Schneier', '(703)111-2121')
+    service.create_new_contact('Cher', '670-123-4567')
+    indexed.refresh()
+
+    Contact.objects.filter(full_name='Cher').delete()
+    service.create_new_contact('Alice Smith', '123-1234')
+
+    assert indexed.get_by_name('Cher') is None
+    assert indexed.get_by_number('670-123-4567') is None
+    assert len(indexed) == 2
+
+
+def test_own_deletes_do_not_reload_the_index(service, indexed, django_assert_num_queries):
+    service.create_new_contact('Bruce Schneier', '(703)111-2121')
+    service.create_new_contact('Cher', '670-123-4567')
+    service.create_new_contact('Alice Smith', '123-1234')
+    indexed.refresh()
+    # written by another worker, so deleting it takes the database path
+    contact = Contact.objects.create(full_name='Dave Jones')
+    PhoneNumber.objects.create(contact=contact, phone_number='555-0100', normalized_number='5550100')
+
+    service.delete_contact(name='Cher')
+    service.delete_contact(phone_number='123-1234')
+    service.delete_contact(name='Dave Jones')
+
+    # one query for new/changed rows, one row count
+    with django_assert_num_queries(2):
+        assert indexed.get_by_name('Cher') is None
+    assert indexed.get_by_number('123-1234') is None
+    assert len(indexed) == 1
+
+
+@override_settings(CONTACT_SOFT_DELETE=True)
+def test_index_evicts_tombstones_without_reloading(service, indexed, django_assert_num_queries):
+    service.create_new_contact('Bruce Schneier', '(703)111-2121')
+    service.create_new_contact('Cher', '670-123-4567')
+    indexed.refresh()
+
+    service.delete_contact(name='Cher')
+
+    # one query for new/changed rows, one row count
+    with django_assert_num_queries(2):
+        assert indexed.get_by_name('Cher') is None
+    assert indexed.get_by_number('670-123-4567') is None
+    assert len(indexed) == 1
+
+
+def test_number_in_another_format_falls_back_to_database(service, indexed):
+    service.create_new_contact('Bruce Schneier', '(703)111-2121')
+
+    assert service._check_phone_number_exists('703-111-2121') is False
+    assert service._check_phone_number_exists('(703)111-2121') is True
+
+
+def test_delete_through_index(service, indexed):
+    service.create_new_contact('Bruce Schneier', '(703)111-2121')
+    service.create_new_contact('Cher', '670-123-4567')
+    indexed.refresh()
+
+    service.delete_contact(name='Bruce Schneier')
+    service.delete_contact(phone_number='670-123-4567')
+
+    assert not Contact.objects.exists()
+    assert not PhoneNumber.objects.exists()
+
+
+def test_delete_missing_contact_through_index(service, indexed, django_assert_num_queries):
+    indexed.refresh()
+    with pytest.raises(Http404):
+        service.delete_contact(name='Nobody Here')
+
+
+def test_load_replaces_contents():
+    index = ContactIndex()
+    index.load([(1, 'Bruce Schneier', '(703)111-2121'), (2, 'Cher', None)])
+
+    assert len(index) == 2
+    assert index._by_number == {'17031112121': 1}
+
+
+def test_footprint_command_reports_per_million():
+    out = io.StringIO()
+    call_command('contact_index_footprint', contacts=1000, stdout=out)
+
+    assert out.getvalue().startswith('1000 contacts: ')
+    assert 'per million contacts' in out.getvalue()
@@ -1,7 +1,11 @@
 import pytest
+from datetime import timedelta
+from django.http import Http404
+from django.test import override_settings
+from django.utils import timezone
 
 from phonebook.models import Contact, PhoneNumber
-from phonebook.services import ContactService
+from phonebook.services import ContactService, LookupService
 
 pytestmark = pytest.mark.django_db
 
@@ -63,6 +67,68 @@ def test_retrieve_all_contacts():
     }
 
 
+def test_retrieve_all_contacts_projects_requested_fields(create_contact, django_assert_num_queries):
+    create_contact("Bruce Schneier", "(703)111-2121")
+
+    with django_assert_num_queries(1) as captured:
+        results = ContactService().retrieve_all_contacts(('name',))
+
+    assert results == [{"name": "Bruce Schneier"}]
+    sql = captured.captured_queries[0]['sql']
+    assert 'JOIN' not in sql and 'created_at' not in sql
+
+
+def test_retrieve_all_contacts_with_timestamps(create_contact):
+    contact = create_contact("Bruce Schneier", "(703)111-2121")
+
+    results = ContactService().retrieve_all_contacts(('name', 'phone_number', 'created_at', 'updated_at'))
+
+    assert results == [{
+        "name": "Bruce Schneier",
+        "phone_number": "(703)111-2121",
+        "created_at": contact.created_at,
+        "updated_at": contact.updated_at,
+    }]
+
+
+def test_retrieve_all_contacts_filters(create_contact):
+    service = ContactService()
+    service.create_new_contact("Bruce Schneier", "(703)111-2121")
+    service.create_new_contact("Brian Kernighan", "+44 20 7946 0958")
+    create_contact("Cher")
+
+    def names(**kwargs):
+        return [row['name'] for row in service.retrieve_all_contacts(('name',), **kwargs)]
+
+    assert names(filters={'name_prefix': 'Br'}) == ["Brian Kernighan", "Bruce Schneier"]
+    assert names(filters={'name_prefix': 'br'}) == []
+    assert names(filters={'number_prefix': '44'}) == ["Brian Kernighan"]
+    assert names(filters={'number_prefix': '1703'}) == ["Bruce Schneier"]
+    assert names(filters={'created_after': timezone.now() + timedelta(minutes=1)}) == []
+    assert names(filters={'updated_before': timezone.now() + timedelta(minutes=1)}, ordering='-updated_at') == [
+        "Cher", "Brian Kernighan", "Bruce Schneier"]
+    assert names(ordering='-name') == ["Cher", "Bruce Schneier", "Brian Kernighan"]
+
+
+@pytest.mark.parametrize('filters, ordering, index', [
+    ({'name_prefix': 'Br'}, None, 'sqlite_autoindex_phonebook_contact_1'),
+    ({}, 'name', 'sqlite_autoindex_phonebook_contact_1'),
+    ({'number_prefix': '44'}, None, 'phonebook_phonenumber_normalized_number'),
+    ({'created_after': timezone.now()}, None, 'contact_created_idx'),
+    ({'created_before': timezone.now()}, '-created_at', 'contact_created_idx'),
+    ({}, 'created_at', 'contact_created_idx'),
+    ({'updated_after': timezone.now()}, 'updated_at', 'contact_updated_idx'),
+    ({}, '-updated_at', 'contact_updated_idx'),
+])
+def test_list_queries_use_indexes(filters, ordering, index):
+    queryset = ContactService().contact_queryset(filters, ordering)
+    plan = queryset.values_list('full_name', 'phone_number__phone_number').explain()
+
+    first_step = plan.splitlines()[0]
+    assert index in first_step
+    assert 'TEMP B-TREE' not in plan or 'number_prefix' in filters
+
+
 def test_check_name_exists(create_contact):
     create_contact(full_name="Bruce Schneier")
     svc = ContactService()
@@ -153,3 +219,50 @@ def test_delete_contact_raises_for_nonexistent_contact():
     svc = ContactService()
     with pytest.raises(Exception):
         svc.delete_contact(name="Non Existent")
+
+
+@override_settings(CONTACT_SOFT_DELETE=True)
+def test_soft_delete_is_one_update_and_hides_the_contact(django_assert_num_queries):
+    service = ContactService()
+    service.create_new_contact("Bruce Schneier", "(703)111-2121")
+
+    with django_assert_num_queries(1) as captured:
+        service.delete_contact(name="Bruce Schneier")
+
+    assert captured.captured_queries[0]['sql'].startswith('UPDATE')
+    assert Contact.all_objects.get().deleted_at is not None
+    assert service.retrieve_all_contacts() == []
+    assert service._check_name_exists("Bruce Schneier") is False
+    assert service._check_phone_number_exists("(703)111-2121") is False
+    assert LookupService().lookup("703-111-2121") is None
+    with pytest.raises(Http404):
+        service.delete_contact(phone_number="(703)111-2121")
+
+
+@override_settings(CONTACT_SOFT_DELETE=True)
+def test_soft_delete_by_number_and_recreate():
+    service = ContactService()
+    service.create_new_contact("Bruce Schneier", "(703)111-2121")
+    service.delete_contact(phone_number="(703)111-2121")
+
+    # the tombstone holding the name and number is purged to make room
+    service.create_new_contact("Bruce Schneier", "(703)111-2121")
+
+    assert Contact.all_objects.count() == 1
+    assert service.retrieve_all_contacts() == [{"name": "Bruce Schneier", "phone_number": "(703)111-2121"}]
+
+
+@override_settings(CONTACT_SOFT_DELETE=True)
+def test_purge_tombstones_in_batches(django_assert_num_queries):
+    service = ContactService()
+    for i in range(5):
+        service.create_new_contact(f"Contact Person{i}", f"670-123-456{i}")
+        service.delete_contact(name=f"Contact Person{i}")
+    service.create_new_contact("Cher", "670-123-4569")
+    Contact.all_objects.filter(full_name="Contact Person4").update(deleted_at=timezone.now() + timedelta(hours=1))
+
+    assert service.purge_tombstones(timedelta(0), batch_size=2) == 4
+
+    assert list(Contact.all_objects.values_list('full_name', flat=True).order_by('pk')) == [
+        "Contact Person4", "Cher"]
+    assert PhoneNumber.all_objects.count() == 2
@@ -0,0 +1,140 @@
+import io
+import pytest
+from unittest import mock
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import override_settings
+
+from phonebook.models import Contact
+from phonebook.services import ContactService
+from phonebook.services.contact_snapshot import ContactSnapshot, snapshot_reader, write_snapshot
+
+pytestmark = pytest.mark.django_db
+
+
+"""
+FIXTURES
+"""
+
+
+@pytest.fixture
+def contacts():
+    service = ContactService()
+    service.create_new_contact('Bruce Schneier', '(703)111-2121')
+    service.create_new_contact('Zoë O’Malley', '+45 12 34 56 78')
+    Contact.objects.create(full_name='Cher')
+
+
+@pytest.fixture
+def snapshot_path(tmp_path):
+    path = tmp_path / 'contacts.snap'
+    with override_settings(CONTACT_SNAPSHOT_PATH=str(path)), \
+            mock.patch('phonebook.services.contact_snapshot.CHECK_INTERVAL', 0):
+        yield path
+
+
+"""
+UNIT TESTS
+"""
+
+
+def test_snapshot_lookups(contacts, tmp_path):
+    path = tmp_path / 'contacts.snap'
+    assert write_snapshot(path)[0] == 3
+    snapshot = ContactSnapshot(path)
+
+    assert len(snapshot) == 3
+    assert snapshot.get_by_name('Zoë O’Malley') == ('Zoë O’Malley', '+45 12 34 56 78')
+    assert snapshot.get_by_name('Cher') == ('Cher', None)
+    assert snapshot.get_by_name('Nobody') is None
+    assert snapshot.get_by_number('1 (703) 111-2121') == ('Bruce Schneier', '(703)111-2121')
+    assert snapshot.get_by_number('670-123-4567') is None
+    assert list(snapshot.iter_rows()) == [
+        ('Bruce Schneier', '(703)111-2121'),
+        ('Zoë O’Malley', '+45 12 34 56 78'),
+        ('Cher', None),
+    ]
+    snapshot.close()
+
+
+def test_snapshot_binary_search_finds_every_row(tmp_path):
+    service = ContactService()
+    for i in range(300):
+        service.create_new_contact(f'Person {chr(65 + i % 26)}{chr(97 + i // 26)}', f'670-123-{i:04d}')
+
+    path = tmp_path / 'contacts.snap'
+    write_snapshot(path)
+    snapshot = ContactSnapshot(path)
+
+    for name, number in Contact.objects.values_list('full_name', 'phone_number__phone_number'):
+        assert snapshot.get_by_name(name) == (name, number)
+        assert snapshot.get_by_number(number) == (name, number)
+
+
+def test_rejects_other_files(tmp_path):
+    path = tmp_path / 'contacts.snap'
+    path.write_bytes(b'x' * 128)
+    with pytest.raises(ValueError):
+        ContactSnapshot(path)
+
+
+def test_service_reads_current_snapshot(contacts, snapshot_path, django_assert_num_queries):
+    write_snapshot(snapshot_path)
+    service = ContactService()
+
+    with django_assert_num_queries(0):
+        rows = service.retrieve_all_contacts()
+        assert service._check_name_exists('Cher') is True
+        assert service._check_phone_number_exists('670-123-4567') is False
+    assert rows == [
+        {'name': 'Bruce Schneier', 'phone_number': '(703)111-2121'},
+        {'name': 'Zoë O’Malley', 'phone_number': '+45 12 34 56 78'},
+        {'name': 'Cher', 'phone_number': None},
+    ]
+
+
+def test_service_ignores_snapshot_after_a_write(contacts, snapshot_path):
+    write_snapshot(snapshot_path)
+    service = ContactService()
+    service.create_new_contact('Alice Smith', '123-1234')
+
+    assert snapshot_reader.current() is None
+    assert service._check_name_exists('Alice Smith') is True
+    assert len(service.retrieve_all_contacts()) == 4
+
+
+def test_reader_maps_republished_file(contacts, snapshot_path):
+    write_snapshot(snapshot_path)
+    first = snapshot_reader.current()
+
+    ContactService().create_new_contact('Alice Smith', '123-1234')
+    write_snapshot(snapshot_path)
+    second = snapshot_reader.current()
+
+    assert second is not first
+    assert len(second) == 4
+    # the replaced mapping stays readable for in-flight requests
+    assert first.get_by_name('Cher') == ('Cher', None)
+
+
+def test_write_command(contacts, snapshot_path):
+    out = io.StringIO()
+    with mock.patch('phonebook.management.commands.write_contact_snapshot.contact_cache_is_shared',
+                    return_value=True):
+        call_command('write_contact_snapshot', stdout=out)
+
+    assert 'Wrote 3 contacts' in out.getvalue()
+    assert snapshot_path.exists()
+
+
+def test_write_command_needs_a_shared_cache(contacts, snapshot_path):
+    # the test settings use per-process locmem
+    with pytest.raises(CommandError, match='shared CACHE_URL'):
+        call_command('write_contact_snapshot', stdout=io.StringIO())
+    assert not snapshot_path.exists()
+
+
+@override_settings(CONTACT_SNAPSHOT_PATH='')
+def test_write_command_needs_a_path():
+    with pytest.raises(CommandError):
+        call_command('write_contact_snapshot', output='', stdout=io.StringIO())
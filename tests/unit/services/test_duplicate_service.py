@@ -0,0 +1,116 @@
+import pytest
+from django.test import override_settings
+
+from phonebook.models import Contact, Job, PhoneNumber
+from phonebook.services import ContactService, DuplicateService, JobService
+
+pytestmark = pytest.mark.django_db
+
+
+"""
+FIXTURES
+"""
+
+
+@pytest.fixture
+def contacts():
+    service = ContactService()
+    service.create_new_contact("John Smith", "670-123-4567")
+    service.create_new_contact("john  smith", "(670)123-4567")
+    service.create_new_contact("J. Smith", "670 123 4567")
+    service.create_new_contact("Bruce Schneier", "(703)111-2121")
+    service.create_new_contact("Cher", "555-0100")
+    service.create_new_contact("CHER", "555-0199")
+    return service
+
+
+def names(contacts):
+    return [contact['name'] for contact in contacts]
+
+
+"""
+UNIT TESTS
+"""
+
+
+def test_find_groups_by_name_and_number(contacts):
+    groups = DuplicateService().find()
+
+    assert len(groups) == 2
+    smith, cher = groups
+    assert smith['keep']['name'] == "John Smith"
+    assert names(smith['duplicates']) == ["john  smith", "J. Smith"]
+    assert smith['reasons'] == ['name', 'number']
+    assert not smith['conflict']
+
+    assert cher['keep']['name'] == "Cher"
+    assert names(cher['duplicates']) == ["CHER"]
+    assert cher['reasons'] == ['name']
+    assert cher['conflict']
+
+
+def test_find_falls_back_to_normalizing_the_stored_number(contacts):
+    # rows written before normalized_number existed
+    PhoneNumber.objects.update(normalized_number='')
+
+    groups = DuplicateService().find()
+
+    assert names(groups[0]['duplicates']) == ["john  smith", "J. Smith"]
+
+
+def test_find_keeps_the_oldest_contact_with_a_number():
+    Contact.objects.create(full_name="ada lovelace")
+    ContactService().create_new_contact("Ada Lovelace", "123-1234")
+
+    group, = DuplicateService().find()
+
+    assert group['keep']['name'] == "Ada Lovelace"
+    assert names(group['duplicates']) == ["ada lovelace"]
+    assert not group['conflict']
+
+
+def test_find_without_duplicates():
+    ContactService().create_new_contact("Bruce Schneier", "(703)111-2121")
+
+    assert DuplicateService().find() == []
+
+
+def test_merge_skips_conflicts(contacts):
+    service = DuplicateService()
+
+    assert service.merge(service.find(), batch_size=1) == 2
+    assert sorted(Contact.objects.values_list('full_name', flat=True)) == [
+        "Bruce Schneier", "CHER", "Cher", "John Smith"]
+    assert PhoneNumber.objects.count() == 4
+    assert DuplicateService().find()[0]['conflict']
+
+
+@pytest.mark.parametrize('soft_delete', [False, True])
+def test_merge_counts_only_contacts_it_removed(contacts, soft_delete):
+    service = DuplicateService()
+    groups = service.find()
+    # removed by someone else in between
+    with override_settings(CONTACT_SOFT_DELETE=soft_delete):
+        contacts.delete_contact(name="J. Smith")
+
+        assert service.merge(groups) == 1
+
+
+def test_merge_job_rejects_a_bad_batch_size(contacts):
+    jobs = JobService()
+    jobs.enqueue('merge_duplicate_contacts', {'batch_size': 'lots'})
+    job = jobs.claim('worker-1')
+    jobs.run(job, 'worker-1')
+
+    job.refresh_from_db()
+    assert job.status == Job.Status.FAILED and job.attempts == 1
+    assert Contact.objects.count() == 6
+
+
+@override_settings(CONTACT_SOFT_DELETE=True)
+def test_merge_tombstones_with_soft_delete(contacts):
+    service = DuplicateService()
+    service.merge(service.find())
+
+    assert Contact.objects.count() == 4
+    assert Contact.all_objects.filter(deleted_at__isnull=False).count() == 2
@@ -0,0 +1,116 @@
+import gzip
+import os
+import time
+import pytest
+from unittest import mock
+from django.test import override_settings
+
+from phonebook.models import Job
+from phonebook.services import ContactService, ExportService
+from phonebook.services.export_service import contacts_fingerprint
+
+pytestmark = pytest.mark.django_db
+
+
+"""
+FIXTURES
+"""
+
+
+@pytest.fixture
+def contacts():
+    service = ContactService()
+    service.create_new_contact("Bruce Schneier", "(703)111-2121")
+    service.create_new_contact("Cher", "670-123-4567")
+    return service
+
+
+"""
+UNIT TESTS
+"""
+
+
+@override_settings(CONTACT_SOFT_DELETE=True)
+def test_fingerprint_moves_with_every_write(contacts):
+    seen = {contacts_fingerprint()}
+    assert contacts_fingerprint() in seen
+
+    contacts.create_new_contact("Alice Smith", "123-1234")
+    seen.add(contacts_fingerprint())
+    contacts.delete_contact(name="Cher")
+    seen.add(contacts_fingerprint())
+    contacts.delete_contact(name="Alice Smith")
+    seen.add(contacts_fingerprint())
+
+    assert len(seen) == 4
+
+
+def test_write_artifact_reuses_file_until_a_write(contacts, tmp_path):
+    service = ExportService(chunk_size=1)
+    reported = []
+
+    first = service.write_artifact(tmp_path, 'csv', progress=reported.append)
+    with gzip.open(first['path'], 'rt') as f:
+        assert f.read() == "name,phone_number\nBruce Schneier,(703)111-2121\nCher,670-123-4567\n"
+    assert first['count'] == 2 and reported == [1, 2]
+
+    assert service.write_artifact(tmp_path, 'csv')['reused'] is True
+
+    contacts.create_new_contact("Alice Smith", "123-1234")
+    second = service.write_artifact(tmp_path, 'csv')
+    assert second['reused'] is False and second['path'] != first['path']
+    assert sorted(p.name for p in tmp_path.iterdir()) == sorted(
+        os.path.basename(r['path']) for r in (first, second))
+
+
+def test_regenerated_artifact_is_byte_identical(contacts, tmp_path):
+    service = ExportService()
+    path = service.write_artifact(tmp_path, 'ndjson')['path']
+    original = open(path, 'rb').read()
+
+    # expired and rebuilt later, under the same fingerprint (and ETag)
+    os.remove(path)
+    with mock.patch('time.time', return_value=time.time() + 3600):
+        assert service.write_artifact(tmp_path, 'ndjson')['reused'] is False
+
+    assert open(path, 'rb').read() == original
+
+
+def test_remove_stale_artifacts_keeps_the_current_one(contacts, tmp_path):
+    service = ExportService()
+    old = service.write_artifact(tmp_path, 'ndjson')['path']
+    current = service.write_artifact(tmp_path, 'csv')['path']
+    os.utime(old, (0, 0))
+    os.utime(current, (0, 0))
+
+    assert service.remove_stale_artifacts(tmp_path, max_age=60, keep=current) == 1
+    assert [str(p) for p in tmp_path.iterdir()] == [current]
+
+
+def test_reused_artifact_is_not_removed_as_stale(contacts, tmp_path):
+    service = ExportService()
+    reused = service.write_artifact(tmp_path, 'csv')['path']
+    os.utime(reused, (0, 0))
+
+    assert service.write_artifact(tmp_path, 'csv')['reused'] is True
+    # a later export in another format sweeps the directory
+    other = service.write_artifact(tmp_path, 'ndjson')['path']
+    assert service.remove_stale_artifacts(tmp_path, max_age=60, keep=other) == 0
+    assert os.path.exists(reused)
+
+
+def test_request_export_shares_pending_and_finished_jobs(contacts, tmp_path):
+    service = ExportService()
+
+    job, created = service.request_export('csv')
+    assert created and job.payload['format'] == 'csv'
+    assert service.request_export('csv') == (job, False)
+    assert service.request_export('ndjson')[1] is True
+
+    Job.objects.filter(pk=job.pk).update(
+        status=Job.Status.SUCCEEDED,
+        result=service.write_artifact(tmp_path, 'csv'))
+    assert service.request_export('csv') == (job, False)
+
+    contacts.create_new_contact("Alice Smith", "123-1234")
+    assert service.request_export('csv')[1] is True
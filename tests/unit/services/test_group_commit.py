@@ -0,0 +1,160 @@
+import threading
+import time
+import pytest
+from unittest import mock
+from django.db import IntegrityError, connection
+from django.test import override_settings
+
+from phonebook.models import Contact
+from phonebook.services import ContactService
+from phonebook.services.group_commit import GroupCommit
+
+
+"""
+FIXTURES
+"""
+
+
+@pytest.fixture
+def committer():
+    committer = GroupCommit('default')
+    batches = []
+    commit = committer._commit
+
+    def record(batch):
+        batches.append(len(batch))
+        commit(batch)
+
+    committer._commit = record
+    committer.batches = batches
+    return committer
+
+
+def in_threads(fns):
+    """
+    Runs each fn on its own thread and returns their results (or exceptions) in order.
+    """
+    outcomes = [None] * len(fns)
+
+    def call(i):
+        try:
+            outcomes[i] = fns[i]()
+        except Exception as e:
+            outcomes[i] = e
+        finally:
+            connection.close()
+
+    threads = [threading.Thread(target=call, args=(i,)) for i in range(len(fns))]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join(timeout=10)
+    return outcomes
+
+
+"""
+UNIT TESTS
+"""
+
+
+@pytest.mark.django_db
+def test_single_write_commits_alone(committer):
+    assert committer.submit(lambda: 42) == 42
+    assert committer.batches == [1]
+
+
+@pytest.mark.django_db
+def test_writes_queued_behind_a_leader_share_one_transaction(committer):
+    started, release = threading.Event(), threading.Event()
+
+    def first():
+        started.set()
+        release.wait(5)
+        return 'first'
+
+    def queue_others():
+        started.wait(5)
+        others = [threading.Thread(target=lambda i=i: results.append(committer.submit(lambda: i)))
+                  for i in range(5)]
+        for t in others:
+            t.start()
+        while len(committer._queue) < 5:
+            time.sleep(0.001)
+        release.set()
+        for t in others:
+            t.join(5)
+
+    results = []
+    outcomes = in_threads([lambda: committer.submit(first), queue_others])
+
+    assert outcomes[0] == 'first'
+    assert sorted(results) == [0, 1, 2, 3, 4]
+    assert committer.batches == [1, 5]
+
+
+@pytest.mark.django_db
+def test_failing_write_raises_in_its_own_caller_only(committer):
+    started, release = threading.Event(), threading.Event()
+
+    def first():
+        started.set()
+        release.wait(5)
+
+    def fail():
+        raise ValueError("bad write")
+
+    def queue_others():
+        started.wait(5)
+        others = [threading.Thread(target=lambda fn=fn: outcomes.append(_outcome(committer, fn)))
+                  for fn in (fail, lambda: 'ok')]
+        for t in others:
+            t.start()
+        while len(committer._queue) < 2:
+            time.sleep(0.001)
+        release.set()
+        for t in others:
+            t.join(5)
+
+    outcomes = []
+    in_threads([lambda: committer.submit(first), queue_others])
+
+    assert sorted(outcomes, key=str) == ['ValueError', 'ok']
+    assert committer.batches == [1, 2]
+
+
+def _outcome(committer, fn):
+    try:
+        return committer.submit(fn)
+    except ValueError:
+        return 'ValueError'
+
+
+@pytest.mark.django_db(transaction=True)
+@override_settings(CONTACT_GROUP_COMMIT=True)
+def test_concurrent_creates_report_their_own_duplicates():
+    service = ContactService()
+    service.create_new_contact("Bruce Schneier", "(703)111-2121")
+
+    outcomes = in_threads([
+        lambda: service.create_new_contact("Alice Smith", "123-1234"),
+        lambda: service.create_new_contact("Bruce Schneier", "555-0100"),
+        lambda: service.create_new_contact("Cher", "(703)111-2121"),
+        lambda: service.create_new_contact("Carol White", "555-0101"),
+    ])
+
+    assert outcomes[0] == {'name': "Alice Smith", 'phone_number': "123-1234"}
+    assert isinstance(outcomes[1], IntegrityError)
+    assert isinstance(outcomes[2], IntegrityError)
+    assert outcomes[3] == {'name': "Carol White", 'phone_number': "555-0101"}
+    assert sorted(Contact.objects.values_list('full_name', flat=True)) == [
+        "Alice Smith", "Bruce Schneier", "Carol White"]
+
+
+@pytest.mark.django_db
+@override_settings(CONTACT_GROUP_COMMIT=True)
+def test_create_inside_a_transaction_writes_directly():
+    with mock.patch('phonebook.services.group_commit.GroupCommit.submit') as submit:
+        ContactService().create_new_contact("Alice Smith", "123-1234")
+
+    submit.assert_not_called()
+    assert Contact.objects.filter(full_name="Alice Smith").exists()
@@ -0,0 +1,137 @@
+import threading
+import pytest
+from unittest import mock
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import check_password
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from phonebook.services.hashing_service import (
+    HashingBusyError,
+    PasswordHashingPool,
+    get_hashing_pool,
+)
+
+
+"""
+FIXTURES
+"""
+
+
+@pytest.fixture
+def pool():
+    p = PasswordHashingPool(workers=2, max_pending=2, queue_timeout=0.1)
+    yield p
+    p.shutdown()
+
+
+"""
+UNIT TESTS
+"""
+
+
+def test_make_and_check_password(pool):
+    encoded = pool.make_password('SafePassword123!')
+
+    assert encoded.startswith('pbkdf2_sha256$1000$')
+    assert pool.check_password('SafePassword123!', encoded) == (True, False)
+    assert pool.check_password('wrong', encoded) == (False, False)
+
+
+def test_check_password_flags_outdated_iterations(pool, settings):
+    encoded = pool.make_password('SafePassword123!')
+    settings.PASSWORD_HASH_ITERATIONS = 2_000
+
+    assert pool.check_password('SafePassword123!', encoded) == (True, True)
+    assert pool.make_password('x').startswith('pbkdf2_sha256$2000$')
+
+
+def test_inline_pool_runs_on_calling_thread():
+    inline = PasswordHashingPool(workers=0)
+    seen = []
+    inline._run(lambda: seen.append(threading.current_thread()))
+    assert seen == [threading.current_thread()]
+
+
+def test_pool_applies_backpressure():
+    busy = PasswordHashingPool(workers=1, max_pending=0, queue_timeout=0.05)
+    release = threading.Event()
+    started = threading.Event()
+
+    def slow():
+        started.set()
+        release.wait(5)
+
+    holder = threading.Thread(target=busy._run, args=(slow,))
+    holder.start()
+    started.wait(5)
+    try:
+        with pytest.raises(HashingBusyError):
+            busy.make_password('x')
+    finally:
+        release.set()
+        holder.join()
+
+    # the slot is released once the slow job finishes
+    assert busy.make_password('x')
+    busy.shutdown()
+
+
+def test_get_hashing_pool_is_shared():
+    assert get_hashing_pool() is get_hashing_pool()
+
+
+"""
+API TESTS
+"""
+
+
+@pytest.mark.django_db
+def test_token_login_uses_pool_and_upgrades_hash(settings):
+    User = get_user_model()
+    User.objects.create_user(username='alice', password='SafePassword123!')
+    settings.PASSWORD_HASH_ITERATIONS = 2_000
+
+    client = APIClient()
+    url = reverse('token_obtain_pair')
+    with mock.patch.object(
+            PasswordHashingPool, 'check_password',
+            autospec=True, side_effect=PasswordHashingPool.check_password) as check:
+        response = client.post(url, data={
+            'username': 'alice', 'password': 'SafePassword123!'}, format='json')
+
+    assert response.status_code == 200
+    assert 'access' in response.json()
+    check.assert_called_once()
+    assert User.objects.get(username='alice').password.startswith('pbkdf2_sha256$2000$')
+
+
+@pytest.mark.django_db
+def test_token_login_rejects_bad_credentials():
+    get_user_model().objects.create_user(username='alice', password='SafePassword123!')
+    client = APIClient()
+    url = reverse('token_obtain_pair')
+
+    wrong = client.post(url, data={'username': 'alice', 'password': 'nope'}, format='json')
+    unknown = client.post(url, data={'username': 'bob', 'password': 'nope'}, format='json')
+    assert wrong.status_code == 401
+    assert unknown.status_code == 401
+
+
+@pytest.mark.django_db
+def test_signup_returns_503_when_pool_busy():
+    client = APIClient()
+    with mock.patch.object(
+            PasswordHashingPool, 'make_password', side_effect=HashingBusyError(retry_after=2)):
+        response = client.post(reverse('user-signup'), data={
+            'username': 'newuser1', 'password': 'StrongPass!23'}, format='json')
+
+    assert response.status_code == 503
+    assert response['Retry-After'] == '2'
+    assert not get_user_model().objects.filter(username='newuser1').exists()
+
+
+def test_make_passwords_hashes_a_batch_in_order(pool):
+    encoded = pool.make_passwords(['first', 'second', 'third'])
+
+    assert [check_password(p, e) for p, e in zip(['first', 'second', 'third'], encoded)] == [True] * 3
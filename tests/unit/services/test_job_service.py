@@ -0,0 +1,199 @@
+import pytest
+import time
+from datetime import timedelta
+from django.test import override_settings
+from django.utils import timezone
+
+from phonebook.models import Job
+from phonebook.services import JobService, JobWorker, PermanentJobError, job_handler
+from phonebook.services.job_service import JobLeaseLost, JobProgress
+
+pytestmark = pytest.mark.django_db
+
+
+"""
+FIXTURES
+"""
+
+calls = []
+
+
+@job_handler('test_echo')
+def echo(payload, progress):
+    calls.append(payload)
+    progress(1, 2)
+    return {'echo': payload}
+
+
+@job_handler('test_broken')
+def broken(payload, progress):
+    raise RuntimeError("disk full")
+
+
+@job_handler('test_bad_payload')
+def bad_payload(payload, progress):
+    raise PermanentJobError("missing 'path'")
+
+
+@pytest.fixture
+def service():
+    calls.clear()
+    return JobService()
+
+
+def claim_and_run(service, owner='worker-1'):
+    job = service.claim(owner)
+    service.run(job, owner)
+    job.refresh_from_db()
+    return job
+
+
+"""
+UNIT TESTS
+"""
+
+
+def test_enqueue_rejects_unknown_kinds(service):
+    with pytest.raises(ValueError):
+        service.enqueue('no_such_kind')
+
+
+def test_claim_leases_a_job_to_one_worker(service):
+    queued = service.enqueue('test_echo', {'n': 1})
+
+    job = service.claim('worker-1')
+
+    assert job.pk == queued.pk
+    assert job.status == Job.Status.RUNNING
+    assert job.lease_owner == 'worker-1' and job.attempts == 1
+    assert service.claim('worker-2') is None
+
+
+def test_claim_skips_jobs_not_yet_due_and_other_kinds(service):
+    service.enqueue('test_echo', delay=60)
+    service.enqueue('test_broken')
+
+    assert service.claim('worker-1', kinds=['test_echo']) is None
+
+
+def test_expired_lease_is_reclaimed(service):
+    service.enqueue('test_echo')
+    service.claim('worker-1')
+    Job.objects.update(lease_expires_at=timezone.now() - timedelta(seconds=1))
+
+    job = service.claim('worker-2')
+
+    assert job.lease_owner == 'worker-2' and job.attempts == 2
+
+
+def test_successful_run_records_result(service):
+    service.enqueue('test_echo', {'n': 1})
+
+    job = claim_and_run(service)
+
+    assert job.status == Job.Status.SUCCEEDED
+    assert job.result == {'echo': {'n': 1}}
+    assert job.progress == 1.0 and job.finished_at is not None
+
+
+@override_settings(JOB_QUEUE={'BACKOFF_BASE': 10, 'BACKOFF_MAX': 15})
+def test_failures_retry_with_backoff_then_fail(service):
+    service.enqueue('test_broken', max_attempts=3)
+
+    job = claim_and_run(service)
+    assert job.status == Job.Status.QUEUED and 'disk full' in job.error
+    assert timedelta(seconds=9) < job.run_at - timezone.now() <= timedelta(seconds=10)
+    assert service.backoff(2) == 15
+
+    for _ in range(2):
+        Job.objects.update(run_at=timezone.now())
+        job = claim_and_run(service)
+
+    assert job.status == Job.Status.FAILED and job.attempts == 3
+
+
+def test_permanent_errors_are_not_retried(service):
+    service.enqueue('test_bad_payload')
+
+    job = claim_and_run(service)
+
+    assert job.status == Job.Status.FAILED
+    assert job.attempts == 1 and "missing 'path'" in job.error
+
+
+def test_progress_renews_the_lease_until_it_is_lost(service):
+    service.enqueue('test_echo')
+    job = service.claim('worker-1')
+    progress = JobProgress(job, 'worker-1')
+
+    progress(1, 4)
+    job.refresh_from_db()
+    assert job.progress == 0.25
+    assert job.lease_expires_at > timezone.now() + timedelta(seconds=200)
+
+    Job.objects.update(lease_owner='worker-2')
+    with pytest.raises(JobLeaseLost):
+        progress(4, 4)
+
+
+def test_worker_burst_runs_every_due_job(service):
+    for n in range(3):
+        service.enqueue('test_echo', {'n': n})
+
+    assert JobWorker(owner='worker-1').run(burst=True) == 3
+    assert calls == [{'n': 0}, {'n': 1}, {'n': 2}]
+    assert set(Job.objects.values_list('status', flat=True)) == {Job.Status.SUCCEEDED}
+
+
+@pytest.mark.parametrize('kind', ['write_contact_snapshot', 'prefill_contact_list_cache'])
+def test_cache_jobs_fail_without_a_shared_cache(service, kind):
+    # the test settings use per-process locmem
+    service.enqueue(kind, {'path': '/tmp/unused.snapshot'})
+
+    job = claim_and_run(service)
+
+    assert job.status == Job.Status.FAILED and job.attempts == 1
+    assert 'shared CACHE_URL' in job.error
+
+
+@pytest.mark.parametrize('payload', [{'older_than': '10'}, {'older_than': -1}, {'batch_size': 0}, {'batch_size': 1.5}])
+def test_purge_job_rejects_a_bad_payload(service, payload):
+    service.enqueue('purge_contact_tombstones', payload)
+
+    job = claim_and_run(service)
+
+    assert job.status == Job.Status.FAILED and job.attempts == 1
+    assert 'must be a' in job.error
+
+
+@job_handler('test_slow')
+def slow(payload, progress):
+    time.sleep(payload['seconds'])
+    return {'stolen': JobService().claim('worker-2') is not None}
+
+
+@job_handler('test_reclaimed')
+def reclaimed(payload, progress):
+    # another worker took the job over while this one was stalled
+    Job.objects.update(lease_owner='worker-2')
+    return {'done': True}
+
+
+@pytest.mark.django_db(transaction=True)
+@override_settings(JOB_QUEUE={'LEASE_SECONDS': 0.3})
+def test_heartbeat_keeps_the_lease_without_progress_reports(service):
+    service.enqueue('test_slow', {'seconds': 0.6})
+
+    job = claim_and_run(service)
+
+    assert job.status == Job.Status.SUCCEEDED
+    assert job.result == {'stolen': False}
+
+
+def test_lost_lease_is_not_recorded_as_success(service):
+    service.enqueue('test_reclaimed')
+
+    job = claim_and_run(service)
+
+    assert job.status == Job.Status.RUNNING and job.lease_owner == 'worker-2'
+    assert job.result is None
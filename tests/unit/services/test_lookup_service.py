@@ -0,0 +1,165 @@
+import pytest
+from importlib import import_module
+from unittest import mock
+from django.apps import apps
+from django.test import override_settings
+
+from phonebook.models import Contact, PhoneNumber
+from phonebook.services import ContactService, LookupService
+from phonebook.services.lookup_service import MISSING, HotNumberCache, hot_number_cache
+
+pytestmark = pytest.mark.django_db
+
+
+"""
+FIXTURES
+"""
+
+
+class FakeTimer:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def timer():
+    fake = FakeTimer()
+    with mock.patch.object(HotNumberCache, 'timer', fake):
+        yield fake
+
+
+@pytest.fixture
+def service():
+    return LookupService()
+
+
+@pytest.fixture
+def hot_cache():
+    with override_settings(LOOKUP_CACHE={'ENABLED': True}):
+        yield hot_number_cache
+
+
+"""
+UNIT TESTS
+"""
+
+
+def test_lookup_any_accepted_format(service):
+    ContactService().create_new_contact('Bruce Schneier', '(703)111-2121')
+
+    assert service.lookup('(703)111-2121') == 'Bruce Schneier'
+    assert service.lookup('1 (703) 111-2121') == 'Bruce Schneier'
+    assert service.lookup('+1 703.111.2121') == 'Bruce Schneier'
+    assert service.lookup('670-123-4567') is None
+
+
+def test_repeat_lookups_skip_the_database(service, hot_cache, django_assert_num_queries):
+    ContactService().create_new_contact('Bruce Schneier', '(703)111-2121')
+    service.lookup('703-111-2121')
+    service.lookup('670-123-4567')
+
+    with django_assert_num_queries(0):
+        assert service.lookup('(703)111-2121') == 'Bruce Schneier'
+        assert service.lookup('670-123-4567') is None
+
+
+@override_settings(LOOKUP_CACHE={'TTL': 60, 'NEGATIVE_TTL': 5})
+def test_negative_entries_expire_sooner(timer):
+    cache = HotNumberCache()
+    cache.set('17031112121', 'Bruce Schneier')
+    cache.set('16701234567', None)
+
+    timer.now += 10
+    assert cache.get('17031112121') == 'Bruce Schneier'
+    assert cache.get('16701234567') is MISSING
+
+    timer.now += 60
+    assert cache.get('17031112121') is MISSING
+
+
+@override_settings(LOOKUP_CACHE={'SIZE': 2})
+def test_least_recently_used_entry_is_evicted(timer):
+    cache = HotNumberCache()
+    cache.set('1', 'One')
+    cache.set('2', 'Two')
+    cache.get('1')
+    cache.set('3', 'Three')
+
+    assert len(cache) == 2
+    assert cache.get('2') is MISSING
+    assert cache.get('1') == 'One'
+
+
+@override_settings(LOOKUP_CACHE={'ENABLED': True, 'GENERATION_CHECK_INTERVAL': 1.0})
+def test_contact_writes_clear_the_cache(service, timer):
+    assert service.lookup('670-123-4567') is None
+    ContactService().create_new_contact('Cher', '670-123-4567')
+
+    # still the cached miss until the generation is checked again
+    assert service.lookup('670-123-4567') is None
+    timer.now += 1
+    assert service.lookup('670-123-4567') == 'Cher'
+
+
+def test_backfill_migration_normalizes_existing_numbers():
+    contact = Contact.objects.create(full_name='Bruce Schneier')
+    PhoneNumber.objects.create(contact=contact, phone_number='+1 (703)111-2121')
+    migration = import_module('phonebook.migrations.0005_phonenumber_normalized_number')
+
+    migration.backfill_normalized_numbers(apps, mock.Mock(connection=mock.Mock(alias='default')))
+
+    assert PhoneNumber.objects.get().normalized_number == '17031112121'
+    assert hot_number_cache.get('17031112121') is MISSING
+
+
+def test_lookup_many_uses_chunked_in_queries(service, django_assert_num_queries):
+    ContactService().create_new_contact('Bruce Schneier', '(703)111-2121')
+    ContactService().create_new_contact('Cher', '670-123-4567')
+    numbers = ['+1 703.111.2121', '(670) 123-4567', '703-111-2121', '555-000-0000', '555-000-0001']
+
+    # four distinct normalized numbers, two per query
+    with django_assert_num_queries(2):
+        results = service.lookup_many(numbers, chunk_size=2)
+
+    assert results == {
+        '+1 703.111.2121': 'Bruce Schneier',
+        '(670) 123-4567': 'Cher',
+        '703-111-2121': 'Bruce Schneier',
+        '555-000-0000': None,
+        '555-000-0001': None,
+    }
+
+
+def test_lookup_many_reads_but_does_not_fill_the_hot_cache(service, hot_cache, django_assert_num_queries):
+    ContactService().create_new_contact('Bruce Schneier', '(703)111-2121')
+    service.lookup('703-111-2121')
+
+    with django_assert_num_queries(0):
+        assert service.lookup_many(['(703)111-2121']) == {'(703)111-2121': 'Bruce Schneier'}
+
+    service.lookup_many(['670-123-4567'])
+    assert hot_number_cache.get('16701234567') is MISSING
+
+
+def test_iter_lookup_keeps_input_order_and_reports_invalid_lines(service):
+    ContactService().create_new_contact('Cher', '670-123-4567')
+    lines = ['670-123-4567\n', '\n', '<script>\n', '555-000-0000']
+
+    rows = list(service.iter_lookup(lines, chunk_size=2))
+
+    assert [row['phone_number'] for row in rows] == ['670-123-4567', '<script>', '555-000-0000']
+    assert rows[0]['name'] == 'Cher'
+    assert 'error' in rows[1]
+    assert rows[2]['name'] is None
+
+
+def test_hot_cache_is_off_by_default(service, django_assert_num_queries):
+    ContactService().create_new_contact('Bruce Schneier', '(703)111-2121')
+    service.lookup('703-111-2121')
+
+    with django_assert_num_queries(1):
+        assert service.lookup('(703)111-2121') == 'Bruce Schneier'
+    assert len(hot_number_cache) == 0
@@ -0,0 +1,120 @@
+import pytest
+from unittest import mock
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from phonebook.services import ProvisioningError, ProvisioningService
+from phonebook.services.signup_service import get_default_group_ids
+
+pytestmark = pytest.mark.django_db
+
+
+"""
+FIXTURES
+"""
+
+
+@pytest.fixture
+def service():
+    return ProvisioningService()
+
+
+"""
+UNIT TESTS
+"""
+
+
+def test_provision_users_creates_users_and_groups(service):
+    users = service.provision_users([
+        {'username': 'alice', 'password': 'SafePassword123!', 'first_name': 'Alice'},
+        {'username': 'bob', 'password': 'SafePassword123!', 'groups': ['reader', 'writer']},
+        {'username': 'carol', 'password': 'SafePassword123!', 'groups': ['writer']},
+    ])
+
+    assert [u.username for u in users] == ['alice', 'bob', 'carol']
+    User = get_user_model()
+    alice = User.objects.get(username='alice')
+    assert alice.first_name == 'Alice'
+    assert alice.check_password('SafePassword123!')
+
+    def groups(name):
+        return set(User.objects.get(username=name).groups.values_list('name', flat=True))
+
+    assert groups('alice') == {'reader'}
+    assert groups('bob') == {'reader', 'writer'}
+    assert groups('carol') == {'writer'}
+
+
+def test_provision_users_runs_constant_queries(service):
+    get_default_group_ids()
+    entries = [
+        {'username': f'user{i}', 'password': 'SafePassword123!'} for i in range(50)]
+
+    with CaptureQueriesContext(connection) as ctx:
+        service.provision_users(entries)
+
+    statements = [q['sql'].split()[0].upper() for q in ctx.captured_queries]
+    # one uniqueness SELECT, one users INSERT, one memberships INSERT
+    assert statements.count('SELECT') == 1
+    assert statements.count('INSERT') == 2
+    assert get_user_model().objects.count() == 50
+
+
+def test_provision_users_rejects_taken_and_repeated_usernames(service):
+    get_user_model().objects.create_user(username='alice', password='pw')
+
+    with pytest.raises(ProvisioningError) as exc:
+        service.provision_users([
+            {'username': 'alice', 'password': 'SafePassword123!'},
+            {'username': 'bob', 'password': 'SafePassword123!'},
+            {'username': 'bob', 'password': 'SafePassword123!'},
+        ])
+
+    assert exc.value.errors == {
+        0: {'username': ["Username is already taken."]},
+        2: {'username': ["Duplicate username in request."]},
+    }
+    # all or nothing
+    assert not get_user_model().objects.filter(username='bob').exists()
+
+
+def test_provision_users_normalizes_usernames(service):
+    get_user_model().objects.create_user(username='alice', password='pw')
+
+    with pytest.raises(ProvisioningError) as exc:
+        service.provision_users([
+            {'username': 'ａｌｉｃｅ', 'password': 'SafePassword123!'},
+            {'username': 'ｂob', 'password': 'SafePassword123!'},
+            {'username': 'bob', 'password': 'SafePassword123!'},
+        ])
+
+    assert exc.value.errors == {
+        0: {'username': ["Username is already taken."]},
+        2: {'username': ["Duplicate username in request."]},
+    }
+
+
+def test_provision_users_hashes_on_the_shared_pool(service):
+    with mock.patch('phonebook.services.provisioning_service.get_hashing_pool') as pool:
+        pool.return_value.make_passwords.side_effect = lambda passwords: ['!'] * len(passwords)
+        service.provision_users([{'username': 'alice', 'password': 'SafePassword123!'}])
+
+    pool.return_value.make_passwords.assert_called_once_with(['SafePassword123!'])
+
+
+def test_provision_users_losing_a_race_is_a_provisioning_error(service):
+    check = service._check_usernames
+    calls = iter([False, True])
+
+    with mock.patch.object(service, '_check_usernames', side_effect=lambda names: next(calls) and check(names)):
+        # created after the first check passed
+        get_user_model().objects.create_user(username='alice', password='pw')
+        with pytest.raises(ProvisioningError) as exc:
+            service.provision_users([
+                {'username': 'alice', 'password': 'SafePassword123!'},
+                {'username': 'bob', 'password': 'SafePassword123!'},
+            ])
+
+    assert exc.value.errors == {0: {'username': ["Username is already taken."]}}
+    assert not get_user_model().objects.filter(username='bob').exists()
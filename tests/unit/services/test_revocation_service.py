@@ -0,0 +1,142 @@
+import pytest
+from datetime import timedelta
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import Group
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from config.authentication.tokens import PhonebookRefreshToken
+from phonebook.models import RevokedToken
+from phonebook.services import TokenRevocationService
+from phonebook.services.bloom_filter import BloomFilter
+from phonebook.services.revocation_service import revocation_filter
+
+pytestmark = pytest.mark.django_db
+
+
+"""
+FIXTURES
+"""
+
+
+@pytest.fixture
+def service():
+    return TokenRevocationService()
+
+
+@pytest.fixture
+def later():
+    return timezone.now() + timedelta(minutes=15)
+
+
+@pytest.fixture
+def reader():
+    user = get_user_model().objects.create_user(
+        username='reader_user', password='ReaderPass!23')
+    user.groups.add(Group.objects.get(name='reader'))
+    return user
+
+
+"""
+UNIT TESTS
+"""
+
+
+def test_bloom_filter_has_no_false_negatives():
+    bloom = BloomFilter(capacity=1000, error_rate=0.01)
+    items = [f'jti-{i}' for i in range(1000)]
+    for item in items:
+        bloom.add(item)
+
+    assert all(item in bloom for item in items)
+    assert bloom.is_full
+
+
+def test_bloom_filter_false_positive_rate():
+    bloom = BloomFilter(capacity=1000, error_rate=0.01)
+    for i in range(1000):
+        bloom.add(f'jti-{i}')
+
+    false_positives = sum(f'other-{i}' in bloom for i in range(10_000))
+    assert false_positives < 300  # ~1% expected
+
+
+def test_revoke_and_check(service, later):
+    assert service.is_revoked('abc') is False
+    service.revoke('abc', later)
+    service.revoke('abc', later)  # idempotent
+
+    assert service.is_revoked('abc') is True
+    assert RevokedToken.objects.filter(jti='abc').count() == 1
+
+
+def test_unrevoked_tokens_skip_the_database(service, later, django_assert_num_queries):
+    service.revoke('abc', later)
+    service.is_revoked('warm-up')
+
+    with django_assert_num_queries(0):
+        assert service.is_revoked('not-revoked') is False
+
+
+def test_filter_picks_up_rows_from_other_workers(service, later, settings):
+    settings.TOKEN_REVOCATION = {'REFRESH_INTERVAL': 0}
+    assert service.is_revoked('abc') is False
+
+    # written by another worker, so this worker's filter never saw add()
+    RevokedToken.objects.create(jti='abc', expires_at=later)
+    assert service.is_revoked('abc') is True
+
+
+def test_filter_rebuild_drops_expired_tokens(later):
+    RevokedToken.objects.create(jti='old', expires_at=timezone.now() - timedelta(minutes=1))
+    RevokedToken.objects.create(jti='new', expires_at=later)
+
+    assert revocation_filter.might_contain('new') is True
+    assert revocation_filter.might_contain('old') is False
+
+
+def test_purge_expired(service, later):
+    RevokedToken.objects.create(jti='old', expires_at=timezone.now() - timedelta(minutes=1))
+    RevokedToken.objects.create(jti='new', expires_at=later)
+
+    assert service.purge_expired() == 1
+    assert list(RevokedToken.objects.values_list('jti', flat=True)) == ['new']
+
+
+"""
+API TESTS
+"""
+
+
+def test_revoked_access_token_is_rejected(reader):
+    refresh = PhonebookRefreshToken.for_user(reader)
+    client = APIClient()
+    client.credentials(HTTP_AUTHORIZATION=f'Bearer {refresh.access_token}')
+
+    assert client.get(reverse('contact-list')).status_code == 200
+    response = client.post(reverse('token_revoke'), data={
+        'refresh': str(refresh)}, format='json')
+    assert response.status_code == 200
+    assert response.json() == {'message': 'Token revoked.'}
+
+    assert client.get(reverse('contact-list')).status_code == 401
+    refreshed = APIClient().post(reverse('token_refresh'), data={
+        'refresh': str(refresh)}, format='json')
+    assert refreshed.status_code == 401
+
+
+def test_cannot_revoke_another_users_refresh_token(reader):
+    other = get_user_model().objects.create_user(username='other', password='OtherPass!23')
+    client = APIClient()
+    client.credentials(
+        HTTP_AUTHORIZATION=f'Bearer {PhonebookRefreshToken.for_user(reader).access_token}')
+
+    response = client.post(reverse('token_revoke'), data={
+        'refresh': str(PhonebookRefreshToken.for_user(other))}, format='json')
+    assert response.status_code == 400
+    assert not RevokedToken.objects.exists()
+
+
+def test_revoke_requires_authentication():
+    assert APIClient().post(reverse('token_revoke')).status_code == 401
@@ -0,0 +1,182 @@
+import pytest
+from django.db import IntegrityError, connections
+from django.http import Http404
+from django.test import override_settings
+from django.utils import timezone
+
+from phonebook.models import Contact, PhoneNumber, PhoneNumberClaim
+from phonebook.services import ContactService, ExportService
+from phonebook.services.contact_services import CLAIM_GRACE
+from phonebook.services.sharding import contact_databases, normalize_name, shard_for_name, shard_for_number
+
+SHARDS = ['contacts_0', 'contacts_1']
+
+pytestmark = [
+    pytest.mark.django_db(databases=['default', *SHARDS]),
+    pytest.mark.usefixtures('sharded'),
+]
+
+NAMES = ['Bruce Schneier', 'Cher', 'Alice Smith', 'Bob Jones', 'Carol White', 'Dave Brown']
+
+
+"""
+FIXTURES
+"""
+
+
+@pytest.fixture
+def sharded():
+    with override_settings(CONTACT_SHARDS=2):
+        yield
+
+
+@pytest.fixture
+def service():
+    return ContactService()
+
+
+@pytest.fixture
+def claimed():
+    def names():
+        return sorted(name for alias in SHARDS
+                      for name in PhoneNumberClaim.objects.using(alias).values_list('full_name', flat=True))
+    return names
+
+
+@pytest.fixture
+def contacts(service):
+    for i, name in enumerate(NAMES):
+        service.create_new_contact(name, f'670-123-456{i}')
+
+
+"""
+UNIT TESTS
+"""
+
+
+def test_shard_for_name_is_stable_and_normalized():
+    assert contact_databases() == SHARDS
+    assert shard_for_name('Bruce Schneier') == shard_for_name('  bruce   SCHNEIER ')
+    assert normalize_name('  Bruce   Schneier ') == 'bruce schneier'
+    assert {shard_for_name(name) for name in NAMES} == set(SHARDS)
+
+
+@override_settings(CONTACT_SHARDS=0)
+def test_unsharded_uses_default():
+    assert contact_databases() == ['default']
+    assert shard_for_name('Cher') == 'default'
+
+
+def test_create_routes_to_owning_shard(contacts):
+    for name in NAMES:
+        alias = shard_for_name(name)
+        assert Contact.objects.using(alias).filter(full_name=name).exists()
+        assert PhoneNumber.objects.using(alias).filter(contact__full_name=name).exists()
+    assert not Contact.objects.exists()  # nothing lands in 'default'
+
+
+def test_lookups_across_shards(service, contacts):
+    assert all(service._check_name_exists(name) for name in NAMES)
+    assert service._check_name_exists('Nobody') is False
+    assert service._check_phone_number_exists('670-123-4565') is True
+    assert service._check_phone_number_exists('670-123-4569') is False
+
+
+def test_name_check_queries_one_shard(service, contacts, django_assert_num_queries):
+    alias = shard_for_name('Cher')
+    with django_assert_num_queries(1, connection=connections[alias]):
+        assert service._check_name_exists('Cher') is True
+
+
+def test_list_gathers_every_shard_in_creation_order(service, contacts):
+    assert [row['name'] for row in service.retrieve_all_contacts()] == NAMES
+
+
+def test_list_merges_shards_on_requested_ordering(service, contacts):
+    rows = service.retrieve_all_contacts(('name',), ordering='-name')
+    assert [row['name'] for row in rows] == sorted(NAMES, reverse=True)
+
+    rows = service.retrieve_all_contacts(('name',), filters={'number_prefix': '1670123456'}, ordering='name')
+    assert [row['name'] for row in rows] == sorted(NAMES)
+
+
+def test_delete_by_name_and_number(service, contacts):
+    service.delete_contact(name='Cher')
+    service.delete_contact(phone_number='670-123-4565')
+
+    remaining = {row['name'] for row in service.retrieve_all_contacts()}
+    assert remaining == {'Bruce Schneier', 'Alice Smith', 'Bob Jones', 'Carol White'}
+    with pytest.raises(Http404):
+        service.delete_contact(phone_number='670-123-4565')
+    with pytest.raises(Http404):
+        service.delete_contact(name='Cher')
+
+
+def test_number_is_unique_across_shards(service, claimed):
+    service.create_new_contact('Cher', '555-0100')
+    assert shard_for_name('Cher') != shard_for_name('Bruce Schneier')
+
+    with pytest.raises(IntegrityError):
+        service.create_new_contact('Bruce Schneier', '555-0100')
+
+    assert not Contact.objects.using(shard_for_name('Bruce Schneier')).exists()
+    assert claimed() == ['Cher']
+
+
+@pytest.mark.parametrize('soft_delete', [False, True])
+def test_delete_releases_the_number(service, claimed, soft_delete):
+    with override_settings(CONTACT_SOFT_DELETE=soft_delete):
+        service.create_new_contact('Cher', '555-0100')
+        service.delete_contact(name='Cher')
+
+        service.create_new_contact('Bruce Schneier', '555-0100')
+
+    assert claimed() == ['Bruce Schneier']
+
+
+def test_failed_create_releases_its_claim(service):
+    service.create_new_contact('Cher', '555-0100')
+
+    with pytest.raises(IntegrityError):
+        service.create_new_contact('Cher', '555-0199')
+
+    assert not PhoneNumberClaim.objects.using(shard_for_number('555-0199')).filter(phone_number='555-0199').exists()
+
+
+def test_orphaned_claim_is_taken_over_after_the_grace_period(service, claimed):
+    # left by a create whose process died before the shard insert
+    claims = PhoneNumberClaim.objects.using(shard_for_number('555-0100'))
+    claim = claims.create(phone_number='555-0100', full_name='Cher')
+
+    with pytest.raises(IntegrityError):
+        service.create_new_contact('Bruce Schneier', '555-0100')
+
+    claims.filter(pk=claim.pk).update(claimed_at=timezone.now() - CLAIM_GRACE)
+    service.create_new_contact('Bruce Schneier', '555-0100')
+
+    assert claimed() == ['Bruce Schneier']
+
+
+def test_claims_are_split_across_shards_not_the_default_database(service, django_assert_num_queries):
+    numbers = [f'555-01{i:02d}' for i in range(6)]
+    assert {shard_for_number(number) for number in numbers} == set(SHARDS)
+
+    with django_assert_num_queries(0, connection=connections['default']):
+        for i, number in enumerate(numbers):
+            service.create_new_contact(f'Contact {i}', number)
+
+    for number in numbers:
+        assert PhoneNumberClaim.objects.using(shard_for_number(number)).filter(phone_number=number).exists()
+
+
+def test_export_covers_every_shard(contacts):
+    assert sorted(name for name, _ in ExportService().iter_rows()) == sorted(NAMES)
+
+
+def test_shards_hold_only_contact_tables():
+    tables = connections['contacts_0'].introspection.table_names()
+    assert 'phonebook_contact' in tables
+    assert 'phonebook_phonenumber' in tables
+    assert 'auth_user' not in tables
+    assert 'phonebook_revokedtoken' not in tables
+    assert 'phonebook_phonenumberclaim' in tables
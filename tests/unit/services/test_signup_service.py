@@ -1,8 +1,15 @@
 import pytest
+from unittest import mock
 from django.contrib.auth import get_user_model
 from django.contrib.auth.models import Group
+from django.db import IntegrityError, connection
+from django.test.utils import CaptureQueriesContext
 
-from phonebook.services import SignUpService
+from phonebook.services import SignUpService, UsernameTakenError
+from phonebook.services.signup_service import (
+    get_default_group_ids,
+    reset_default_group_ids,
+)
 
 pytestmark = pytest.mark.django_db
 
@@ -67,3 +74,64 @@ def test_multiple_users_each_get_reader_group(signup_service):
 
     assert u1.groups.filter(name='reader').exists()
     assert u2.groups.filter(name='reader').exists()
+
+
+def test_default_groups_exist_after_migrations():
+    assert set(Group.objects.values_list('name', flat=True)) >= {'reader', 'writer'}
+
+
+def test_default_group_ids_are_cached(django_assert_num_queries):
+    reset_default_group_ids()
+    ids = get_default_group_ids()
+    assert ids == dict(Group.objects.values_list('name', 'id'))
+
+    with django_assert_num_queries(0):
+        assert get_default_group_ids() == ids
+
+
+def test_create_user_issues_only_inserts(signup_service, user_payload):
+    get_default_group_ids()
+    with CaptureQueriesContext(connection) as ctx:
+        signup_service.create_user(**user_payload)
+
+    statements = [q['sql'].split()[0].upper() for q in ctx.captured_queries]
+    assert statements.count('INSERT') == 2
+    assert 'SELECT' not in statements
+
+
+def test_create_user_duplicate_username_raises(signup_service, user_payload):
+    signup_service.create_user(**user_payload)
+
+    with pytest.raises(UsernameTakenError):
+        signup_service.create_user(**user_payload)
+
+    User = get_user_model()
+    assert User.objects.filter(username="testuser").count() == 1
+
+
+def test_create_user_normalizes_username(signup_service, user_payload):
+    user = signup_service.create_user(**{**user_payload, 'username': "ｔｅｓｔｕｓｅｒ"})
+    assert user.username == "testuser"
+
+    # a look-alike of an existing username is the same username
+    with pytest.raises(UsernameTakenError):
+        signup_service.create_user(**user_payload)
+
+
+def test_create_user_retries_once_after_stale_group_ids(signup_service):
+    original = SignUpService._insert_with_reader_group
+    calls = []
+
+    def flaky_insert(self, user):
+        calls.append(user.username)
+        if len(calls) == 1:
+            raise IntegrityError("FOREIGN KEY constraint failed")
+        return original(self, user)
+
+    with mock.patch.object(SignUpService, '_insert_with_reader_group', flaky_insert), \
+            mock.patch('phonebook.services.signup_service.reset_default_group_ids') as reset:
+        user = signup_service.create_user(username="user1", password="password1")
+
+    reset.assert_called_once()
+    assert calls == ["user1", "user1"]
+    assert user.groups.filter(name='reader').exists()
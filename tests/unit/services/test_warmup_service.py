@@ -0,0 +1,77 @@
+import pytest
+from unittest import mock
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import Group
+from django.test import override_settings
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from phonebook.services import ContactService
+from phonebook.services.warmup_service import WarmupService, is_ready, warm_up_on_boot
+
+pytestmark = pytest.mark.django_db
+
+
+"""
+FIXTURES
+"""
+
+
+@pytest.fixture
+def reader_client():
+    user = get_user_model().objects.create_user(username='reader_user', password='ReaderPass!23')
+    user.groups.add(Group.objects.get(name='reader'))
+    client = APIClient()
+    client.force_authenticate(user=user)
+    return client
+
+
+"""
+UNIT TESTS
+"""
+
+
+@override_settings(WARMUP_ON_BOOT='blocking')
+def test_run_times_every_step_and_marks_ready():
+    assert not is_ready()
+
+    timings = WarmupService(prefill_caches=False).run()
+
+    assert list(timings) == ['connections', 'urls', 'validators', 'auth']
+    assert is_ready()
+
+
+@override_settings(WARMUP_ON_BOOT='blocking')
+def test_failed_step_is_skipped_and_still_marks_ready():
+    with mock.patch.object(WarmupService, '_open_connections', side_effect=RuntimeError('db down')):
+        timings = WarmupService(prefill_caches=False).run()
+
+    assert 'connections' in timings
+    assert is_ready()
+
+
+@override_settings(CONTACT_LIST_CACHE_TTL=60)
+def test_prefilled_list_is_served_from_cache(reader_client):
+    ContactService().create_new_contact('Alice Smith', '670-123-4567')
+    WarmupService(prefill_caches=True).run()
+
+    with mock.patch.object(ContactService, 'retrieve_all_contacts') as retrieve:
+        response = reader_client.get(reverse('contact-list'))
+
+    retrieve.assert_not_called()
+    assert response.json() == [{'name': 'Alice Smith', 'phone_number': '670-123-4567'}]
+
+
+@override_settings(WARMUP_ON_BOOT='off')
+def test_warm_up_on_boot_off_runs_nothing():
+    with mock.patch.object(WarmupService, 'run') as run:
+        warm_up_on_boot()
+    run.assert_not_called()
+
+
+@override_settings(WARMUP_ON_BOOT='background')
+def test_warm_up_on_boot_background_uses_a_thread():
+    with mock.patch('phonebook.services.warmup_service.threading.Thread') as thread:
+        warm_up_on_boot()
+    thread.assert_called_once()
+    thread.return_value.start.assert_called_once()
@@ -0,0 +1,216 @@
+import pytest
+from unittest import mock
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import AnonymousUser, Group
+from django.core.cache import caches
+from django.test import override_settings
+from django.urls import reverse
+from rest_framework.test import APIClient, APIRequestFactory
+
+from config.throttling import IPTokenBucketThrottle, UserTokenBucketThrottle
+from config.throttling.stores import (
+    VERSION_KEY,
+    VERSION_REFRESH,
+    CacheBucketStore,
+    LocalBucketStore,
+    get_bucket_store,
+    take_token,
+)
+from config.throttling.throttles import parse_rate
+
+pytestmark = pytest.mark.django_db
+
+
+"""
+FIXTURES
+"""
+
+
+@pytest.fixture(autouse=True)
+def clean_store():
+    get_bucket_store().clear()
+    yield
+    get_bucket_store().clear()
+
+
+@pytest.fixture
+def rates(settings):
+    def _set(**rates):
+        settings.REST_FRAMEWORK = {
+            **settings.REST_FRAMEWORK,
+            'DEFAULT_THROTTLE_RATES': rates,
+        }
+    return _set
+
+
+class ScopedView:
+    throttle_scope = 'things'
+
+
+"""
+UNIT TESTS
+"""
+
+
+def test_parse_rate():
+    assert parse_rate('120/min') == (120.0, 2.0)
+    assert parse_rate('10/s') == (10.0, 10.0)
+    assert parse_rate('24/day') == (24.0, 24 / 86400)
+
+
+def test_take_token_drains_and_refills():
+    state, wait = take_token(None, capacity=2, refill_rate=1, now=100.0)
+    assert wait == 0.0
+    state, wait = take_token(state, 2, 1, now=100.0)
+    assert wait == 0.0
+    state, wait = take_token(state, 2, 1, now=100.0)
+    assert wait == pytest.approx(1.0)
+
+    # half a second later half a token has been refilled
+    state, wait = take_token(state, 2, 1, now=100.5)
+    assert wait == pytest.approx(0.5)
+    _, wait = take_token(state, 2, 1, now=101.0)
+    assert wait == 0.0
+
+
+def test_take_token_never_exceeds_capacity():
+    state, _ = take_token(None, capacity=2, refill_rate=1, now=0.0)
+    state, _ = take_token(state, 2, 1, now=1000.0)
+    assert state[0] == pytest.approx(1.0)
+
+
+def test_local_store_evicts_least_recently_used():
+    store = LocalBucketStore(max_keys=2)
+    store.consume('a', 1, 1, 0.0)
+    store.consume('b', 1, 1, 0.0)
+    store.consume('c', 1, 1, 0.0)
+
+    # 'a' was evicted, so it starts again with a full bucket
+    assert store.consume('a', 1, 1, 0.0) == 0.0
+    assert store.consume('c', 1, 1, 0.0) > 0
+
+
+def test_cache_store_shares_buckets_between_instances():
+    first, second = CacheBucketStore(), CacheBucketStore()
+    assert first.consume('k', 1, 1, 0.0) == 0.0
+    assert second.consume('k', 1, 1, 0.0) > 0
+    first.clear()
+
+
+def test_cache_store_clear_only_resets_buckets():
+    store = CacheBucketStore()
+    cache = caches['default']
+    cache.set('phonebook:contacts:generation', 7)
+    store.consume('k', 1, 1, 0.0)
+
+    store.clear()
+
+    assert store.consume('k', 1, 1, 0.0) == 0.0
+    assert cache.get('phonebook:contacts:generation') == 7
+    store.clear()
+
+
+def test_cache_store_reads_the_version_once_per_refresh(monkeypatch):
+    clock = [100.0]
+    monkeypatch.setattr(CacheBucketStore, 'timer', lambda self: clock[0])
+    store = CacheBucketStore()
+    cache = caches['default']
+    store.clear()
+    version = cache.get(VERSION_KEY)
+    assert store.consume('things_ip:1.2.3.4', 1, 1, 0.0) == 0.0
+    assert cache.get(f'throttle:{version}:things_ip:1.2.3.4') is not None
+
+    # cleared by another process: this one keeps its version until the refresh
+    cache.set(VERSION_KEY, 'other', timeout=None)
+    with mock.patch.object(type(cache), 'get_or_set') as get_or_set:
+        assert store.consume('things_ip:1.2.3.4', 1, 1, 0.0) > 0
+    get_or_set.assert_not_called()
+
+    clock[0] += VERSION_REFRESH
+    assert store.consume('things_ip:1.2.3.4', 1, 1, 0.0) == 0.0
+    store.clear()
+
+
+def test_get_bucket_store_follows_setting(settings):
+    settings.THROTTLE_STORE = 'cache'
+    assert isinstance(get_bucket_store(), CacheBucketStore)
+    settings.THROTTLE_STORE = 'local'
+    assert isinstance(get_bucket_store(), LocalBucketStore)
+
+
+def test_unscoped_or_unconfigured_views_are_not_throttled(rates):
+    rates()
+    request = APIRequestFactory().get('/')
+    throttle = IPTokenBucketThrottle()
+    assert throttle.allow_request(request, object()) is True
+    assert throttle.allow_request(request, ScopedView()) is True
+
+
+def test_ip_throttle_rejects_after_budget(rates):
+    rates(things_ip='2/min')
+    request = APIRequestFactory().get('/')
+    view = ScopedView()
+
+    assert IPTokenBucketThrottle().allow_request(request, view) is True
+    assert IPTokenBucketThrottle().allow_request(request, view) is True
+
+    throttle = IPTokenBucketThrottle()
+    assert throttle.allow_request(request, view) is False
+    assert throttle.wait() == pytest.approx(30, abs=1)
+
+
+def test_user_throttle_keys_per_user(rates):
+    rates(things_user='1/min')
+    User = get_user_model()
+    alice = User.objects.create_user(username='alice', password='pw')
+    bob = User.objects.create_user(username='bob', password='pw')
+    view = ScopedView()
+
+    def request_as(user):
+        request = APIRequestFactory().get('/')
+        request.user = user
+        return request
+
+    assert UserTokenBucketThrottle().allow_request(request_as(alice), view)
+    assert not UserTokenBucketThrottle().allow_request(request_as(alice), view)
+    assert UserTokenBucketThrottle().allow_request(request_as(bob), view)
+    # anonymous requests are not counted against a user budget
+    assert UserTokenBucketThrottle().allow_request(
+        request_as(AnonymousUser()), view)
+
+
+"""
+API TESTS
+"""
+
+
+def test_signup_returns_429_with_retry_after(rates):
+    rates(signup_ip='1/min')
+    client = APIClient()
+    url = reverse('user-signup')
+
+    # the first request spends the token even though it fails validation
+    first = client.post(url, data={}, format='json')
+    assert first.status_code == 400
+
+    second = client.post(url, data={}, format='json')
+    assert second.status_code == 429
+    assert int(second['Retry-After']) == 60
+
+
+@override_settings(THROTTLE_STORE='cache')
+def test_list_throttled_per_user_with_cache_store(rates):
+    rates(contacts_list_user='1/min')
+    reader_group, _ = Group.objects.get_or_create(name='reader')
+    reader = get_user_model().objects.create_user(
+        username='reader_user1', password='readerpass123')
+    reader.groups.add(reader_group)
+
+    client = APIClient()
+    client.force_authenticate(user=reader)
+    url = reverse('contact-list')
+
+    assert client.get(url).status_code == 200
+    response = client.get(url)
+    assert response.status_code == 429
+    assert 'Retry-After' in response
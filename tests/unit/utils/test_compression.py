@@ -0,0 +1,121 @@
+import gzip
+import pytest
+from django.http import HttpResponse
+from django.test import RequestFactory
+
+from phonebook.api.middleware import CompressionMiddleware
+from phonebook.api.utilities.compression import (
+    IDENTITY,
+    compress,
+    get_compression_config,
+    negotiate_encoding,
+    precompressed_response,
+)
+
+
+"""
+UNIT TESTS
+"""
+
+
+@pytest.mark.parametrize('header, expected', [
+    ('', None),
+    ('gzip', 'gzip'),
+    ('gzip, deflate', 'gzip'),
+    ('deflate', None),
+    ('gzip;q=0', None),
+    ('*', 'gzip'),
+    ('*, gzip;q=0', None),
+    ('identity', None),
+])
+def test_negotiate_encoding(header, expected):
+    assert negotiate_encoding(header) == expected
+
+
+def test_compress_gzip_round_trip():
+    data = b'{"name":"Alice"}' * 100
+    assert gzip.decompress(compress(data, 'gzip', 6)) == data
+
+
+def test_compress_rejects_unknown_encoding():
+    with pytest.raises(ValueError):
+        compress(b'data', 'deflate', 6)
+
+
+def test_compression_config_endpoint_override(settings):
+    settings.RESPONSE_COMPRESSION = {
+        'MIN_SIZE': 100,
+        'LEVELS': {'gzip': 5},
+        'ENDPOINTS': {'thing-list': {'MIN_SIZE': 10, 'LEVELS': {'gzip': 1}}},
+    }
+
+    default = get_compression_config()
+    assert default['MIN_SIZE'] == 100
+    assert default['LEVELS']['gzip'] == 5
+    assert default['LEVELS']['br'] == 5
+
+    override = get_compression_config('thing-list')
+    assert override['MIN_SIZE'] == 10
+    assert override['LEVELS']['gzip'] == 1
+    assert override['ENABLED'] is True
+
+
+def test_precompressed_response_adds_and_reuses_variants(settings):
+    settings.RESPONSE_COMPRESSION = {'MIN_SIZE': 10}
+    request = RequestFactory().get('/', HTTP_ACCEPT_ENCODING='gzip')
+    payload = {IDENTITY: b'x' * 100}
+
+    response, added = precompressed_response(
+        request, payload, 'application/json', 'thing-list')
+    assert added is True
+    assert response['Content-Encoding'] == 'gzip'
+    assert gzip.decompress(response.content) == b'x' * 100
+    assert payload['gzip'] == response.content
+
+    response, added = precompressed_response(
+        request, payload, 'application/json', 'thing-list')
+    assert added is False
+    assert response.content == payload['gzip']
+
+
+def test_precompressed_response_below_threshold_is_raw(settings):
+    settings.RESPONSE_COMPRESSION = {'MIN_SIZE': 1000}
+    request = RequestFactory().get('/', HTTP_ACCEPT_ENCODING='gzip')
+    response, added = precompressed_response(
+        request, {IDENTITY: b'small'}, 'application/json', 'thing-list')
+
+    assert added is False
+    assert not response.has_header('Content-Encoding')
+    assert response.content == b'small'
+
+
+def test_middleware_compresses_large_responses(settings):
+    settings.RESPONSE_COMPRESSION = {'MIN_SIZE': 10}
+    body = b'a' * 100
+    middleware = CompressionMiddleware(lambda request: HttpResponse(body))
+
+    response = middleware(RequestFactory().get('/', HTTP_ACCEPT_ENCODING='gzip'))
+    assert response['Content-Encoding'] == 'gzip'
+    assert 'Accept-Encoding' in response['Vary']
+    assert gzip.decompress(response.content) == body
+
+    response = middleware(RequestFactory().get('/'))
+    assert not response.has_header('Content-Encoding')
+    assert response.content == body
+
+
+def test_middleware_skips_small_and_encoded_responses(settings):
+    settings.RESPONSE_COMPRESSION = {'MIN_SIZE': 10}
+    request = RequestFactory().get('/', HTTP_ACCEPT_ENCODING='gzip')
+
+    small = CompressionMiddleware(lambda r: HttpResponse(b'tiny'))(request)
+    assert not small.has_header('Content-Encoding')
+
+    def already_encoded(r):
+        response = HttpResponse(b'b' * 100)
+        response['Content-Encoding'] = 'br'
+        return response
+
+    encoded = CompressionMiddleware(already_encoded)(request)
+    assert encoded['Content-Encoding'] == 'br'
+    assert encoded.content == b'b' * 100
@@ -0,0 +1,20 @@
+import logging
+
+from config.log_handlers import LazyRotatingFileHandler, json_formatter
+
+
+"""
+UNIT TESTS
+"""
+
+
+def test_file_handler_creates_directory_on_first_write(tmp_path):
+    path = tmp_path / 'nested' / 'log.json'
+    handler = LazyRotatingFileHandler(path, maxBytes=1024, backupCount=1)
+    handler.setFormatter(json_formatter())
+    assert not path.parent.exists()
+
+    handler.emit(logging.LogRecord('phonebook', logging.INFO, __file__, 1, 'hello', None, None))
+    handler.close()
+
+    assert '"event": "hello"' in path.read_text()
@@ -0,0 +1,35 @@
+import pytest
+
+from phonebook.api.utilities.ranges import RangeNotSatisfiable, parse_range
+
+
+"""
+UNIT TESTS
+"""
+
+
+@pytest.mark.parametrize('header, expected', [
+    (None, None),
+    ('bytes=0-99', (0, 99)),
+    ('bytes=100-', (100, 999)),
+    ('bytes=900-5000', (900, 999)),
+    ('bytes=-100', (900, 999)),
+    ('bytes=-5000', (0, 999)),
+    # forms served as a full response
+    ('bytes=0-1,5-9', None),
+    ('bytes=50-10', None),
+    ('items=0-10', None),
+    ('bytes=-', None),
+])
+def test_parse_range(header, expected):
+    assert parse_range(header, 1000) == expected
+
+
+@pytest.mark.parametrize('header, size', [
+    ('bytes=1000-', 1000),
+    ('bytes=-0', 1000),
+    ('bytes=-10', 0),
+])
+def test_parse_range_not_satisfiable(header, size):
+    with pytest.raises(RangeNotSatisfiable):
+        parse_range(header, size)
@@ -1,6 +1,6 @@
 import pytest
 
-from phonebook.api.utilities import valid_phone_number, valid_name
+from phonebook.api.utilities import normalize_phone_number, valid_phone_number, valid_name
 
 INVALID_NUMBERS = [
     '123',
@@ -101,3 +101,20 @@ def test_valid_name_invalid_names():
 def test_valid_name_valid_names():
     for name in VALID_NAMES:
         assert valid_name(name)[1] is True
+
+
+def test_normalize_phone_number_na_formats_agree():
+    for num in ['(703)111-2121', '1 (703) 111-2121', '+1 703.111.2121', '703-111-2121']:
+        assert normalize_phone_number(num) == '17031112121'
+
+
+def test_normalize_phone_number_international_prefixes():
+    assert normalize_phone_number('011 1 703 111 1234') == '17031111234'
+    assert normalize_phone_number('011 701 111 1234') == '7011111234'
+    assert normalize_phone_number('+45 12 34 56 78') == '4512345678'
+    assert normalize_phone_number('+32 (21) 212-2324') == '32212122324'
+
+
+def test_normalize_phone_number_short_numbers_keep_digits():
+    assert normalize_phone_number('12345') == '12345'
+    assert normalize_phone_number('123-1234') == '1231234'